@@ -0,0 +1,83 @@
+#! /usr/bin/env python
+"""Reconcile the yearly generation and fuel allocation with the monthly allocation.
+
+Loads the most recently materialized monthly and yearly
+``out_eia923__*_generation_fuel_by_generator_energy_source`` assets, so
+``DAGSTER_HOME`` must point at the dagster instance of a full ETL run. Times the yearly
+allocation and the yearly sums of the monthly allocation with
+:func:`pudl.analysis.allocate_gen_fuel.agg_monthly_allocation_by_year`, and compares
+them by generator with
+:func:`pudl.analysis.allocate_gen_fuel.test_yearly_allocation_vs_monthly_allocation`.
+
+Example:
+    python devtools/benchmarks/allocation_rollup.py --acceptance-threshold 0.2
+"""
+
+import time
+
+import click
+from dagster import AssetKey
+
+from pudl.analysis.allocate_gen_fuel import (
+    agg_monthly_allocation_by_year,
+    allocate_gen_fuel_by_generator_energy_source,
+    select_input_data,
+    test_yearly_allocation_vs_monthly_allocation,
+)
+from pudl.etl import defs
+
+
+@click.command()
+@click.option(
+    "--ratio",
+    type=float,
+    default=0.05,
+    show_default=True,
+    help="Tolerance of the yearly values of each generator.",
+)
+@click.option(
+    "--acceptance-threshold",
+    type=float,
+    default=0.1,
+    show_default=True,
+    help="Fraction of generator-years which can be off by more than the tolerance.",
+)
+def benchmark_allocation_rollup(ratio: float, acceptance_threshold: float):
+    """Report the wall-clock time of each yearly allocation and how far apart they are."""
+    with defs.get_asset_value_loader() as loader:
+        monthly, gf, bf, gen, bga, gens = (
+            loader.load_asset_value(AssetKey(asset))
+            for asset in [
+                "out_eia923__monthly_generation_fuel_by_generator_energy_source",
+                "out_eia923__yearly_generation_fuel_combined",
+                "out_eia923__yearly_boiler_fuel",
+                "out_eia923__yearly_generation",
+                "core_eia860__assn_boiler_generator",
+                "_out_eia__yearly_generators",
+            ]
+        )
+    start = time.perf_counter()
+    gf, bf, gen, bga, gens = select_input_data(
+        gf=gf, bf=bf, gen=gen, bga=bga, gens=gens
+    )
+    yearly = allocate_gen_fuel_by_generator_energy_source(
+        gf=gf, bf=bf, gen=gen, bga=bga, gens=gens, freq="YS"
+    )
+    click.echo(f"Yearly allocation: {time.perf_counter() - start:.1f}s")
+    start = time.perf_counter()
+    agg_monthly_allocation_by_year(monthly, gf=gf)
+    click.echo(
+        f"Yearly sums of the monthly allocation: {time.perf_counter() - start:.1f}s"
+    )
+    gens_test = test_yearly_allocation_vs_monthly_allocation(
+        yearly,
+        monthly,
+        gf=gf,
+        ratio=ratio,
+        acceptance_threshold=acceptance_threshold,
+    )
+    click.echo(f"Reconciled {len(gens_test)} generator-years.")
+
+
+if __name__ == "__main__":
+    benchmark_allocation_rollup()
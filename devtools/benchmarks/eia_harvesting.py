@@ -0,0 +1,123 @@
+#! /usr/bin/env python
+"""Time the harvesting of the EIA entity tables from the full set of EIA data.
+
+Loads the most recently materialized pre-harvesting EIA assets, like
+``devtools/debug-harvesting.ipynb``, so ``DAGSTER_HOME`` must point at the dagster
+instance of a full ETL run. For each entity, compares harvesting the columns without
+special cases all at once with :func:`pudl.transform.eia._harvest_consistent_values`
+and one column at a time with :func:`pudl.transform.eia.occurrence_consistency`, checks
+that both harvest the same values, and times :func:`harvest_entity_tables`.
+
+Example:
+    python devtools/benchmarks/eia_harvesting.py --entity generators
+"""
+
+import time
+
+import click
+import pandas as pd
+from dagster import AssetKey
+
+from pudl.etl import default_assets, defs
+from pudl.helpers import convert_cols_dtypes, get_asset_group_keys
+from pudl.metadata import PUDL_PACKAGE
+from pudl.metadata.resources import ENTITIES
+from pudl.settings import EiaSettings
+from pudl.transform.eia import (
+    EiaEntity,
+    _compile_all_entity_records,
+    _harvest_consistent_values,
+    _manage_strictness,
+    harvest_entity_tables,
+    occurrence_consistency,
+)
+
+SPECIAL_CASE_COLS = ["latitude", "longitude", "generator_operating_date"]
+
+
+def harvest_by_column(
+    compiled_df: pd.DataFrame,
+    id_cols: list[str],
+    keys: list[str],
+    cols: list[str],
+    strictness: dict[str, float],
+) -> pd.DataFrame:
+    """Harvest each column on its own, like harvest_entity_tables used to."""
+    harvested = compiled_df[keys].drop_duplicates().reset_index(drop=True)
+    for col in cols:
+        col_df = occurrence_consistency(
+            id_cols, compiled_df, col, keys, strictness=strictness[col]
+        )
+        consistent = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(subset=keys)
+        if consistent.empty:
+            consistent = pd.DataFrame(columns=col_df.columns)
+        harvested = harvested.merge(consistent[keys + [col]], on=keys, how="left")
+    return harvested
+
+
+@click.command()
+@click.option(
+    "--entity",
+    type=click.Choice([entity.value for entity in EiaEntity]),
+    multiple=True,
+    help="Entities to harvest. All of them by default.",
+)
+def benchmark_eia_harvesting(entity: tuple[str]):
+    """Report the wall-clock time of each way of harvesting the entity tables."""
+    assets = get_asset_group_keys("_core_eia923", default_assets)
+    assets += get_asset_group_keys("_core_eia860", default_assets)
+    with defs.get_asset_value_loader() as loader:
+        clean_dfs = {
+            asset: PUDL_PACKAGE.encode(loader.load_asset_value(AssetKey(asset)))
+            for asset in assets
+        }
+    eia_settings = EiaSettings()
+
+    for ent in [EiaEntity(e) for e in entity] or list(EiaEntity):
+        dfs = {
+            name: convert_cols_dtypes(df, data_source="eia")
+            for name, df in clean_dfs.items()
+        }
+        if ent == EiaEntity.UTILITIES:
+            dfs = {
+                name: df.drop(
+                    columns=["street_address", "city", "state", "zip_code"],
+                    errors="ignore",
+                )
+                if "plant_id_eia" in df.columns
+                else df
+                for name, df in dfs.items()
+            }
+        compiled_df = _compile_all_entity_records(ent, dfs)
+        id_cols = ENTITIES[ent.value]["id_cols"]
+        strictness = {
+            col: _manage_strictness(col, eia_settings.eia860.eia860m)
+            for col in ENTITIES[ent.value]["static_cols"]
+            + ENTITIES[ent.value]["annual_cols"]
+        }
+        for keys, kind in [(id_cols, "static"), (id_cols + ["report_date"], "annual")]:
+            cols = [
+                col
+                for col in ENTITIES[ent.value][f"{kind}_cols"]
+                if col not in SPECIAL_CASE_COLS
+            ]
+            start = time.perf_counter()
+            by_column = harvest_by_column(compiled_df, id_cols, keys, cols, strictness)
+            looped = time.perf_counter() - start
+            start = time.perf_counter()
+            at_once, _ = _harvest_consistent_values(compiled_df, keys, cols, strictness)
+            single_pass = time.perf_counter() - start
+            pd.testing.assert_frame_equal(at_once, by_column)
+            click.echo(
+                f"{ent.value} {kind} ({len(cols)} columns, {len(compiled_df)} "
+                f"records): per column {looped:.1f}s, single pass {single_pass:.1f}s"
+            )
+        start = time.perf_counter()
+        harvest_entity_tables(ent, dict(clean_dfs), eia_settings=eia_settings)
+        click.echo(
+            f"{ent.value} harvest_entity_tables: {time.perf_counter() - start:.1f}s"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_eia_harvesting()
@@ -0,0 +1,89 @@
+#! /usr/bin/env python
+"""Compare Dask and DuckDB for finding the distinct keys of the EPA CEMS dataset.
+
+Each engine runs in a fresh process, so the increase in peak resident set size it
+reports only reflects that engine's work.
+
+Example:
+    python devtools/benchmarks/epacems_query.py --memory-limit 1GB
+"""
+
+import logging
+import multiprocessing
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import click
+import dask.dataframe as dd
+
+from pudl.output.epacems import EpaCemsDataset
+from pudl.workspace.setup import PudlPaths
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+COLUMNS = ["plant_id_eia", "year", "emissions_unit_id_epa"]
+
+
+def _distinct_keys(
+    engine: str, path: Path, memory_limit: str
+) -> tuple[int, float, int]:
+    """Find the distinct keys with one engine.
+
+    Returns:
+        The number of keys, the seconds it took, and how far it raised the peak RSS of
+        the process above the RSS it had after importing PUDL, in bytes.
+    """
+    # ru_maxrss is reported in KiB on Linux.
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if engine == "dask":
+        df = (
+            dd.read_parquet(path, engine="pyarrow", index=False, split_row_groups=True)[
+                COLUMNS
+            ]
+            .drop_duplicates()
+            .compute()
+        )
+    else:
+        df = EpaCemsDataset(path, memory_limit=memory_limit).distinct(COLUMNS)
+    elapsed = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return len(df), elapsed, (rss_after - rss_before) * 1024
+
+
+@click.command()
+@click.option(
+    "--path",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="EPA CEMS parquet file or hive-partitioned directory. Defaults to the "
+    "monolithic output in $PUDL_OUTPUT.",
+)
+@click.option(
+    "--memory-limit",
+    default="4GB",
+    show_default=True,
+    help="Memory DuckDB may use before spilling to disk.",
+)
+def benchmark_epacems_query(path: Path | None, memory_limit: str):
+    """Report the time and peak memory use of finding distinct CEMS unit-years."""
+    if path is None:
+        path = PudlPaths().parquet_path("core_epacems__hourly_emissions")
+    for engine in ["dask", "duckdb"]:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            rows, elapsed, rss_increase = executor.submit(
+                _distinct_keys, engine, path, memory_limit
+            ).result()
+        click.echo(
+            f"{engine}: {rows:,} distinct keys in {elapsed:.2f}s, "
+            f"peak RSS increased by {rss_increase / 2**20:,.0f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_epacems_query()
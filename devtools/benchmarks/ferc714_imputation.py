@@ -0,0 +1,89 @@
+#! /usr/bin/env python
+"""Time the imputation of a synthetic FERC 714 hourly demand matrix.
+
+Compares fitting the autoregressive coefficients of the LATC imputation one series at a
+time and all at once, and imputing the years of the demand matrix serially and in a
+pool of worker processes.
+
+Example:
+    python devtools/benchmarks/ferc714_imputation.py --years 4 --workers 4
+"""
+
+import logging
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from pudl.analysis.state_demand import impute_ferc714_hourly_demand_matrix
+from pudl.analysis.timeseries_cleaning import _fit_autoregression
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def simulate_demand_matrix(
+    years: int, respondents: int, null_fraction: float, seed: int
+) -> pd.DataFrame:
+    """Daily cycles of hourly demand with noise and randomly placed nulls."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(
+        f"{2024 - years}-01-01", "2024-01-01", freq="h", inclusive="left"
+    )
+    hours = np.arange(len(index))[:, np.newaxis]
+    demand = rng.uniform(100, 1000, respondents) * (
+        1
+        + 0.2 * np.sin(2 * np.pi * (hours + rng.integers(0, 24, respondents)) / 24)
+        + 0.02 * rng.standard_normal((len(index), respondents))
+    )
+    demand[rng.random(demand.shape) < null_fraction] = np.nan
+    return pd.DataFrame(demand, index=index)
+
+
+@click.command()
+@click.option("--years", type=int, default=2, help="Years of hourly demand.")
+@click.option("--respondents", type=int, default=200, help="Number of respondents.")
+@click.option("--null-fraction", type=float, default=0.01, help="Fraction of nulls.")
+@click.option("--workers", type=int, default=2, help="Worker processes to compare.")
+@click.option("--seed", type=int, default=0, help="Seed of the simulated data.")
+def benchmark_ferc714_imputation(
+    years: int, respondents: int, null_fraction: float, workers: int, seed: int
+):
+    """Report the wall-clock time of each way of imputing the demand matrix."""
+    df = simulate_demand_matrix(years, respondents, null_fraction, seed)
+
+    # One iteration of the autoregressive fit over a year of data
+    mat_hat = df.iloc[:8760].fillna(df.mean()).to_numpy().T
+    ind = np.arange(8759)[np.newaxis, :]
+    start = time.perf_counter()
+    for m in range(mat_hat.shape[0]):
+        qm = mat_hat[m, ind].T
+        np.linalg.pinv(qm) @ mat_hat[m, 1:]
+    looped = time.perf_counter() - start
+    start = time.perf_counter()
+    _fit_autoregression(mat_hat, mat_hat, ind)
+    batched = time.perf_counter() - start
+    click.echo(
+        f"Autoregressive fit of {mat_hat.shape[0]} series: "
+        f"per series {looped:.3f}s, batched {batched:.3f}s"
+    )
+
+    results = {}
+    for n in sorted({1, workers}):
+        start = time.perf_counter()
+        results[n] = impute_ferc714_hourly_demand_matrix(
+            df, list(range(2024 - years, 2024)), workers=n
+        )
+        click.echo(
+            f"Imputation of {years} years with {n} workers: "
+            f"{time.perf_counter() - start:.1f}s"
+        )
+    click.echo(
+        "Max relative difference between results: "
+        f"{(results[workers] / results[1] - 1).abs().max().max():.2e}"
+    )
+
+
+if __name__ == "__main__":
+    benchmark_ferc714_imputation()
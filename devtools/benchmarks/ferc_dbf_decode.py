@@ -0,0 +1,63 @@
+#! /usr/bin/env python
+"""Compare the record by record and bulk columnar decoding of FERC DBF tables.
+
+The raw FERC archives are read through the PUDL Datastore, so they'll be downloaded
+into ``$PUDL_INPUT`` if they aren't already cached there.
+
+Example:
+    python devtools/benchmarks/ferc_dbf_decode.py ferc1 2020 f1_fuel f1_steam
+"""
+
+import logging
+import time
+
+import click
+import pandas as pd
+
+from pudl.extract.dbf import FercDbfReader, decode_dbf
+from pudl.workspace.datastore import Datastore
+from pudl.workspace.setup import PudlPaths
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.argument("dataset")
+@click.argument("year", type=int)
+@click.argument("table_names", nargs=-1)
+def benchmark_ferc_dbf_decode(dataset: str, year: int, table_names: tuple[str]):
+    """Report rows/second decoded from each DBF table of a FERC dataset and year.
+
+    All tables of the dataset are decoded if no table names are given.
+    """
+    reader = FercDbfReader(
+        Datastore(local_cache_path=PudlPaths().data_dir), dataset=dataset
+    )
+    archive = reader.get_archive(year=year, data_format="dbf")
+    for table_name in table_names or reader.get_table_names():
+        timings = {}
+        for name, decode in [
+            ("records", lambda dbf: pd.DataFrame(iter(dbf))),
+            ("columnar", decode_dbf),
+        ]:
+            try:
+                dbf = archive.get_table_dbf(table_name)
+            except KeyError:
+                break
+            start = time.perf_counter()
+            df = decode(dbf)
+            timings[name] = time.perf_counter() - start
+        if not timings:
+            continue
+        click.echo(
+            f"{table_name}: {len(df):,} rows, "
+            + ", ".join(
+                f"{name} {elapsed:.2f}s ({len(df) / elapsed:,.0f} rows/s)"
+                for name, elapsed in timings.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    benchmark_ferc_dbf_decode()
@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+"""Compare SQLite write throughput of the to_sql and bulk load IO manager paths.
+
+The data for each table is read from the PUDL parquet outputs in ``$PUDL_OUTPUT``, so
+you'll need to have run the ETL with parquet outputs enabled first.
+
+Example:
+    python devtools/benchmarks/sqlite_bulk_load.py \
+        core_eia923__monthly_generation_fuel out_eia923__generation_fuel_by_generator
+"""
+
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import click
+import pandas as pd
+import sqlalchemy as sa
+from dagster import AssetKey, build_output_context
+
+from pudl.io_managers import PudlSQLiteIOManager
+from pudl.metadata import PUDL_PACKAGE
+from pudl.workspace.setup import PudlPaths
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def time_write(table_name: str, df: pd.DataFrame, bulk_load: bool) -> float:
+    """Write a table into a fresh PUDL database and return the elapsed seconds."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = sa.create_engine(f"sqlite:///{Path(tmp_dir) / 'pudl.sqlite'}")
+        PUDL_PACKAGE.to_sql().create_all(engine)
+        engine.dispose()
+        manager = PudlSQLiteIOManager(
+            base_dir=tmp_dir, db_name="pudl", bulk_load=bulk_load
+        )
+        context = build_output_context(asset_key=AssetKey(table_name))
+        start = time.perf_counter()
+        manager.handle_output(context, df)
+        elapsed = time.perf_counter() - start
+        manager.engine.dispose()
+    return elapsed
+
+
+@click.command()
+@click.argument("table_names", nargs=-1, required=True)
+def benchmark_sqlite_bulk_load(table_names: tuple[str]):
+    """Report rows/second written to SQLite by each IO manager write path."""
+    for table_name in table_names:
+        df = pd.read_parquet(PudlPaths().parquet_path(table_name))
+        for bulk_load in [False, True]:
+            elapsed = time_write(table_name, df, bulk_load=bulk_load)
+            click.echo(
+                f"{table_name} {'bulk_load' if bulk_load else 'to_sql':>9}: "
+                f"{len(df):,} rows in {elapsed:.1f}s ({len(df) / elapsed:,.0f} rows/s)"
+            )
+
+
+if __name__ == "__main__":
+    benchmark_sqlite_bulk_load()
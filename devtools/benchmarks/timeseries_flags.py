@@ -0,0 +1,78 @@
+#! /usr/bin/env python
+"""Time the rolling statistics used to flag anomalies in hourly demand timeseries.
+
+Compares the rolling medians and interquartile ranges of a synthetic hourly demand
+matrix computed with :mod:`pudl.analysis.rolling_stats` and with pandas, and times
+:meth:`pudl.analysis.timeseries_cleaning.Timeseries.flag_ruggles` on the same matrix.
+
+Example:
+    python devtools/benchmarks/timeseries_flags.py --years 2 --series 200
+"""
+
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from pudl.analysis import rolling_stats
+from pudl.analysis.timeseries_cleaning import Timeseries
+
+
+def simulate_demand(years: int, series: int, seed: int) -> np.ndarray:
+    """Daily cycles of hourly demand with noise, scaled outliers and nulls."""
+    rng = np.random.default_rng(seed)
+    hours = np.arange(8760 * years)[:, np.newaxis]
+    x = rng.uniform(500, 5000, series) * (
+        1
+        + 0.2 * np.sin(2 * np.pi * (hours + rng.integers(0, 24, series)) / 24)
+        + 0.05 * rng.standard_normal((len(hours), series))
+    )
+    outliers = rng.choice(x.size, x.size // 1000, replace=False)
+    x.flat[outliers] *= rng.uniform(0.1, 3, len(outliers))
+    x[rng.random(x.shape) < 0.01] = np.nan
+    return x
+
+
+def elapsed(func) -> float:
+    """Wall-clock seconds taken by func."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--years", type=int, default=1, help="Years of hourly values.")
+@click.option("--series", type=int, default=200, help="Number of series.")
+@click.option("--seed", type=int, default=0, help="Seed of the simulated data.")
+def benchmark_timeseries_flags(years: int, series: int, seed: int):
+    """Report the wall-clock time of the rolling statistics and of flag_ruggles."""
+    x = simulate_demand(years, series, seed)
+    # Compile the kernels before timing them
+    Timeseries(x[:500, :2]).flag_ruggles()
+
+    for window in [48, 480]:
+        rolling = pd.DataFrame(x).rolling(window, min_periods=1, center=True)
+        kernel = elapsed(lambda window=window: rolling_stats.rolling_median(x, window))
+        click.echo(
+            f"Rolling median ({window}): "
+            f"kernel {kernel:.2f}s, "
+            f"pandas {elapsed(rolling.median):.2f}s"
+        )
+    rolling = pd.DataFrame(x).rolling(240, min_periods=1, center=True)
+    click.echo(
+        "Rolling IQR (240): "
+        f"kernel {elapsed(lambda: rolling_stats.rolling_iqr(x, 240)):.2f}s, "
+        "pandas "
+        f"{elapsed(lambda: rolling.quantile(0.75) - rolling.quantile(0.25)):.2f}s"
+    )
+    click.echo(
+        "Shifted median (21 days): "
+        f"{elapsed(lambda: rolling_stats.shifted_median(x, range(-240, 241, 24))):.2f}s"
+    )
+    ts = Timeseries(x)
+    click.echo(f"flag_ruggles: {elapsed(ts.flag_ruggles):.2f}s")
+
+
+if __name__ == "__main__":
+    benchmark_timeseries_flags()
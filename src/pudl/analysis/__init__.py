@@ -13,6 +13,7 @@ from . import (
     mcoe,
     plant_parts_eia,
     record_linkage,
+    rolling_stats,
     service_territory,
     spatial,
     state_demand,
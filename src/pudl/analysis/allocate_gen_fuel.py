@@ -134,12 +134,22 @@ net generation (if it's reported) or capacity (if generation is not reported).
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Literal
 
 # Useful high-level external modules.
 import numpy as np
 import pandas as pd
-from dagster import AssetIn, AssetsDefinition, Field, asset
+from dagster import (
+    AssetCheckResult,
+    AssetChecksDefinition,
+    AssetIn,
+    AssetsDefinition,
+    Field,
+    asset,
+    asset_check,
+)
 
 import pudl
 from pudl.metadata.fields import apply_pudl_dtypes
@@ -205,11 +215,24 @@ MISSING_SENTINEL = 0.00001
 def allocate_gen_fuel_asset_factory(
     freq: Literal["YS", "MS"],
     io_manager_key: str | None = None,
+    yearly_from_monthly: bool = False,
 ) -> list[AssetsDefinition]:
-    """Build yearly and monthly net generation & fuel consumption allocation assets."""
+    """Build yearly and monthly net generation & fuel consumption allocation assets.
+
+    Args:
+        freq: Frequency of the allocation.
+        io_manager_key: IO manager of the assets.
+        yearly_from_monthly: If True, the yearly allocation is the sum of the monthly
+            allocation over each year (see :func:`agg_monthly_allocation_by_year`),
+            rather than an allocation of the yearly data. Only valid for ``YS``.
+    """
     agg_freqs = {"YS": "yearly", "MS": "monthly"}
     if freq not in agg_freqs:
         raise ValueError(f"freq must be one of {agg_freqs.keys()}, got: {freq}.")
+    if yearly_from_monthly and freq != "YS":
+        raise ValueError(
+            f"Only the yearly allocation can be built from the monthly one, got: {freq}."
+        )
 
     @asset(
         name=f"out_eia923__{agg_freqs[freq]}_generation_fuel_by_generator_energy_source",
@@ -235,6 +258,23 @@ def allocate_gen_fuel_asset_factory(
                     "works when using the default filesystem io_manager."
                 ),
             ),
+            "plant_shards": Field(
+                int,
+                default_value=1,
+                description=(
+                    "Number of shards of plants to allocate separately, by "
+                    "plant_id_eia. The allocation is the same whatever the number "
+                    "of shards."
+                ),
+            ),
+            "workers": Field(
+                int,
+                default_value=1,
+                description=(
+                    "Number of processes allocating the shards of plants at once. "
+                    "If 0, one per CPU."
+                ),
+            ),
         },
     )
     def gen_fuel_by_gen_esc(
@@ -257,6 +297,27 @@ def allocate_gen_fuel_asset_factory(
             gens=gens,
             freq=freq,
             debug=context.op_config["debug"],
+            plant_shards=context.op_config["plant_shards"],
+            workers=context.op_config["workers"] or None,
+        )
+
+    @asset(
+        name="out_eia923__yearly_generation_fuel_by_generator_energy_source",
+        ins={
+            "net_gen_fuel_alloc": AssetIn(
+                key="out_eia923__monthly_generation_fuel_by_generator_energy_source"
+            ),
+            "gf": AssetIn(key="out_eia923__yearly_generation_fuel_combined"),
+        },
+        io_manager_key=io_manager_key,
+        compute_kind="Python",
+    )
+    def gen_fuel_by_gen_esc_from_monthly(
+        net_gen_fuel_alloc: pd.DataFrame, gf: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Aggregate the monthly gen/energy_source_code allocation by year."""
+        return agg_monthly_allocation_by_year(
+            net_gen_fuel_alloc=net_gen_fuel_alloc, gf=gf
         )
 
     @asset(
@@ -307,7 +368,12 @@ def allocate_gen_fuel_asset_factory(
             own_eia860=own_eia860,
         )
 
-    assets = [gen_fuel_by_gen_esc, gen_fuel_by_gen]
+    assets = [
+        gen_fuel_by_gen_esc_from_monthly
+        if yearly_from_monthly
+        else gen_fuel_by_gen_esc,
+        gen_fuel_by_gen,
+    ]
     if freq == "YS":
         # The monthly version is yuuuuge and we only use the annual data for now.
         assets += [gen_fuel_by_gen_esc_owner]
@@ -325,6 +391,46 @@ allocate_gen_fuel_assets = [
 ]
 
 
+def make_yearly_allocation_vs_monthly_allocation_check() -> AssetChecksDefinition:
+    """Build an asset check reconciling the yearly and monthly allocations.
+
+    The check compares the yearly allocation with the yearly sums of the monthly
+    allocation by generator, with :func:`test_yearly_allocation_vs_monthly_allocation`,
+    to see whether the yearly asset could be built with ``yearly_from_monthly`` in
+    :func:`allocate_gen_fuel_asset_factory` instead of allocating the yearly data. It
+    loads the whole monthly allocation, so
+    it isn't one of the default asset checks. Add it to the asset checks of a
+    :class:`dagster.Definitions` to run it.
+    """
+
+    @asset_check(
+        asset="out_eia923__yearly_generation_fuel_by_generator_energy_source",
+        additional_ins={
+            "monthly": AssetIn(
+                key="out_eia923__monthly_generation_fuel_by_generator_energy_source"
+            ),
+            "gf": AssetIn(key="out_eia923__yearly_generation_fuel_combined"),
+        },
+    )
+    def yearly_allocation_vs_monthly_allocation(
+        out_eia923__yearly_generation_fuel_by_generator_energy_source: pd.DataFrame,
+        monthly: pd.DataFrame,
+        gf: pd.DataFrame,
+    ) -> AssetCheckResult:
+        """Check that the yearly sums of the monthly allocation agree with it."""
+        try:
+            test_yearly_allocation_vs_monthly_allocation(
+                out_eia923__yearly_generation_fuel_by_generator_energy_source,
+                monthly,
+                gf=gf,
+            )
+        except AssertionError as err:
+            return AssetCheckResult(passed=False, metadata={"error": str(err)})
+        return AssetCheckResult(passed=True)
+
+    return yearly_allocation_vs_monthly_allocation
+
+
 def allocate_gen_fuel_by_generator_energy_source(
     gf: pd.DataFrame,
     bf: pd.DataFrame,
@@ -333,6 +439,8 @@ def allocate_gen_fuel_by_generator_energy_source(
     gens: pd.DataFrame,
     freq: Literal["YS", "MS"],
     debug: bool = False,
+    plant_shards: int = 1,
+    workers: int | None = 1,
 ) -> pd.DataFrame:
     """Allocate net gen from gen_fuel table to the generator/energy_source_code level.
 
@@ -351,6 +459,11 @@ def allocate_gen_fuel_by_generator_energy_source(
     generator, prime_mover, and fuel and is used to allocate the associated
     net generation from the :ref:`core_eia923__monthly_generation_fuel` table.
 
+    The association and allocation happen within plants, so the plants can be split
+    into shards by ``plant_id_eia`` that are allocated in parallel, with the same
+    result. Allocating a whole year at a time isn't possible, because whether
+    generators are active depends on the other years of their plant.
+
     Args:
         gf: Temporally aggregated :ref:`out_eia923__generation_fuel_combined` dataframe.
         bf: Temporally aggregated :ref:`core_eia923__monthly_boiler_fuel` dataframe.
@@ -359,42 +472,42 @@ def allocate_gen_fuel_by_generator_energy_source(
         gens: :ref:`core_eia860__scd_generators` dataframe.
         freq: Frequency at which the tables are aggregated temporally.
         debug: If True, return additional debugging information.
+        plant_shards: Number of shards of plants to allocate separately.
+        workers: Number of processes allocating the shards of plants at once. If
+            None, one per CPU.
     """
     bf, gens_at_freq, gen = standardize_input_frequency(bf, gens, gen, freq)
     # Add any startup energy source codes to the list of energy source codes
     gens_at_freq = adjust_msw_energy_source_codes(gens_at_freq, gf, bf)
     gens_at_freq = add_missing_energy_source_codes_to_gens(gens_at_freq, gf, bf)
-    # do the association! --> this step is where a small no. of plants are dropped for
-    # an unknown reason. Investigate in issue #2978.
-    gen_assoc = associate_generator_tables(
-        gens=gens_at_freq, gf=gf, gen=gen, bf=bf, bga=bga
-    )
-    # Generate a fraction to use to allocate net generation and fuel consumption by.
-    # These two methods create a column called `frac`, which will be a fraction
-    # to allocate net generation from the gf table for each `IDX_PM_ESC` group
-    gen_pm_fuel = prep_alloction_fraction(gen_assoc)
-    # Net gen allocation
-    net_gen_alloc = allocate_gen_fuel_by_gen_esc(gen_pm_fuel).pipe(
-        _test_gen_pm_fuel_output, gf=gf, gen=gen
+    # Plants that retired before the earliest date of all of the data are identified
+    # the same way whichever shard of plants they are allocated with.
+    start_date = min(
+        gens_at_freq.report_date.min(), gen.report_date.min(), gf.report_date.min()
+    )
+    allocate_plants = partial(_allocate_plants, start_date=start_date)
+    if plant_shards > 1:
+        inputs = (gens_at_freq, gf, gen, bf, bga)
+        plant_ids = np.sort(
+            pd.concat([df.plant_id_eia for df in inputs]).dropna().unique()
+        )
+        # Only the plants that are present are split, so no shard is empty
+        shards = [
+            [df[df.plant_id_eia.isin(shard_plant_ids)] for df in inputs]
+            for shard_plant_ids in np.array_split(plant_ids, plant_shards)
+            if len(shard_plant_ids) > 0
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            net_gen_fuel_alloc = pd.concat(
+                executor.map(allocate_plants, *zip(*shards, strict=True)),
+                ignore_index=True,
+            )
+    else:
+        net_gen_fuel_alloc = allocate_plants(gens_at_freq, gf, gen, bf, bga)
+    # Sort on the full primary key so that the order doesn't depend on the shards
+    net_gen_fuel_alloc = net_gen_fuel_alloc.sort_values(
+        IDX_GENS_PM_ESC + ["energy_source_code_num"]
     )
-    test_gen_fuel_allocation(gen, net_gen_alloc)
-
-    # fuel allocation
-    fuel_alloc = allocate_fuel_by_gen_esc(gen_pm_fuel)
-
-    # ensure that the allocated data has unique merge keys
-    net_gen_alloc_agg = group_duplicate_keys(net_gen_alloc)
-    fuel_alloc_agg = group_duplicate_keys(fuel_alloc)
-
-    # squish net gen and fuel allocation together
-    net_gen_fuel_alloc = pd.merge(
-        net_gen_alloc_agg,
-        fuel_alloc_agg,
-        on=IDX_GENS_PM_ESC + ["energy_source_code_num"],
-        how="outer",
-        validate="1:1",
-        suffixes=("_net_gen_alloc", "_fuel_alloc"),
-    ).sort_values(IDX_GENS_PM_ESC)
     # When 2020 and 2022 data are used in the fast ETL (2020 data is necessary for
     # having ample FERC-EIA training data and 2022 as the new year of data) the ci
     # tests fail on exit code 143 for memory reasons while all tests pass locally.
@@ -427,6 +540,66 @@ def allocate_gen_fuel_by_generator_energy_source(
     return net_gen_fuel_alloc
 
 
+def _allocate_plants(
+    gens_at_freq: pd.DataFrame,
+    gf: pd.DataFrame,
+    gen: pd.DataFrame,
+    bf: pd.DataFrame,
+    bga: pd.DataFrame,
+    start_date: pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """Associate and allocate net generation and fuel for a set of plants.
+
+    All of the association and allocation happens within plants, so any subset of
+    plants can be allocated on its own, given all of their records in every input.
+
+    Args:
+        gens_at_freq: generators expanded to the frequency of the other tables, with
+            all of their energy source codes.
+        gf: generation fuel table.
+        gen: generation table.
+        bf: boiler fuel table.
+        bga: boiler generator association table.
+        start_date: earliest report date of all of the plants. See
+            :func:`identify_retired_plants`.
+
+    Returns:
+        allocated net generation and fuel consumption with unique
+        :py:const:`IDX_GENS_PM_ESC` and ``energy_source_code_num``.
+    """
+    # do the association! --> this step is where a small no. of plants are dropped for
+    # an unknown reason. Investigate in issue #2978.
+    gen_assoc = associate_generator_tables(
+        gens=gens_at_freq, gf=gf, gen=gen, bf=bf, bga=bga, start_date=start_date
+    )
+    # Generate a fraction to use to allocate net generation and fuel consumption by.
+    # These two methods create a column called `frac`, which will be a fraction
+    # to allocate net generation from the gf table for each `IDX_PM_ESC` group
+    gen_pm_fuel = prep_alloction_fraction(gen_assoc)
+    # Net gen allocation
+    net_gen_alloc = allocate_gen_fuel_by_gen_esc(gen_pm_fuel).pipe(
+        _test_gen_pm_fuel_output, gf=gf, gen=gen
+    )
+    test_gen_fuel_allocation(gen, net_gen_alloc)
+
+    # fuel allocation
+    fuel_alloc = allocate_fuel_by_gen_esc(gen_pm_fuel)
+
+    # ensure that the allocated data has unique merge keys
+    net_gen_alloc_agg = group_duplicate_keys(net_gen_alloc)
+    fuel_alloc_agg = group_duplicate_keys(fuel_alloc)
+
+    # squish net gen and fuel allocation together
+    return pd.merge(
+        net_gen_alloc_agg,
+        fuel_alloc_agg,
+        on=IDX_GENS_PM_ESC + ["energy_source_code_num"],
+        how="outer",
+        validate="1:1",
+        suffixes=("_net_gen_alloc", "_fuel_alloc"),
+    )
+
+
 def select_input_data(
     gf: pd.DataFrame,
     bf: pd.DataFrame,
@@ -608,6 +781,51 @@ def agg_by_generator(
     return gen
 
 
+def agg_monthly_allocation_by_year(
+    net_gen_fuel_alloc: pd.DataFrame, gf: pd.DataFrame
+) -> pd.DataFrame:
+    """Aggregate the monthly allocated net generation and fuel consumption by year.
+
+    All of the allocated data columns are additive, so the yearly value of each
+    generator, prime mover and energy source is the sum of its monthly values, and
+    yearly ratios like heat rates are weighted by the monthly values. Only the years
+    in the yearly generation fuel table are kept, which excludes the years of data
+    that are only reported year to date.
+
+    The allocation fractions of each month come from that month's data, so the sums
+    differ somewhat from allocating the yearly data. See
+    :func:`test_yearly_allocation_vs_monthly_allocation`.
+
+    Args:
+        net_gen_fuel_alloc: monthly result of
+            :func:`allocate_gen_fuel_by_generator_energy_source`.
+        gf: :ref:`out_eia923__yearly_generation_fuel_combined` table.
+
+    Returns:
+        yearly net generation and fuel consumption, like the yearly result of
+        :func:`allocate_gen_fuel_by_generator_energy_source`.
+    """
+    net_gen_fuel_alloc = net_gen_fuel_alloc.assign(
+        report_date=lambda x: x.report_date.dt.to_period("Y").dt.start_time
+    )
+    net_gen_fuel_alloc = net_gen_fuel_alloc[
+        net_gen_fuel_alloc.report_date.isin(gf.report_date.unique())
+    ]
+    by_year = net_gen_fuel_alloc.groupby(by=IDX_GENS_PM_ESC, observed=True)
+    return (
+        by_year[DATA_COLUMNS]
+        .sum(min_count=1)
+        # Energy source codes that are missing from the generators table are given the
+        # next number in each month.
+        .join(by_year[["energy_source_code_num"]].first())
+        .reset_index()
+        .loc[:, IDX_GENS_PM_ESC + ["energy_source_code_num"] + DATA_COLUMNS]
+        .sort_values(IDX_GENS_PM_ESC + ["energy_source_code_num"])
+        .reset_index(drop=True)
+        .pipe(apply_pudl_dtypes, group="eia")
+    )
+
+
 def stack_generators(
     gens: pd.DataFrame,
     cat_col: str = "energy_source_code_num",
@@ -663,6 +881,7 @@ def associate_generator_tables(
     gen: pd.DataFrame,
     bf: pd.DataFrame,
     bga: pd.DataFrame,
+    start_date: pd.Timestamp | None = None,
 ) -> pd.DataFrame:
     """Associate the three tables needed to assign net gen and fuel to generators.
 
@@ -707,6 +926,8 @@ def associate_generator_tables(
         bf: :ref:`core_eia923__monthly_boiler_fuel` table with columns: :py:const:`IDX_B_PM_ESC` and
             fuel consumption columns.
         bga: :ref:`core_eia860__assn_boiler_generator` table.
+        start_date: earliest report date of the data, if the tables only contain a
+            subset of the plants. See :func:`identify_retired_plants`.
 
     Returns:
         table of generators with stacked energy sources and broadcasted net generation
@@ -741,7 +962,7 @@ def associate_generator_tables(
             how="outer",
         )
         .merge(gf, on=IDX_PM_ESC, how="outer", validate="m:1", indicator=True)
-        .pipe(remove_inactive_generators)
+        .pipe(remove_inactive_generators, start_date=start_date)
         .pipe(
             _allocate_unassociated_pm_records,
             idx_cols=IDX_PM_ESC,
@@ -784,7 +1005,9 @@ def associate_generator_tables(
     return gen_assoc
 
 
-def remove_inactive_generators(gen_assoc: pd.DataFrame) -> pd.DataFrame:
+def remove_inactive_generators(
+    gen_assoc: pd.DataFrame, start_date: pd.Timestamp | None = None
+) -> pd.DataFrame:
     """Remove the retired generators.
 
     We don't want to associate and later allocate net generation or fuel to generators
@@ -819,12 +1042,14 @@ def remove_inactive_generators(gen_assoc: pd.DataFrame) -> pd.DataFrame:
         gen_assoc: table of generators with stacked energy sources and broadcasted net
             generation data from the core_eia923__monthly_generation and core_eia923__monthly_generation_fuel
             tables. Output of :func:`associate_generator_tables`.
+        start_date: earliest report date of the data. Defaults to the earliest report
+            date in ``gen_assoc``.
     """
     existing = gen_assoc.loc[(gen_assoc.operational_status == "existing")]
 
     retiring_generators = identify_retiring_generators(gen_assoc)
 
-    retired_plants = identify_retired_plants(gen_assoc)
+    retired_plants = identify_retired_plants(gen_assoc, start_date=start_date)
 
     proposed_generators = identify_generators_coming_online(gen_assoc)
 
@@ -877,8 +1102,17 @@ def identify_retiring_generators(gen_assoc: pd.DataFrame) -> pd.DataFrame:
     return retiring_generators
 
 
-def identify_retired_plants(gen_assoc: pd.DataFrame) -> pd.DataFrame:
-    """Identify entire plants that have previously retired but are reporting data."""
+def identify_retired_plants(
+    gen_assoc: pd.DataFrame, start_date: pd.Timestamp | None = None
+) -> pd.DataFrame:
+    """Identify entire plants that have previously retired but are reporting data.
+
+    Plants are only considered entirely retired if all of their generators retired
+    before ``start_date``, which defaults to the earliest report date in
+    ``gen_assoc``.
+    """
+    if start_date is None:
+        start_date = min(gen_assoc.report_date)
     # get a subset of the data that represents all plants that have completely retired before the start date
     # Get a list of all of the plants with at least one retired generator and reports non-zero generation data
     # after the generator retirement date
@@ -916,7 +1150,7 @@ def identify_retired_plants(gen_assoc: pd.DataFrame) -> pd.DataFrame:
     plants_retiring_after_start_date = list(
         plants_with_only_retired_generators.loc[
             plants_with_only_retired_generators["generator_retirement_date"]
-            >= min(gen_assoc.report_date),
+            >= start_date,
             "plant_id_eia",
         ].unique()
     )
@@ -1964,8 +2198,9 @@ def _test_gen_pm_fuel_output(
         (~np.isclose(gen_pm_fuel_test.net_generation_mwh_diff, 0))
         & (gen_pm_fuel_test.net_generation_mwh_diff.notnull())
     ]
+    bad_diff_ratio = len(bad_diff) / len(gen_pm_fuel) if len(gen_pm_fuel) else 0.0
     logger.info(
-        f"{len(bad_diff)/len(gen_pm_fuel):.03%} of records have are partially "
+        f"{bad_diff_ratio:.03%} of records have are partially "
         "off from their 'IDX_PM_ESC' group"
     )
     no_cap_gen = gen_pm_fuel_test[
@@ -2016,7 +2251,7 @@ def test_gen_fuel_allocation(
         (~gens_test.net_generation_new_v_og.between((1 - ratio), (1 + ratio)))
         & (gens_test.net_generation_new_v_og.notnull())
     ]
-    os_ratio = len(os_ratios) / len(gens_test)
+    os_ratio = len(os_ratios) / len(gens_test) if len(gens_test) else 0.0
     logger.info(
         f"{os_ratio:.2%} of generator records are more that {ratio:.0%} off from the net generation table"
     )
@@ -2098,3 +2333,63 @@ def test_original_gf_vs_the_allocated_by_gens_gf(
                 f"  Max difference: {max_diff}"
             )
     return gf_test
+
+
+def test_yearly_allocation_vs_monthly_allocation(
+    yearly: pd.DataFrame,
+    monthly: pd.DataFrame,
+    gf: pd.DataFrame,
+    data_columns: list[str] = DATA_COLUMNS,
+    ratio: float = 0.05,
+    acceptance_threshold: float = 0.1,
+) -> pd.DataFrame:
+    """Do the yearly allocation and the yearly sums of the monthly allocation agree?
+
+    Compares the yearly values of each generator, which reconciles the yearly assets
+    built with and without ``yearly_from_monthly`` in
+    :func:`allocate_gen_fuel_asset_factory`, and is run by the asset check from
+    :func:`make_yearly_allocation_vs_monthly_allocation_check`.
+
+    Args:
+        yearly: yearly result of :func:`allocate_gen_fuel_by_generator_energy_source`.
+        monthly: monthly result of :func:`allocate_gen_fuel_by_generator_energy_source`.
+        gf: :ref:`out_eia923__yearly_generation_fuel_combined` table.
+        data_columns: the allocated data columns to compare.
+        ratio: the tolerance of each generator-year.
+        acceptance_threshold: the fraction of generator-years which can be off by more
+            than ``ratio``.
+
+    Raises:
+        AssertionError: If more than ``acceptance_threshold`` of the generator-years
+            are off by more than ``ratio``.
+    """
+    gens_test = pd.merge(
+        agg_by_generator(yearly, sum_cols=data_columns),
+        agg_by_generator(
+            agg_monthly_allocation_by_year(monthly, gf=gf), sum_cols=data_columns
+        ),
+        on=IDX_GENS,
+        suffixes=("_yearly", "_monthly"),
+        how="outer",
+    )
+    for data_col in data_columns:
+        col_ratio = gens_test[f"{data_col}_monthly"] / gens_test[f"{data_col}_yearly"]
+        off_by_ratio = (~col_ratio.between(1 - ratio, 1 + ratio)) & col_ratio.notnull()
+        off_fraction = off_by_ratio.sum() / col_ratio.notnull().sum()
+        total_ratio = (
+            gens_test[f"{data_col}_monthly"].sum()
+            / gens_test[f"{data_col}_yearly"].sum()
+        )
+        logger.info(
+            f"{data_col}: {off_fraction:.1%} of generator-years from the monthly "
+            f"allocation are off by more than {ratio:.0%} from the yearly allocation. "
+            f"The total is x{total_ratio:.4f} the yearly allocation."
+        )
+        if off_fraction > acceptance_threshold:
+            raise AssertionError(
+                f"{off_by_ratio.sum()} generator-years ({off_fraction:.1%}) of "
+                f"{data_col} from the monthly allocation are off from the yearly "
+                f"allocation by more than {ratio:.0%}. Expected < "
+                f"{acceptance_threshold:.1%}."
+            )
+    return gens_test
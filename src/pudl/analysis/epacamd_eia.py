@@ -15,19 +15,25 @@ crosswalk_with_subplant_ids = pudl.etl.make_subplant_ids(filtered_crosswalk)
 import dask.dataframe as dd
 import pandas as pd
 
+from pudl.output.epacems import EpaCemsDataset
 
-def _get_unique_keys(epacems: pd.DataFrame | dd.DataFrame) -> pd.DataFrame:
+
+def _get_unique_keys(
+    epacems: pd.DataFrame | dd.DataFrame | EpaCemsDataset,
+) -> pd.DataFrame:
     """Get unique unit IDs from CEMS data.
 
     Args:
-        epacems (Union[pd.DataFrame, dd.DataFrame]): epacems dataset from
-            pudl.output.epacems.epacems
+        epacems (Union[pd.DataFrame, dd.DataFrame, EpaCemsDataset]): epacems dataset
+            from pudl.output.epacems.epacems, or a query layer over it.
 
     Returns:
         pd.DataFrame: unique keys from the epacems dataset
     """
     # The purpose of this function is mostly to resolve the
     # ambiguity between dask and pandas dataframes
+    if isinstance(epacems, EpaCemsDataset):
+        return epacems.distinct(["plant_id_eia", "emissions_unit_id_epa"])
     ids = epacems[["plant_id_eia", "emissions_unit_id_epa"]].drop_duplicates()
     if isinstance(epacems, dd.DataFrame):
         ids = ids.compute()
@@ -35,7 +41,7 @@ def _get_unique_keys(epacems: pd.DataFrame | dd.DataFrame) -> pd.DataFrame:
 
 
 def filter_crosswalk_by_epacems(
-    crosswalk: pd.DataFrame, epacems: pd.DataFrame | dd.DataFrame
+    crosswalk: pd.DataFrame, epacems: pd.DataFrame | dd.DataFrame | EpaCemsDataset
 ) -> pd.DataFrame:
     """Inner join unique CEMS units with the core_epa__assn_eia_epacamd crosswalk.
 
@@ -77,7 +83,7 @@ def filter_out_boiler_rows(crosswalk: pd.DataFrame) -> pd.DataFrame:
 
 
 def filter_crosswalk(
-    crosswalk: pd.DataFrame, epacems: pd.DataFrame | dd.DataFrame
+    crosswalk: pd.DataFrame, epacems: pd.DataFrame | dd.DataFrame | EpaCemsDataset
 ) -> pd.DataFrame:
     """Remove unmapped crosswalk rows or duplicates due to m2m boiler relationships.
 
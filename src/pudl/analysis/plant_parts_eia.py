@@ -1056,6 +1056,35 @@ class PlantPart:
         return part_df
 
 
+def _combo_ids(groups: pd.Series, members: pd.Series) -> np.ndarray:
+    """Identify the combination of members of the group of each row.
+
+    Each combination is identified by two 64-bit sums of hashes of its members, which
+    don't depend on the order of the members, rather than by a string of all of its
+    sorted members.
+
+    Args:
+        groups: group of each row.
+        members: member of the group in each row.
+
+    Returns:
+        integer ID of the combination of members of the group of each row. Rows of
+        groups with the same members, counted with multiplicity, have the same ID.
+    """
+    codes, _ = pd.factorize(groups)
+    order = np.argsort(codes, kind="stable")
+    starts = np.flatnonzero(np.diff(codes[order], prepend=-1))
+    # Sums of unsigned integers wrap around, so they are the same in any order
+    sums = [
+        np.add.reduceat(
+            pd.util.hash_array(members.to_numpy(), hash_key=key)[order], starts
+        )
+        for key in ["0123456789123456", "true_granularity"]
+    ]
+    _, combos = np.unique(np.column_stack(sums), axis=0, return_inverse=True)
+    return combos.reshape(-1)[codes]
+
+
 class TrueGranLabeler:
     """Label the plant-part table records with their true granularity.
 
@@ -1087,15 +1116,9 @@ class TrueGranLabeler:
         )[["record_id_eia", "record_id_eia_plant_gen", "plant_part"]].rename(
             columns={"record_id_eia_plant_gen": "gen_id"},
         )
-        # concatenate the gen id's to get the combo of gens for each record
-        combos = (
-            parts_to_gens.sort_values(["gen_id"])
-            .groupby(["record_id_eia"])["gen_id"]
-            .apply(lambda x: ",".join(x))
-            .rename("gens_combo")
-        )
-        parts_to_gens = parts_to_gens.merge(
-            combos, how="left", left_on="record_id_eia", right_index=True
+        # identify the combo of gens for each record
+        parts_to_gens["gens_combo"] = _combo_ids(
+            parts_to_gens["record_id_eia"], parts_to_gens["gen_id"]
         )
 
         # categorical columns allow sorting by PLANT_PARTS key order
@@ -1391,45 +1414,49 @@ def add_record_id(part_df, id_cols, plant_part_col="plant_part", year=True):
     """
     ids = deepcopy(id_cols)
     # we want the plant id first... mostly just bc it'll be easier to read
-    part_df = part_df.assign(record_id_eia_temp=lambda x: x.plant_id_eia.astype(str))
     ids.remove("plant_id_eia")
-    for col in ids:
-        part_df = part_df.assign(
-            record_id_eia_temp=lambda x, col=col: x.record_id_eia_temp
-            + "_"
-            + x[col].astype(str)
-        )
+    parts = [part_df.plant_id_eia] + [part_df[col] for col in ids]
     if year:
-        part_df = part_df.assign(
-            record_id_eia_temp=lambda x: x.record_id_eia_temp
-            + "_"
-            + x.report_date.dt.year.astype(str)
-        )
-    part_df = part_df.assign(
-        record_id_eia_temp=lambda x: x.record_id_eia_temp
+        parts.append(part_df.report_date.dt.year)
+    record_id = _str_values(parts[0])
+    for part in parts[1:]:
+        record_id = record_id + "_" + _str_values(part)
+    record_id = pd.Series(
+        record_id
         + "_"
-        + x[plant_part_col]
+        + part_df[plant_part_col].to_numpy(dtype=object)
         + "_"
-        + x.ownership_record_type.astype(str)
+        + _str_values(part_df.ownership_record_type)
         + "_"
-        + x.utility_id_eia.astype("Int64").astype(str)
+        + _str_values(part_df.utility_id_eia.astype("Int64")),
+        index=part_df.index,
     )
     # add operational status only when records are not "operating" (i.e.
     # existing or retiring mid-year see MakeMegaGenTbl.abel_operating_gens()
     # for more details)
     non_op_mask = part_df.operational_status_pudl != "operating"
-    part_df.loc[non_op_mask, "record_id_eia_temp"] = (
-        part_df.loc[non_op_mask, "record_id_eia_temp"]
+    record_id.loc[non_op_mask] = (
+        record_id.loc[non_op_mask]
         + "_"
         + part_df.loc[non_op_mask, "operational_status_pudl"]
     )
-    if year:
-        part_df = part_df.rename(columns={"record_id_eia_temp": "record_id_eia"})
-        part_df["record_id_eia"] = part_df["record_id_eia"].astype("string")
-    else:
-        part_df = part_df.rename(columns={"record_id_eia_temp": "plant_part_id_eia"})
-        part_df["plant_part_id_eia"] = part_df["plant_part_id_eia"].astype("string")
-    return part_df
+    id_col = "record_id_eia" if year else "plant_part_id_eia"
+    return part_df.assign(**{id_col: record_id.astype("string")})
+
+
+def _str_values(col: pd.Series) -> np.ndarray:
+    """Convert the values of a column to strings, like ``col.astype(str)``.
+
+    Each distinct value is converted once, which is much faster for the ID columns
+    of the plant parts, with many records of each plant, generator or utility. Missing
+    values are converted one by one, since ``factorize`` conflates them, while
+    ``astype(str)`` turns ``None`` into ``"None"`` and ``NaN`` into ``"nan"``.
+    """
+    codes, uniques = pd.factorize(col)
+    values = pd.Series(uniques).astype(str).to_numpy(dtype=object)[codes]
+    missing = codes == -1
+    values[missing] = col[missing].astype(str).to_numpy(dtype=object)
+    return values
 
 
 def match_to_single_plant_part(
@@ -0,0 +1,266 @@
+"""Centered rolling statistics of multivariate series, ignoring null values.
+
+These kernels compute the same statistics as :meth:`pandas.DataFrame.rolling` with
+``min_periods=1`` and ``center=True``. Each series is sorted once, and the moving
+window is kept as a Fenwick tree of the ranks of its values, so that each value enters
+and leaves the window once and any quantile of the window can be selected in
+logarithmic time, whatever the size of the window. All of the quantiles of a window
+are read from the same tree, rather than sliding a separate window for each one.
+
+They are used by :class:`pudl.analysis.timeseries_cleaning.Timeseries` to screen
+hourly electricity demand for anomalies.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+from numba import njit
+
+
+@njit
+def _quantile(values: np.ndarray, q: float) -> float:
+    """Quantile of sorted values, interpolating linearly like pandas."""
+    if len(values) == 0:
+        return np.nan
+    if q == 0.5:
+        # Rolling medians are averages of the middle values in pandas
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle] + values[middle - 1]) / 2
+    position = q * (len(values) - 1)
+    low = int(position)
+    if low == position:
+        return values[low]
+    return values[low] + (values[low + 1] - values[low]) * (position - low)
+
+
+@njit
+def _update(tree: np.ndarray, rank: int, delta: int) -> None:
+    """Add delta to the count of the value of a rank in a Fenwick tree."""
+    i = rank + 1
+    while i < len(tree):
+        tree[i] += delta
+        i += i & -i
+
+
+@njit
+def _select(tree: np.ndarray, top: int, k: int) -> int:
+    """Rank of the k-th smallest (from 0) of the values counted in a Fenwick tree.
+
+    ``top`` is the largest power of two less than the length of the tree.
+    """
+    rank = 0
+    remaining = k + 1
+    step = top
+    while step:
+        if rank + step < len(tree) and tree[rank + step] < remaining:
+            rank += step
+            remaining -= tree[rank]
+        step >>= 1
+    return rank
+
+
+@njit
+def _window_quantile(
+    tree: np.ndarray, top: int, sorted_values: np.ndarray, count: int, q: float
+) -> float:
+    """Quantile of the values in a window, like :func:`_quantile`."""
+    if count == 0:
+        return np.nan
+    if q == 0.5:
+        middle = count // 2
+        if count % 2:
+            return sorted_values[_select(tree, top, middle)]
+        return (
+            sorted_values[_select(tree, top, middle)]
+            + sorted_values[_select(tree, top, middle - 1)]
+        ) / 2
+    position = q * (count - 1)
+    low = int(position)
+    value = sorted_values[_select(tree, top, low)]
+    if low == position:
+        return value
+    high = sorted_values[_select(tree, top, low + 1)]
+    return value + (high - value) * (position - low)
+
+
+@njit
+def _rolling_quantiles(x: np.ndarray, window: int, qs: np.ndarray) -> np.ndarray:
+    m, n = x.shape
+    out = np.empty((len(qs), m, n))
+    # Window of position i is [i + offset + 1 - window, i + offset], as in pandas
+    offset = (window - 1) // 2
+    ranks = np.empty(n, dtype=np.int64)
+    tree = np.empty(n + 1, dtype=np.int64)
+    top = 1
+    while top * 2 <= n:
+        top *= 2
+    for j in range(m):
+        series = x[j]
+        # Windows are tracked as counts of the ranks of their values in the series,
+        # from which any quantile can be selected in logarithmic time.
+        order = np.argsort(series)
+        sorted_values = series[order]
+        ranks[order] = np.arange(n)
+        tree[:] = 0
+        count = 0
+        for i in range(min(offset, n)):
+            if not np.isnan(series[i]):
+                _update(tree, ranks[i], 1)
+                count += 1
+        for i in range(n):
+            entering = i + offset
+            if entering < n and not np.isnan(series[entering]):
+                _update(tree, ranks[entering], 1)
+                count += 1
+            leaving = entering - window
+            if leaving >= 0 and not np.isnan(series[leaving]):
+                _update(tree, ranks[leaving], -1)
+                count -= 1
+            for k in range(len(qs)):
+                out[k, j, i] = _window_quantile(tree, top, sorted_values, count, qs[k])
+    return out
+
+
+def rolling_quantiles(
+    x: np.ndarray, window: int, quantiles: Sequence[float]
+) -> np.ndarray:
+    """Centered rolling quantiles of each series.
+
+    Equivalent to ``pd.DataFrame(x).rolling(window, min_periods=1,
+    center=True).quantile(q)`` for each quantile ``q``, with linear interpolation.
+
+    Args:
+        x: Series with shape (observations, series).
+        window: Number of values in the moving window.
+        quantiles: Quantiles to compute, between 0 and 1.
+
+    Returns:
+        Quantiles with shape (quantiles, observations, series). Null where a window has
+        no non-null values.
+    """
+    # The kernel runs along contiguous series
+    out = _rolling_quantiles(
+        np.ascontiguousarray(np.asarray(x, dtype=float).T),
+        window,
+        np.asarray(quantiles, dtype=float),
+    )
+    return np.ascontiguousarray(out.transpose(0, 2, 1))
+
+
+def rolling_median(x: np.ndarray, window: int) -> np.ndarray:
+    """Centered rolling median of each series.
+
+    Equivalent to ``pd.DataFrame(x).rolling(window, min_periods=1,
+    center=True).median()``.
+
+    Args:
+        x: Series with shape (observations, series).
+        window: Number of values in the moving window.
+    """
+    return rolling_quantiles(x, window, [0.5])[0]
+
+
+def rolling_iqr(x: np.ndarray, window: int) -> np.ndarray:
+    """Centered rolling interquartile range (IQR) of each series.
+
+    Equivalent to the difference of the 0.75 and 0.25 quantiles of
+    ``pd.DataFrame(x).rolling(window, min_periods=1, center=True)``.
+
+    Args:
+        x: Series with shape (observations, series).
+        window: Number of values in the moving window.
+    """
+    q25, q75 = rolling_quantiles(x, window, [0.25, 0.75])
+    return q75 - q25
+
+
+@njit
+def _insert(values: np.ndarray, count: int, value: float) -> int:
+    """Insert a value into the first count sorted values."""
+    k = count
+    while k > 0 and values[k - 1] > value:
+        values[k] = values[k - 1]
+        k -= 1
+    values[k] = value
+    return count + 1
+
+
+@njit
+def _remove(values: np.ndarray, count: int, value: float) -> int:
+    """Remove a value from the first count sorted values."""
+    k = np.searchsorted(values[:count], value)
+    values[k : count - 1] = values[k + 1 : count]
+    return count - 1
+
+
+@njit
+def _shifted_median(x: np.ndarray, shifts: np.ndarray) -> np.ndarray:
+    m, n = x.shape
+    out = np.empty((m, n))
+    values = np.empty(len(shifts))
+    for j in range(m):
+        series = x[j]
+        for i in range(n):
+            count = 0
+            for shift in shifts:
+                source = i - shift
+                if 0 <= source < n and not np.isnan(series[source]):
+                    count = _insert(values, count, series[source])
+            out[j, i] = _quantile(values[:count], 0.5)
+    return out
+
+
+@njit
+def _strided_shifted_median(
+    x: np.ndarray, first: int, step: int, shifts: int
+) -> np.ndarray:
+    m, n = x.shape
+    out = np.empty((m, n))
+    values = np.empty(shifts + 1)
+    for j in range(m):
+        series = x[j]
+        for phase in range(min(step, n)):
+            # Values of position i are at i - first - step * k for k in [0, shifts)
+            count = 0
+            for k in range(shifts):
+                source = phase - first - step * k
+                if 0 <= source < n and not np.isnan(series[source]):
+                    count = _insert(values, count, series[source])
+            # The values of the next position of the same phase share all but one
+            for i in range(phase, n, step):
+                out[j, i] = _quantile(values[:count], 0.5)
+                entering = i + step - first
+                if 0 <= entering < n and not np.isnan(series[entering]):
+                    count = _insert(values, count, series[entering])
+                leaving = i - first - step * (shifts - 1)
+                if 0 <= leaving < n and not np.isnan(series[leaving]):
+                    count = _remove(values, count, series[leaving])
+    return out
+
+
+def shifted_median(x: np.ndarray, shifts: Sequence[int]) -> np.ndarray:
+    """Median of each value of each series shifted by different numbers of positions.
+
+    Equivalent to the :func:`numpy.nanmedian` across copies of `x` shifted like
+    :meth:`pandas.DataFrame.shift`, without making those copies.
+
+    Args:
+        x: Series with shape (observations, series).
+        shifts: Positions to shift the series by. Positive values shift the values
+            forward, so that each position gets the value of a preceding position.
+
+    Returns:
+        Medians with the same shape as `x`. Null where all shifted values are null.
+    """
+    x = np.ascontiguousarray(np.asarray(x, dtype=float).T)
+    shifts = np.sort(np.asarray(shifts, dtype=np.int64))
+    steps = np.diff(shifts)
+    if len(steps) and steps[0] > 0 and (steps == steps[0]).all():
+        # Evenly spaced shifts, like the same hour of surrounding days, are slid along
+        # the series rather than gathered again for each position.
+        out = _strided_shifted_median(x, shifts[0], steps[0], len(shifts))
+    else:
+        out = _shifted_median(x, shifts)
+    return np.ascontiguousarray(out.T)
@@ -18,7 +18,10 @@ electricity demand estimates (e.g. at the county level).
 """
 
 import datetime
+import functools
+import os
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import geopandas as gpd
@@ -30,6 +33,8 @@ import pudl.analysis.timeseries_cleaning
 import pudl.logging_helpers
 import pudl.output.pudltabl
 from pudl.metadata.dfs import POLITICAL_SUBDIVISIONS
+from pudl.workspace.frame_cache import DataFrameCache
+from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
@@ -378,43 +383,93 @@ def filter_ferc714_hourly_demand_matrix(
     return df
 
 
+def _impute_ferc714_year(
+    gdf: pd.DataFrame, cache: DataFrameCache | None = None
+) -> pd.DataFrame:
+    """Impute null values in one year of the FERC 714 hourly demand matrix.
+
+    If the year was imputed before with the same values, its previous imputation is
+    read from the cache. If it was imputed before with the same respondents, but some
+    of its values have changed since, its previous imputation is used to warm start
+    this one. The result is then close to, but not the same as, that of imputing the
+    year from scratch.
+    """
+    year = gdf.index[0].year
+    logger.info(f"Imputing year {year}")
+    keep = gdf.columns[~gdf.isnull().all()]
+    tsi = pudl.analysis.timeseries_cleaning.Timeseries(gdf[keep])
+    init = None
+    if cache is not None:
+        previous_key = {
+            "ferc714_hourly_imputed_demand": year,
+            "version": pudl.analysis.timeseries_cleaning.IMPUTATION_VERSION,
+        }
+        previous = cache.get(previous_key)
+        if (
+            previous is not None
+            and previous.index.equals(gdf.index)
+            and previous.columns.equals(keep.astype(str))
+        ):
+            init = previous.to_numpy()
+    result = tsi.to_dataframe(
+        tsi.impute(method="tnn", init=init, cache=cache), copy=False
+    )
+    if cache is not None:
+        cache.add(previous_key, result.set_axis(keep.astype(str), axis="columns"))
+    return result
+
+
 def impute_ferc714_hourly_demand_matrix(
-    df: pd.DataFrame, years: list[int]
+    df: pd.DataFrame,
+    years: list[int],
+    workers: int | None = 1,
+    cache: DataFrameCache | None = None,
 ) -> pd.DataFrame:
     """Impute null values in FERC 714 hourly demand matrix.
 
     Imputation is performed separately for each year,
     with only the respondents reporting data in that year.
+    The years are independent of each other, so with more than one worker they are
+    imputed in a pool of worker processes. The imputation is deterministic, so the
+    result doesn't depend on the number of workers.
+
+    With a cache, years which haven't changed since they were last imputed are read
+    from the cache, and years in which only some values have changed are warm started
+    from their previous imputation. Warm started years converge to values close to,
+    but not the same as, those of a run without a cache. See
+    :meth:`pudl.analysis.timeseries_cleaning.Timeseries.impute`.
 
     .. note::
-        Takes about 15 minutes.
+        Takes about 15 minutes with a single worker and an empty cache.
 
     Args:
         df: FERC 714 hourly demand matrix,
           as described in :func:`load_ferc714_hourly_demand_matrix`.
         years: list of years to input
+        workers: Number of worker processes to impute the years in. If None, one per
+          CPU is used.
+        cache: Cache of previous imputations.
 
     Returns:
         Copy of `df` with imputed values.
     """
-    results = []
     # sort here and then don't sort in the groupby so we can process
     # the newer years of data first. This is so we can see early if
     # new data causes any failures.
     df = df.sort_index(ascending=False)
-    for year, gdf in df.groupby(df.index.year, sort=False):
-        # remove the records o/s of the working years because some
-        # respondents report one record of midnight of January first
-        # of the next year (report_date.dt.year + 1). and
-        # impute_ferc714_hourly_demand_matrix chunks over years at a time
-        # and having only one record
-        if year in years:
-            logger.info(f"Imputing year {year}")
-            keep = df.columns[~gdf.isnull().all()]
-            tsi = pudl.analysis.timeseries_cleaning.Timeseries(gdf[keep])
-            result = tsi.to_dataframe(tsi.impute(method="tnn"), copy=False)
-            results.append(result)
-    return pd.concat(results)
+    # remove the records o/s of the working years because some
+    # respondents report one record of midnight of January first
+    # of the next year (report_date.dt.year + 1). and
+    # impute_ferc714_hourly_demand_matrix chunks over years at a time
+    # and having only one record
+    gdfs = [gdf for year, gdf in df.groupby(df.index.year, sort=False) if year in years]
+    impute_year = functools.partial(_impute_ferc714_year, cache=cache)
+    workers = min(workers or os.cpu_count(), len(gdfs))
+    if workers <= 1:
+        return pd.concat([impute_year(gdf) for gdf in gdfs])
+    logger.info(f"Imputing {len(gdfs)} years with {workers} workers.")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return pd.concat(executor.map(impute_year, gdfs))
 
 
 def melt_ferc714_hourly_demand_matrix(
@@ -489,6 +544,26 @@ def _out_ferc714__hourly_demand_matrix(
 
 @asset(
     compute_kind="NumPy",
+    config_schema={
+        "workers": Field(
+            int,
+            default_value=1,
+            description=(
+                "Number of worker processes in which to impute the years of data. "
+                "Zero uses one worker per CPU."
+            ),
+        ),
+        "use_cache": Field(
+            bool,
+            default_value=False,
+            description=(
+                "Reuse the imputations of previous runs, which are cached in the "
+                "output directory, and warm start the imputation of changed years "
+                "from them. Warm started years are close to, but not the same as, "
+                "the years imputed without a cache."
+            ),
+        ),
+    },
     required_resource_keys={"dataset_settings"},
 )
 def _out_ferc714__hourly_imputed_demand(
@@ -510,7 +585,16 @@ def _out_ferc714__hourly_imputed_demand(
         df: DataFrame with imputed FERC714 hourly demand.
     """
     years = context.resources.dataset_settings.ferc714.years
-    df = impute_ferc714_hourly_demand_matrix(_out_ferc714__hourly_demand_matrix, years)
+    df = impute_ferc714_hourly_demand_matrix(
+        _out_ferc714__hourly_demand_matrix,
+        years,
+        workers=context.op_config["workers"] or None,
+        cache=(
+            DataFrameCache(PudlPaths().output_dir / "_cache" / "imputation")
+            if context.op_config["use_cache"]
+            else None
+        ),
+    )
     df = melt_ferc714_hourly_demand_matrix(df, _out_ferc714__utc_offset)
     return df
 
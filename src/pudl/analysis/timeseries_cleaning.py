@@ -30,7 +30,7 @@ And described at:
 """
 
 import functools
-import warnings
+import hashlib
 from collections.abc import Iterable, Sequence
 from typing import Any
 
@@ -39,6 +39,19 @@ import numpy as np
 import pandas as pd
 import scipy.stats
 
+import pudl.analysis.rolling_stats
+import pudl.logging_helpers
+from pudl.workspace.frame_cache import DataFrameCache
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+IMPUTATION_VERSION = 1
+"""Version of the imputation methods, in the key of every cached imputation.
+
+Increment it whenever the imputation methods change in a way that changes their
+results, so that imputations cached by older versions are never reused.
+"""
+
 # ---- Helpers ---- #
 
 
@@ -324,6 +337,40 @@ def _svt_tnn(matrix: np.ndarray, tau: float, theta: int) -> np.ndarray:
     return u[:, :idx] @ np.diag(vec) @ v[:idx, :]
 
 
+def _fit_autoregression(
+    mat_hat: np.ndarray,
+    z: np.ndarray,
+    ind: np.ndarray,
+    sample: np.ndarray = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fit the autoregressive coefficients of every series by least squares.
+
+    The least-squares problems of all the series are solved at once with the
+    pseudoinverse of a stack of matrices, rather than one series at a time.
+
+    Args:
+        mat_hat: Current estimate of the series, in the form (series, time).
+        z: Series to fit, in the form (series, time).
+        ind: Time index of each lag, in the form (lags, time - max lag).
+        sample: Positions along `time - max lag` of the values of each series to fit,
+            in the form (series, samples). All values are fit by default.
+
+    Returns:
+        Coefficients in the form (series, lags), and the autoregressive estimates of
+        the series after the max lag, in the form (series, time - max lag).
+    """
+    # Lagged values of each series, in the form (series, time - max lag, lags)
+    q = np.moveaxis(mat_hat[:, ind], 1, 2)
+    y = z[:, z.shape[1] - ind.shape[1] :]
+    if sample is not None:
+        qs = np.take_along_axis(q, sample[:, :, np.newaxis], axis=1)
+        y = np.take_along_axis(y, sample, axis=1)
+    else:
+        qs = q
+    a = (np.linalg.pinv(qs) @ y[:, :, np.newaxis])[:, :, 0]
+    return a, np.einsum("mtd, md -> mt", q, a)
+
+
 def impute_latc_tnn(
     tensor: np.ndarray,
     lags: Sequence[int] = [1],
@@ -333,6 +380,8 @@ def impute_latc_tnn(
     theta: int = 20,
     epsilon: float = 1e-7,
     maxiter: int = 300,
+    init: np.ndarray = None,
+    rho_warm: float = 1e-2,
 ) -> np.ndarray:
     """Impute tensor values with LATC-TNN method by Chen and Sun (2020).
 
@@ -352,11 +401,17 @@ def impute_latc_tnn(
         theta:
         epsilon: Convergence criterion. A smaller number will result in more iterations.
         maxiter: Maximum number of iterations.
+        init: Previous solution of a similar tensor, of the same shape as `tensor`,
+            with which to warm start the imputation. Its values replace the initial
+            guesses of the null values in `tensor`, except where it is itself null.
+        rho_warm: Initial penalty of a warm started imputation, in place of `rho0`.
+            The penalty grows with every iteration, and the warm start would be lost
+            if it started from the small `rho0`, so it should be close to the penalty
+            at which the solution in `init` converged.
 
     Returns:
         Tensor with missing values in `tensor` replaced by imputed values.
     """
-    rng = np.random.default_rng()
     tensor = np.where(np.isnan(tensor), 0, tensor)
     dim = np.array(tensor.shape)
     dim_time = int(np.prod(dim) / dim[0])
@@ -368,14 +423,17 @@ def impute_latc_tnn(
     t = np.zeros(np.insert(dim, 0, len(dim)))
     z = mat.copy()
     z[pos_missing] = np.mean(mat[mat != 0])
-    a = 0.001 * rng.random(dim[0] * d).reshape([dim[0], d])
+    if init is not None:
+        init = _ten2mat(init, 0)
+        warm = (mat == 0) & ~np.isnan(init)
+        z[warm] = init[warm]
     it = 0
     ind = np.zeros((d, dim_time - max_lag), dtype=int)
     for i in range(d):
         ind[i, :] = np.arange(max_lag - lags[i], dim_time - lags[i])
     last_mat = mat.copy()
     snorm = np.linalg.norm(mat, "fro")
-    rho = rho0
+    rho = rho0 if init is None else rho_warm
     while True:
         rho = min(rho * 1.05, 1e5)
         for k in range(len(dim)):
@@ -390,12 +448,8 @@ def impute_latc_tnn(
             )
         tensor_hat = np.einsum("k, kmnt -> mnt", alpha, x)
         mat_hat = _ten2mat(tensor_hat, 0)
-        mat0 = np.zeros((dim[0], dim_time - max_lag))
         if lambda0 > 0:
-            for m in range(dim[0]):
-                qm = mat_hat[m, ind].T
-                a[m, :] = np.linalg.pinv(qm) @ z[m, max_lag:]
-                mat0[m, :] = qm @ a[m, :]
+            _, mat0 = _fit_autoregression(mat_hat, z, ind)
             mat1 = _ten2mat(np.mean(rho * x + t, axis=0), 0)
             z[pos_missing] = np.append(
                 (mat1[:, :max_lag] / rho),
@@ -410,10 +464,9 @@ def impute_latc_tnn(
         tol = np.linalg.norm((mat_hat - last_mat), "fro") / snorm
         last_mat = mat_hat.copy()
         it += 1
-        print(f"Iteration: {it}", end="\r")
         if tol < epsilon or it >= maxiter:
             break
-    print(f"Iteration: {it}")
+    logger.debug(f"Imputation stopped after {it} iterations with tolerance {tol:.2e}")
     return tensor_hat
 
 
@@ -439,6 +492,9 @@ def impute_latc_tubal(  # noqa: C901
     lambda0: float = 2e-7,
     epsilon: float = 1e-7,
     maxiter: int = 300,
+    seed: int | None = None,
+    init: np.ndarray = None,
+    rho_warm: float = 1e-2,
 ) -> np.ndarray:
     """Impute tensor values with LATC-Tubal method by Chen, Chen and Sun (2020).
 
@@ -457,11 +513,20 @@ def impute_latc_tubal(  # noqa: C901
         lambda0:
         epsilon: Convergence criterion. A smaller number will result in more iterations.
         maxiter: Maximum number of iterations.
+        seed: Seed of the random number generator used to sample the values to
+            which the autoregressive coefficients are fit, for reproducible results.
+        init: Previous solution of a similar tensor, of the same shape as `tensor`,
+            with which to warm start the imputation. Its values replace the initial
+            guesses of the null values in `tensor`, except where it is itself null.
+        rho_warm: Initial penalty of a warm started imputation, in place of `rho0`.
+            The penalty grows with every iteration, and the warm start would be lost
+            if it started from the small `rho0`, so it should be close to the penalty
+            at which the solution in `init` converged.
 
     Returns:
         Tensor with missing values in `tensor` replaced by imputed values.
     """
-    rng = np.random.default_rng()
+    rng = np.random.default_rng(seed)
     tensor = np.where(np.isnan(tensor), 0, tensor)
     dim = np.array(tensor.shape)
     dim_time = int(np.prod(dim) / dim[0])
@@ -472,14 +537,17 @@ def impute_latc_tubal(  # noqa: C901
     t = np.zeros(dim)
     z = mat.copy()
     z[pos_missing] = np.mean(mat[mat != 0])
-    a = 0.001 * rng.random(dim[0] * d).reshape([dim[0], d])
+    if init is not None:
+        init = _ten2mat(init, 0)
+        warm = (mat == 0) & ~np.isnan(init)
+        z[warm] = init[warm]
     it = 0
     ind = np.zeros((d, dim_time - max_lag), dtype=np.int_)
     for i in range(d):
         ind[i, :] = np.arange(max_lag - lags[i], dim_time - lags[i])
     last_mat = mat.copy()
     snorm = np.linalg.norm(mat, "fro")
-    rho = rho0
+    rho = rho0 if init is None else rho_warm
     temp1 = _ten2mat(_mat2ten(z, dim, 0), 2)
     _, phi = np.linalg.eig(temp1 @ temp1.T)
     del temp1
@@ -491,22 +559,18 @@ def impute_latc_tubal(  # noqa: C901
         rho = min(rho * 1.05, 1e5)
         x = _tsvt(_mat2ten(z, dim, 0) - t / rho, phi, 1 / rho)
         mat_hat = _ten2mat(x, 0)
-        mat0 = np.zeros((dim[0], dim_time - max_lag))
         temp2 = _ten2mat(rho * x + t, 0)
         if lambda0 > 0:
-            if dim_time <= 5e3:
-                for m in range(dim[0]):
-                    qm = mat_hat[m, ind].T
-                    a[m, :] = np.linalg.pinv(qm) @ z[m, max_lag:]
-                    mat0[m, :] = qm @ a[m, :]
-            elif dim_time > 5e3:
-                for m in range(dim[0]):
-                    idx = np.arange(0, dim_time - max_lag)
-                    rng.shuffle(idx)
-                    idx = idx[: int(sample_rate * (dim_time - max_lag))]
-                    qm = mat_hat[m, ind].T
-                    a[m, :] = np.linalg.pinv(qm[idx[:], :]) @ z[m, max_lag:][idx[:]]
-                    mat0[m, :] = qm @ a[m, :]
+            sample = None
+            if dim_time > 5e3:
+                # Fit each series to a different random sample of its values
+                sample = rng.permuted(
+                    np.broadcast_to(
+                        np.arange(dim_time - max_lag), (dim[0], dim_time - max_lag)
+                    ),
+                    axis=1,
+                )[:, : int(sample_rate * (dim_time - max_lag))]
+            _, mat0 = _fit_autoregression(mat_hat, z, ind, sample=sample)
             z[pos_missing] = np.append(
                 (temp2[:, :max_lag] / rho),
                 (temp2[:, max_lag:] + lambda0 * mat0) / (rho + lambda0),
@@ -522,10 +586,9 @@ def impute_latc_tubal(  # noqa: C901
             temp1 = _ten2mat(_mat2ten(z, dim, 0) - t / rho, 2)
             _, phi = np.linalg.eig(temp1 @ temp1.T)
             del temp1
-        print(f"Iteration: {it}", end="\r")
         if tol < epsilon or it >= maxiter:
             break
-    print(f"Iteration: {it}")
+    logger.debug(f"Imputation stopped after {it} iterations with tolerance {tol:.2e}")
     return x
 
 
@@ -680,9 +743,9 @@ class Timeseries:
             window: Number of values in the moving window.
         """
         # RUGGLES: rollingDem, rollingDemLong (window=480)
-        df = pd.DataFrame(self.x, copy=False)
-        return df.rolling(window, min_periods=1, center=True).median().to_numpy()
+        return pudl.analysis.rolling_stats.rolling_median(self.x, window=window)
 
+    @functools.lru_cache(maxsize=2)  # noqa: B019
     def rolling_median_offset(self, window: int = 48) -> np.ndarray:
         """Values minus the rolling median.
 
@@ -709,23 +772,7 @@ class Timeseries:
         """
         # RUGGLES: vals_dem_minus_rolling
         offset = self.rolling_median_offset(window=window)
-        # Fast numpy implementation of pd.DataFrame.shift
-        shifted = np.empty([len(shifts), *offset.shape], dtype=float)
-        for i, shift in enumerate(shifts):
-            if shift > 0:
-                shifted[i, :shift] = np.nan
-                shifted[i, shift:] = offset[:-shift]
-            elif shift < 0:
-                shifted[i, shift:] = np.nan
-                shifted[i, :shift] = offset[-shift:]
-            else:
-                shifted[i, :] = offset
-        # Ignore warning for rows with all null values
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore", category=RuntimeWarning, message="All-NaN slice encountered"
-            )
-            return np.nanmedian(shifted, axis=0)
+        return pudl.analysis.rolling_stats.shifted_median(offset, shifts=shifts)
 
     def rolling_iqr_of_rolling_median_offset(
         self, window: int = 48, iqr_window: int = 240
@@ -740,9 +787,7 @@ class Timeseries:
         """
         # RUGGLES: dem_minus_rolling_IQR
         offset = self.rolling_median_offset(window=window)
-        df = pd.DataFrame(offset, copy=False)
-        rolling = df.rolling(iqr_window, min_periods=1, center=True)
-        return (rolling.quantile(0.75) - rolling.quantile(0.25)).to_numpy()
+        return pudl.analysis.rolling_stats.rolling_iqr(offset, window=iqr_window)
 
     def median_prediction(
         self,
@@ -826,9 +871,7 @@ class Timeseries:
         """
         # RUGGLES: delta_rolling_iqr
         diff = self.diff(shift=shift)
-        df = pd.DataFrame(diff, copy=False)
-        rolling = df.rolling(window, min_periods=1, center=True)
-        return (rolling.quantile(0.75) - rolling.quantile(0.25)).to_numpy()
+        return pudl.analysis.rolling_stats.rolling_iqr(diff, window=window)
 
     def flag_double_delta(self, iqr_window: int = 240, multiplier: float = 2) -> None:
         """Flag values very different from neighbors on either side (DOUBLE_DELTA).
@@ -1225,6 +1268,8 @@ class Timeseries:
         periods: int = 24,
         blocks: int = 1,
         method: str = "tubal",
+        init: np.ndarray = None,
+        cache: DataFrameCache = None,
         **kwargs: Any,
     ) -> np.ndarray:
         """Impute null values.
@@ -1233,6 +1278,15 @@ class Timeseries:
             The imputation method requires that nulls be replaced by zeros,
             so the series cannot already contain zeros.
 
+        Imputations can be stored in a cache, keyed by a hash of the series to impute
+        and the imputation parameters, so that imputing the same series again returns
+        immediately. When only some of the values of the series have changed since
+        they were last imputed, passing the previous imputation as `init` warm starts
+        the imputation, which then often converges in fewer iterations. A warm start
+        converges to a solution close to, but not the same as, that of a cold start.
+        `init` is not part of the cache key, so a series found in the cache is never
+        imputed again, and returns the same values however it was first imputed.
+
         Args:
             mask: Boolean mask of values to impute in addition to
                 any null values in :attr:`x`.
@@ -1242,6 +1296,10 @@ class Timeseries:
                 This has been found to reduce processing time for `method='tnn'`.
             method: Imputation method to use
                 ('tubal': :func:`impute_latc_tubal`, 'tnn': :func:`impute_latc_tnn`).
+            init: Previous imputation of similar series, of the same shape as
+                :attr:`x`, with which to warm start the imputation. Unused if the
+                series is found in `cache`.
+            cache: Cache in which to look up and store the imputed series.
             kwargs: Optional arguments to `method`.
 
         Returns:
@@ -1256,14 +1314,35 @@ class Timeseries:
         if (x == 0).any():
             raise ValueError("Zero values present. Replace with very small value.")
         tensor = self.fold_tensor(x, periods=periods)
+        if cache is not None:
+            key = {
+                "tensor": hashlib.sha256(np.ascontiguousarray(tensor)).hexdigest(),
+                "shape": tensor.shape,
+                "dtype": tensor.dtype,
+                "method": method,
+                "blocks": blocks,
+                "version": IMPUTATION_VERSION,
+                **kwargs,
+            }
+            cached = cache.get(key)
+            if cached is not None:
+                return cached.to_numpy()
+        if init is not None:
+            init = self.fold_tensor(init, periods=periods)
         n = tensor.shape[1]
         ends = [*range(0, n, int(np.ceil(n / blocks))), n]
         for i in range(blocks):
             if blocks > 1:
-                print(f"Block: {i}")
+                logger.debug(f"Imputing block {i}")
             idx = slice(None), slice(ends[i], ends[i + 1]), slice(None)
+            if init is not None:
+                kwargs["init"] = init[idx]
             tensor[idx] = imputer(tensor[idx], **kwargs)
-        return self.unfold_tensor(tensor)
+        imputed = self.unfold_tensor(tensor)
+        if cache is not None:
+            columns = [str(i) for i in range(imputed.shape[1])]
+            cache.add(key, pd.DataFrame(imputed, columns=columns))
+        return imputed
 
     def summarize_imputed(self, imputed: np.ndarray, mask: np.ndarray) -> pd.DataFrame:
         """Summarize the fit of imputed values to actual values.
@@ -9,19 +9,30 @@ for processing each year of EPA CEMS data and execute these ops in parallel. For
 see: https://docs.dagster.io/concepts/ops-jobs-graphs/dynamic-graphs and https://docs.dagster.io/concepts/assets/graph-backed-assets.
 """
 
+import hashlib
+import json
+import os
+import shutil
+import tempfile
 from collections import namedtuple
 from pathlib import Path
+from typing import Any
 
-import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from dagster import (
     AssetIn,
+    AssetOut,
     DynamicOut,
     DynamicOutput,
+    Field,
+    Output,
     asset,
     graph_asset,
+    multi_asset,
     op,
 )
 
@@ -29,6 +40,13 @@ import pudl
 from pudl.extract.epacems import EpaCemsPartition
 from pudl.metadata.classes import Resource
 from pudl.metadata.enums import EPACEMS_STATES
+from pudl.output.epacems import (
+    PLANT_INDEX_FILENAME,
+    PLANT_INDEX_SCHEMA,
+    EpaCemsDataset,
+)
+from pudl.parquet_helpers import splice_row_groups
+from pudl.workspace.datastore import Datastore
 from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -36,6 +54,20 @@ logger = pudl.logging_helpers.get_logger(__name__)
 
 YearPartitions = namedtuple("YearPartitions", ["year_quarters"])
 
+DATASET_SORT_COLUMNS = [
+    "plant_id_eia",
+    "emissions_unit_id_epa",
+    "operating_datetime_utc",
+]
+"""Order of the records within each file of the hive-partitioned EPA CEMS dataset."""
+
+DATASET_ROW_GROUP_SIZE = 2**17
+"""Rows per row group in the hive-partitioned EPA CEMS dataset.
+
+Each row group holds a handful of plant-years of hourly data, so reading the data of a
+few plants through the plant index only decodes a small part of a state's file.
+"""
+
 
 def _partitioned_path() -> Path:
     partitioned_path = (
@@ -45,6 +77,91 @@ def _partitioned_path() -> Path:
     return partitioned_path
 
 
+def _rollup_path(year_quarter: str) -> Path:
+    """Path of the daily emissions by unit of a processed EPA CEMS quarter.
+
+    The quarterly rollups live in a ``_rollups`` subdirectory of the partitioned
+    outputs, which parquet dataset readers ignore because of the leading underscore.
+    """
+    rollup_dir = _partitioned_path() / "_rollups"
+    rollup_dir.mkdir(exist_ok=True)
+    return rollup_dir / f"epacems-{year_quarter}.parquet"
+
+
+def _manifest_path(output_path: Path) -> Path:
+    """Path of the manifest recording how an EPA CEMS output file was produced.
+
+    Manifests live in a ``_manifest`` subdirectory of the partitioned outputs, which
+    parquet dataset readers ignore because of the leading underscore.
+    """
+    manifest_dir = _partitioned_path() / "_manifest"
+    manifest_dir.mkdir(exist_ok=True)
+    return manifest_dir / f"{output_path.stem}.json"
+
+
+def _read_manifest(output_path: Path) -> dict[str, Any] | None:
+    """Return the manifest of an output file, if it still describes that file.
+
+    Manifests record the size and modification time of the file they describe, so
+    outputs that have been modified or replaced since are never considered current.
+    """
+    try:
+        manifest = json.loads(_manifest_path(output_path).read_text())
+        stat = output_path.stat()
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if manifest.get("file") != {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}:
+        return None
+    return manifest
+
+
+def _write_manifest(output_path: Path, **contents: Any) -> None:
+    """Atomically record the manifest of a newly written output file."""
+    stat = output_path.stat()
+    manifest = {"file": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}}
+    manifest_path = _manifest_path(output_path)
+    tmp_path = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(manifest | contents, indent=2, sort_keys=True))
+    tmp_path.replace(manifest_path)
+
+
+def _quarter_fingerprint(
+    ds: Datastore, year_quarter: str, transform_inputs_hash: str
+) -> dict[str, Any]:
+    """Everything that determines the contents of a processed EPA CEMS quarter."""
+    try:
+        res = ds.get_unique_resource_key(
+            "epacems", **EpaCemsPartition(year_quarter=year_quarter).get_filters()
+        )
+        source = {
+            "doi": res.doi,
+            "name": res.name,
+            "md5": ds.get_datapackage_descriptor("epacems").get_checksum(res.name),
+        }
+    except KeyError:
+        source = None
+    schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    return {
+        "source": source,
+        "transform_inputs": transform_inputs_hash,
+        "code": _code_digest(),
+        "schema": hashlib.sha256(schema.serialize().to_pybytes()).hexdigest(),
+        "pudl_version": pudl.__version__,
+    }
+
+
+def _code_digest() -> str:
+    """Hash the source of the modules that extract and transform EPA CEMS quarters.
+
+    The PUDL version doesn't change with every edit of a development install, so the
+    code itself is part of the fingerprint of each processed quarter.
+    """
+    digest = hashlib.sha256()
+    for module in [pudl.extract.epacems, pudl.transform.epacems]:
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
 @op(
     out=DynamicOut(),
     required_resource_keys={"dataset_settings"},
@@ -63,27 +180,69 @@ def get_years_from_settings(context):
         yield DynamicOutput(year, mapping_key=str(year))
 
 
+@op
+def build_transform_lookups(
+    core_epa__assn_eia_epacamd: pd.DataFrame,
+    core_eia__entity_plants: pd.DataFrame,
+) -> str:
+    """Build the lookups used to transform every year of EPA CEMS data.
+
+    The lookups are written to a directory that the :func:`process_single_year` ops
+    memory-map, so the crosswalk and plant entities are only loaded and validated once
+    per run rather than once per year and quarter.
+
+    Args:
+        core_epa__assn_eia_epacamd: The EPA EIA crosswalk table used for harmonizing the
+            ORISPL code with EIA.
+        core_eia__entity_plants: The EIA Plant entities used for aligning timezones.
+
+    Returns:
+        The path of the directory holding the lookups.
+    """
+    lookups_path = _partitioned_path() / "_lookups"
+    pudl.transform.epacems.EpaCemsLookups.from_frames(
+        core_epa__assn_eia_epacamd, core_eia__entity_plants
+    ).write(lookups_path)
+    return str(lookups_path)
+
+
 @op(
+    config_schema={
+        "skip_unchanged": Field(
+            bool,
+            default_value=True,
+            description=(
+                "If True, quarters whose source data, transform inputs and code "
+                "haven't changed since they were last processed are not processed "
+                "again. If False, every quarter is processed."
+            ),
+        ),
+    },
     required_resource_keys={"datastore", "dataset_settings"},
-    tags={"memory-use": "high"},
 )
 def process_single_year(
     context,
     year,
-    core_epa__assn_eia_epacamd: pd.DataFrame,
-    core_eia__entity_plants: pd.DataFrame,
+    lookups_path: str,
 ) -> YearPartitions:
     """Process a single year of EPA CEMS data.
 
+    While each quarter is being written, its records are also summed by emissions unit
+    and day, which :func:`out_epacems__emissions_rollups` coarsens into the rest of the
+    rollup tables without reading the hourly data again.
+
+    Quarters that were already processed from the same source data, transform inputs
+    and code are skipped, unless the ``skip_unchanged`` config is False.
+
     Args:
         context: dagster keyword that provides access to resources and config.
         year: Year of data to process.
-        core_epa__assn_eia_epacamd: The EPA EIA crosswalk table used for harmonizing the
-            ORISPL code with EIA.
-        core_eia__entity_plants: The EIA Plant entities used for aligning timezones.
+        lookups_path: Directory of the lookups written by
+            :func:`build_transform_lookups`.
     """
     ds = context.resources.datastore
     epacems_settings = context.resources.dataset_settings.epacems
+    lookups = pudl.transform.epacems.EpaCemsLookups.read(Path(lookups_path))
 
     schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
     partitioned_path = _partitioned_path()
@@ -93,62 +252,338 @@ def process_single_year(
         for yq in epacems_settings.year_quarters
         if EpaCemsPartition(year_quarter=yq).year == year
     }
+    transform_inputs_hash = lookups.digest
 
     for year_quarter in year_quarters_in_year:
-        logger.info(f"Processing EPA CEMS hourly data for {year_quarter}")
-        df = pudl.extract.epacems.extract(year_quarter=year_quarter, ds=ds)
-        if not df.empty:  # If state-year combination has data
-            df = pudl.transform.epacems.transform(
-                df, core_epa__assn_eia_epacamd, core_eia__entity_plants
+        quarter_path = partitioned_path / f"epacems-{year_quarter}.parquet"
+        fingerprint = _quarter_fingerprint(ds, year_quarter, transform_inputs_hash)
+        rollup_path = _rollup_path(year_quarter)
+        manifest = _read_manifest(quarter_path)
+        if (
+            context.op_config["skip_unchanged"]
+            and manifest is not None
+            and manifest["fingerprint"] == fingerprint
+            and rollup_path.exists()
+        ):
+            logger.info(
+                f"Skipping EPA CEMS {year_quarter}: its source data, transform "
+                "inputs and code haven't changed since it was last processed."
             )
-        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            continue
 
-        # Write to a directory of partitioned parquet files
+        logger.info(f"Processing EPA CEMS hourly data for {year_quarter}")
+        _manifest_path(quarter_path).unlink(missing_ok=True)
+        # Write to a directory of partitioned parquet files, one batch of records at a
+        # time so that a whole quarter never has to fit in memory.
+        unit_days = []
         with pq.ParquetWriter(
-            where=partitioned_path / f"epacems-{year_quarter}.parquet",
+            where=quarter_path,
             schema=schema,
             compression="snappy",
             version="2.6",
         ) as partitioned_writer:
-            partitioned_writer.write_table(table)
+            for df in pudl.extract.epacems.extract_batches(
+                year_quarter=year_quarter, ds=ds
+            ):
+                df = pudl.transform.epacems.transform(df, lookups)
+                partitioned_writer.write_table(
+                    pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                )
+                unit_days.append(pudl.transform.epacems.rollup_unit_days(df, lookups))
+        _write_unit_days(rollup_path, unit_days)
+        _write_manifest(quarter_path, fingerprint=fingerprint)
 
     return YearPartitions(year_quarters_in_year)
 
 
+def _write_unit_days(path: Path, unit_days: list[pd.DataFrame]) -> None:
+    """Combine the daily emissions by unit of each batch of a quarter and write them.
+
+    A unit's day may be split across batches, so the partial sums are added up.
+    """
+    resource = Resource.from_id("out_epacems__daily_emissions_by_unit")
+    schema = resource.to_pyarrow()
+    if unit_days:
+        table = pa.Table.from_pandas(
+            resource.enforce_schema(
+                pudl.transform.epacems.sum_emissions(
+                    pd.concat(unit_days, ignore_index=True),
+                    [*pudl.transform.epacems.ROLLUP_UNIT_KEYS, "report_date"],
+                )
+            ),
+            schema=schema,
+            preserve_index=False,
+        )
+    else:
+        table = schema.empty_table()
+    pq.write_table(table, path, compression="snappy", version="2.6")
+
+
+class _StateBuckets:
+    """Record batches grouped by state, spilling to disk beyond a memory limit.
+
+    Batches are kept in the order they were added within each state. When the
+    buffered batches take up more than max_bytes, the state with the most buffered
+    data is appended to its own temporary Arrow IPC stream, so that one pass over
+    the inputs can group any amount of data by state in bounded memory.
+    """
+
+    def __init__(self, schema: pa.Schema, spill_dir: Path, max_bytes: int):
+        self.schema = schema
+        self.spill_dir = spill_dir
+        self.max_bytes = max_bytes
+        self.buffered: dict[str, list[pa.RecordBatch]] = {}
+        self.buffered_bytes: dict[str, int] = {}
+        self.spill_writers: dict[str, pa.ipc.RecordBatchStreamWriter] = {}
+
+    def add(self, batch: pa.RecordBatch, states: set[str]) -> None:
+        """Split a batch by state, keeping the records of the given states."""
+        state_col = batch.column("state")
+        if not isinstance(state_col, pa.DictionaryArray):
+            state_col = state_col.dictionary_encode()
+        for code, state in enumerate(state_col.dictionary.to_pylist()):
+            if state not in states:
+                continue
+            state_batch = batch.filter(pc.equal(state_col.indices, code))
+            if state_batch.num_rows:
+                self.buffered.setdefault(state, []).append(state_batch)
+                self.buffered_bytes[state] = (
+                    self.buffered_bytes.get(state, 0) + state_batch.nbytes
+                )
+        while sum(self.buffered_bytes.values()) > self.max_bytes:
+            self._spill(max(self.buffered_bytes, key=self.buffered_bytes.get))
+
+    def _spill(self, state: str) -> None:
+        if state not in self.spill_writers:
+            self.spill_writers[state] = pa.ipc.new_stream(
+                self.spill_dir / f"{state}.arrows", self.schema
+            )
+        for batch in self.buffered.pop(state):
+            self.spill_writers[state].write_batch(batch)
+        del self.buffered_bytes[state]
+
+    def pop_table(self, state: str) -> pa.Table:
+        """Return all the records of a state, in order, and forget them."""
+        batches = []
+        if state in self.spill_writers:
+            self.spill_writers.pop(state).close()
+            with pa.ipc.open_stream(self.spill_dir / f"{state}.arrows") as reader:
+                batches += list(reader)
+        batches += self.buffered.pop(state, [])
+        self.buffered_bytes.pop(state, None)
+        return pa.Table.from_batches(batches, schema=self.schema)
+
+
+def _write_year_state_row_groups(
+    where: Path,
+    year_partition: YearPartitions,
+    schema: pa.Schema,
+    max_buffer_bytes: int = 2**30,
+    dataset_dir: Path | None = None,
+) -> None:
+    """Write the data of all quarters in a year to a file of year-state row groups.
+
+    Each quarter is read once, and its records are grouped by state in memory, or in
+    temporary files on disk once they take up more than max_buffer_bytes.
+
+    If dataset_dir is given, the year is also written to it as one ``state=`` directory
+    per state, along with the plant index of the year.
+    """
+    partitioned_path = _partitioned_path()
+    states = {state.upper() for state in EPACEMS_STATES}
+    plant_index = []
+    with tempfile.TemporaryDirectory(dir=where.parent) as spill_dir:
+        buckets = _StateBuckets(schema, Path(spill_dir), max_buffer_bytes)
+        for year_quarter in sorted(year_partition.year_quarters):
+            quarter_file = pq.ParquetFile(
+                partitioned_path / f"epacems-{year_quarter}.parquet"
+            )
+            for batch in quarter_file.iter_batches():
+                buckets.add(batch, states)
+
+        with pq.ParquetWriter(
+            where=where, schema=schema, compression="snappy", version="2.6"
+        ) as writer:
+            # Concat each state's data from all quarters in a year and write to
+            # parquet to create year-state row groups
+            for state in EPACEMS_STATES:
+                state_table = buckets.pop_table(state.upper())
+                writer.write_table(state_table)
+                if dataset_dir is not None and state_table.num_rows:
+                    plant_index.append(_write_state_partition(dataset_dir, state_table))
+
+    if dataset_dir is not None:
+        dataset_dir.mkdir(parents=True, exist_ok=True)
+        with pa.ipc.new_file(
+            dataset_dir / PLANT_INDEX_FILENAME, PLANT_INDEX_SCHEMA
+        ) as index_writer:
+            index_writer.write_table(
+                pa.concat_tables(plant_index or [PLANT_INDEX_SCHEMA.empty_table()])
+            )
+
+
+def _write_state_partition(dataset_dir: Path, state_table: pa.Table) -> pa.Table:
+    """Write one year-state of the hive-partitioned EPA CEMS dataset.
+
+    The records are sorted by plant, unit and time, so that the records of each plant
+    are in a contiguous range of row groups.
+
+    Args:
+        dataset_dir: the ``year=`` directory of the dataset to write the state into.
+        state_table: all the records of a single year and state.
+
+    Returns:
+        The plant index entries of the written file, with the range of row groups
+        holding each plant's records.
+    """
+    year = state_table["year"][0].as_py()
+    state = state_table["state"][0].as_py()
+    path = dataset_dir / f"state={state}" / "epacems.parquet"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sorted_table = state_table.drop_columns(["year", "state"]).sort_by(
+        [(col, "ascending") for col in DATASET_SORT_COLUMNS]
+    )
+    pq.write_table(
+        sorted_table,
+        path,
+        row_group_size=DATASET_ROW_GROUP_SIZE,
+        compression="snappy",
+        version="2.6",
+    )
+
+    # Nulls are sorted last, and aren't indexed.
+    plant_ids = sorted_table["plant_id_eia"].drop_null().to_numpy()
+    plants, first_rows = np.unique(plant_ids, return_index=True)
+    last_rows = np.append(first_rows[1:], len(plant_ids)) - 1
+    return pa.table(
+        {
+            "plant_id_eia": pa.array(plants, type=pa.int32()),
+            "year": pa.array(np.full(len(plants), year), type=pa.int32()),
+            "state": pa.array(np.full(len(plants), state), type=pa.string()),
+            "path": pa.array(
+                np.full(len(plants), path.relative_to(dataset_dir.parent).as_posix()),
+                type=pa.string(),
+            ),
+            "row_group_start": pa.array(
+                first_rows // DATASET_ROW_GROUP_SIZE, type=pa.int32()
+            ),
+            "row_group_stop": pa.array(
+                last_rows // DATASET_ROW_GROUP_SIZE + 1, type=pa.int32()
+            ),
+        }
+    )
+
+
+def _quarter_fingerprints(year_partition: YearPartitions) -> dict[str, Any] | None:
+    """The fingerprints of the processed quarters in a year, if they're all known.
+
+    The size and modification time of each quarter's file are included, so quarters
+    that were processed again are never considered unchanged.
+    """
+    fingerprints = {}
+    for year_quarter in sorted(year_partition.year_quarters):
+        manifest = _read_manifest(
+            _partitioned_path() / f"epacems-{year_quarter}.parquet"
+        )
+        if manifest is None:
+            return None
+        fingerprints[year_quarter] = {
+            "fingerprint": manifest["fingerprint"],
+            "file": manifest["file"],
+        }
+    return fingerprints
+
+
 @op
 def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
     """Read partitions into memory and write to a single monolithic output.
 
+    The monolithic output has one row group per year and state. The row groups of
+    years whose quarters all have the same fingerprints as when the existing output
+    was written are copied from it byte for byte, and only the other years are
+    rebuilt from the partitioned outputs.
+
+    The same data is also written to a hive-partitioned ``epacems`` dataset, with one
+    file per year and state sorted by plant, and a plant index in each ``year=``
+    directory that :func:`pudl.output.epacems.epacems` uses to read only the row
+    groups of the requested plants.
+
     Args:
         context: dagster keyword that provides access to resources and config.
         partitions: Year and state combinations in the output database.
     """
-    partitioned_path = _partitioned_path()
     monolithic_path = (
         PudlPaths().output_dir / "parquet" / "core_epacems__hourly_emissions.parquet"
     )
+    dataset_path = PudlPaths().output_dir / "epacems"
     schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    partitions = sorted(
+        partitions,
+        key=lambda p: min(
+            EpaCemsPartition(year_quarter=yq).year for yq in p.year_quarters
+        ),
+    )
 
-    with pq.ParquetWriter(
-        where=monolithic_path, schema=schema, compression="snappy", version="2.6"
-    ) as monolithic_writer:
-        for year_partition in partitions:
-            for state in EPACEMS_STATES:
-                monolithic_writer.write_table(
-                    # Concat a slice of each state's data from all quarters in a year
-                    # and write to parquet to create year-state row groups
-                    pa.concat_tables(
-                        [
-                            pq.read_table(
-                                source=partitioned_path
-                                / f"epacems-{year_quarter}.parquet",
-                                filters=[[("state", "=", state.upper())]],
-                                schema=schema,
-                            )
-                            for year_quarter in year_partition.year_quarters
-                        ]
-                    )
+    manifest = _read_manifest(monolithic_path)
+    previous_years = {} if manifest is None else manifest["years"]
+    years = {
+        str(EpaCemsPartition(year_quarter=min(p.year_quarters)).year): {
+            "quarters": _quarter_fingerprints(p)
+        }
+        for p in partitions
+    }
+    reusable_years = {
+        year
+        for year, entry in years.items()
+        if entry["quarters"] is not None
+        and entry["quarters"] == previous_years.get(year, {}).get("quarters")
+        and (dataset_path / f"year={year}" / PLANT_INDEX_FILENAME).exists()
+    }
+    if reusable_years == set(years) and list(previous_years) == list(years):
+        logger.info("EPA CEMS partitions are unchanged, not consolidating them again.")
+        return
+
+    with tempfile.TemporaryDirectory(dir=monolithic_path.parent) as tmp_dir:
+        sources = []
+        n_row_groups = 0
+        for year_partition, (year, entry) in zip(
+            partitions, years.items(), strict=True
+        ):
+            if year in reusable_years:
+                logger.info(f"Reusing consolidated EPA CEMS data for {year}.")
+                row_groups = list(range(*previous_years[year]["row_groups"]))
+                sources.append((monolithic_path, row_groups))
+            else:
+                logger.info(f"Consolidating EPA CEMS data for {year}.")
+                year_path = Path(tmp_dir) / f"{year}.parquet"
+                _write_year_state_row_groups(
+                    year_path,
+                    year_partition,
+                    schema,
+                    dataset_dir=Path(tmp_dir) / f"year={year}",
                 )
+                row_groups = list(range(pq.ParquetFile(year_path).num_row_groups))
+                sources.append((year_path, row_groups))
+            entry["row_groups"] = [n_row_groups, n_row_groups + len(row_groups)]
+            n_row_groups += len(row_groups)
+
+        new_path = Path(tmp_dir) / monolithic_path.name
+        if sources:
+            splice_row_groups(sources, new_path)
+        else:
+            pq.write_table(
+                schema.empty_table(), new_path, compression="snappy", version="2.6"
+            )
+        _manifest_path(monolithic_path).unlink(missing_ok=True)
+        new_path.replace(monolithic_path)
+
+        dataset_path.mkdir(parents=True, exist_ok=True)
+        for year_dir in dataset_path.glob("year=*"):
+            if year_dir.name.removeprefix("year=") not in reusable_years:
+                shutil.rmtree(year_dir)
+        for year in years.keys() - reusable_years:
+            (Path(tmp_dir) / f"year={year}").replace(dataset_path / f"year={year}")
+    _write_manifest(monolithic_path, years=years)
 
 
 @graph_asset
@@ -164,38 +599,67 @@ def core_epacems__hourly_emissions(
     https://docs.dagster.io/concepts/ops-jobs-graphs/dynamic-graphs.
     """
     years = get_years_from_settings()
-    partitions = years.map(
-        lambda year: process_single_year(
-            year,
-            _core_epa__assn_eia_epacamd_unique,
-            core_eia__entity_plants,
-        )
+    lookups_path = build_transform_lookups(
+        _core_epa__assn_eia_epacamd_unique, core_eia__entity_plants
     )
+    partitions = years.map(lambda year: process_single_year(year, lookups_path))
     return consolidate_partitions(partitions.collect())
 
 
+@multi_asset(
+    outs={
+        f"out_epacems__{freq}_emissions_by_{grain}": AssetOut(
+            io_manager_key="parquet_io_manager"
+        )
+        for freq in pudl.transform.epacems.ROLLUP_FREQUENCIES
+        for grain in ["plant", "unit"]
+    },
+    deps=["core_epacems__hourly_emissions"],
+    required_resource_keys={"dataset_settings"},
+    compute_kind="pandas",
+)
+def out_epacems__emissions_rollups(context):
+    """Sum EPA CEMS emissions by unit and plant over days, months and years.
+
+    The daily emissions of each unit were already summed by :func:`process_single_year`
+    while each quarter of hourly data was in memory, so the rollups are built from
+    those much smaller tables rather than from the hourly records.
+    """
+    epacems_settings = context.resources.dataset_settings.epacems
+    unit_days = pd.concat(
+        [
+            pd.read_parquet(_rollup_path(year_quarter))
+            for year_quarter in sorted(epacems_settings.year_quarters)
+        ],
+        ignore_index=True,
+    )
+    for freq, unit in pudl.transform.epacems.ROLLUP_FREQUENCIES.items():
+        for grain, keys in [
+            ("plant", pudl.transform.epacems.ROLLUP_PLANT_KEYS),
+            ("unit", pudl.transform.epacems.ROLLUP_UNIT_KEYS),
+        ]:
+            yield Output(
+                output_name=f"out_epacems__{freq}_emissions_by_{grain}",
+                value=pudl.transform.epacems.rollup_emissions(unit_days, unit, keys),
+            )
+
+
 @asset(
     ins={
         "core_epacems__hourly_emissions": AssetIn(
             input_manager_key="epacems_io_manager"
         ),
     },
-    compute_kind="Dask",
+    compute_kind="DuckDB",
 )
 def _core_epacems__emissions_unit_ids(
-    core_epacems__hourly_emissions: dd.DataFrame,
+    core_epacems__hourly_emissions: EpaCemsDataset,
 ) -> pd.DataFrame:
     """Make unique annual plant_id_eia and emissions_unit_id_epa.
 
     Returns:
         dataframe with unique set of: "plant_id_eia", "year" and "emissions_unit_id_epa"
     """
-    epacems_ids = (
-        core_epacems__hourly_emissions[
-            ["plant_id_eia", "year", "emissions_unit_id_epa"]
-        ]
-        .drop_duplicates()
-        .compute()
+    return core_epacems__hourly_emissions.distinct(
+        ["plant_id_eia", "year", "emissions_unit_id_epa"]
     )
-
-    return epacems_ids
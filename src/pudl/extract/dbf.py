@@ -3,14 +3,18 @@
 import contextlib
 import csv
 import importlib.resources
+import itertools
+import os
 import warnings
 import zipfile
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import IO, Any, Protocol, Self
 
+import numpy as np
 import pandas as pd
 import sqlalchemy as sa
 from dagster import op
@@ -185,7 +189,7 @@ class FercDbfArchive:
             table_name: name of the table.
         """
         sch = self.get_table_schema(table_name)
-        df = pd.DataFrame(iter(self.get_table_dbf(table_name)))
+        df = decode_dbf(self.get_table_dbf(table_name))
         df = df.drop("_NullFlags", axis=1, errors="ignore").rename(
             sch.get_column_rename_map(), axis=1
         )
@@ -247,6 +251,178 @@ class FercFieldParser(FieldParser):
         return super().parseN(field, data)
 
 
+_LOGICAL_VALUES = np.full(256, -1, dtype=np.int8)
+_LOGICAL_VALUES[list(b"TtYy")] = 1
+_LOGICAL_VALUES[list(b"FfNn")] = 0
+_LOGICAL_VALUES[list(b"? \0")] = 2
+"""Lookup table from the byte of a logical field to False (0), True (1) or None (2).
+
+Any other byte (-1) is invalid.
+"""
+
+
+def _decode_numeric(values: np.ndarray, ferc_cleanup: bool) -> np.ndarray | None:
+    """Decode N field values like FieldParser.parseN or FercFieldParser.parseN.
+
+    Returns None if any values need to be handled by the original parser.
+    """
+    values = np.char.strip(values)
+    if ferc_cleanup:
+        values = np.char.lstrip(np.char.strip(values, b"*\x00"), b"0")
+        values = np.where(values == b".", b"0", values)
+        values = np.char.strip(values)
+    # int() and float() ignore any whitespace left after stripping the padding.
+    values = np.char.strip(np.char.strip(values, b"*\x00"))
+    empty = values == b""
+    if empty.all():
+        return np.full(len(values), None, dtype=object)
+    if np.char.count(values, b"_").any():
+        # Python allows underscores between digits, which NumPy doesn't know about.
+        return None
+    digits = np.char.lstrip(values, b"+-")
+    is_int = np.char.isdigit(digits) & (
+        np.char.str_len(values) - np.char.str_len(digits) <= 1
+    )
+    if (np.char.str_len(digits[is_int]) > 18).any():
+        # Python ints that may not fit in an int64 leave the column as objects.
+        return None
+    is_float = ~(empty | is_int)
+    if not (is_float | empty).any():
+        return values.astype(np.int64)
+    try:
+        floats = np.char.replace(values[is_float], b",", b".").astype(np.float64)
+    except ValueError:
+        return None
+    decoded = np.full(len(values), np.nan)
+    decoded[is_int] = values[is_int].astype(np.int64)
+    decoded[is_float] = floats
+    return decoded
+
+
+def _decode_float(values: np.ndarray) -> np.ndarray | None:
+    """Decode F field values like FieldParser.parseF."""
+    values = np.char.strip(np.char.strip(values), b"*")
+    empty = values == b""
+    if empty.all():
+        return np.full(len(values), None, dtype=object)
+    if np.char.count(values, b"_").any():
+        return None
+    try:
+        floats = values[~empty].astype(np.float64)
+    except ValueError:
+        return None
+    decoded = np.full(len(values), np.nan)
+    decoded[~empty] = floats
+    return decoded
+
+
+def _parse_unique(parser: FieldParser, field, raw: np.ndarray) -> list:
+    """Parse each distinct value of a field once with the DBF's own field parser.
+
+    Dates, codes and other low cardinality fields only have a handful of distinct
+    values, even in tables with millions of records. The values are returned as a
+    list so that pandas infers the column type just like it does for records.
+    """
+    uniques, inverse = np.unique(
+        np.ascontiguousarray(raw).view(f"V{field.length}").ravel(), return_inverse=True
+    )
+    parsed = np.empty(len(uniques), dtype=object)
+    parsed[:] = [parser.parse(field, value.tobytes()) for value in uniques]
+    return parsed[inverse].tolist()
+
+
+def _decode_logical(raw: np.ndarray) -> np.ndarray | None:
+    """Decode single byte L field values like FieldParser.parseL."""
+    codes = _LOGICAL_VALUES[raw[:, 0]]
+    if (codes < 0).any():
+        return None
+    if (codes == 2).any():
+        return np.array([False, True, None], dtype=object)[codes]
+    return codes.astype(bool)
+
+
+def _decode_field(dbf: DBF, field, raw: np.ndarray) -> np.ndarray | None:
+    """Decode the values of one field from a 2D array of their raw bytes.
+
+    Returns None if the field type isn't supported, or the table uses a field parser
+    that overrides how it is parsed.
+    """
+    parse_method = getattr(dbf.parserclass, f"parse{field.type}", None)
+    values = np.ascontiguousarray(raw).view(f"S{field.length}").ravel()
+    if field.type == "C" and parse_method is FieldParser.parseC:
+        return np.char.decode(
+            np.char.rstrip(values, b"\x00 "), dbf.encoding, dbf.char_decode_errors
+        ).astype(object)
+    if field.type == "N" and parse_method is FieldParser.parseN:
+        return _decode_numeric(values, ferc_cleanup=False)
+    if field.type == "N" and parse_method is FercFieldParser.parseN:
+        return _decode_numeric(values, ferc_cleanup=True)
+    if field.type == "F" and parse_method is FieldParser.parseF:
+        return _decode_float(values)
+    if field.type == "L" and parse_method is FieldParser.parseL and field.length == 1:
+        return _decode_logical(raw)
+    if field.type == "I" and parse_method is FieldParser.parseI and field.length == 4:
+        return np.ascontiguousarray(raw).view("<i4").ravel().astype(np.int64)
+    if field.type == "0" and parse_method is FieldParser.parse0:
+        return np.array([row.tobytes() for row in raw], dtype=object)
+    return None
+
+
+def decode_dbf(dbf: DBF) -> pd.DataFrame:
+    """Decode all records of a DBF table into a dataframe one column at a time.
+
+    This produces the same dataframe as ``pd.DataFrame(iter(dbf))``, without
+    creating a Python dict per record. The fixed width record block is read into a
+    NumPy array, and the character, numeric, float, logical, integer and
+    ``_NullFlags`` fields are decoded in bulk. Columns of any other type, including
+    dates, or containing values the bulk decoding doesn't handle identically, are
+    decoded by parsing each distinct value once with the DBF's own field parser.
+
+    Args:
+        dbf: the table to decode.
+    """
+    with dbf.dbf_bytes() as infile:
+        infile.seek(dbf.header.headerlen)
+        block = infile.read()
+    record_len = dbf.header.recordlen
+    field_names = [field.name for field in dbf.fields]
+    n_records, tail = divmod(len(block), record_len)
+    records = np.frombuffer(
+        block, dtype=np.uint8, count=n_records * record_len
+    ).reshape(n_records, record_len)
+    (eof,) = np.nonzero(records[:, 0] == 0x1A)
+    if eof.size:
+        records = records[: eof[0]]
+    if (
+        (not eof.size and tail and block[-tail] == ord(" "))
+        or sum(field.length for field in dbf.fields) + 1 != record_len
+        or len(set(field_names)) != len(field_names)
+        or (
+            # Memo values are only decoded here if there's no memo file to look in.
+            getattr(dbf, "memofilename", True)
+            and any(field.type in "MGBP" for field in dbf.fields)
+        )
+    ):
+        # Truncated or unusual tables are left to the record by record reader.
+        return pd.DataFrame(iter(dbf))
+    # Only records flagged with a space are valid; "*" marks deleted records.
+    records = records[records[:, 0] == ord(" ")]
+    if not len(records):
+        return pd.DataFrame()
+
+    parser = dbf.parserclass(dbf)
+    columns = {}
+    offset = 1
+    for field in dbf.fields:
+        raw = records[:, offset : offset + field.length]
+        offset += field.length
+        decoded = _decode_field(dbf, field, raw)
+        if decoded is None:
+            decoded = _parse_unique(parser, field, raw)
+        columns[field.name] = decoded
+    return pd.DataFrame(columns)
+
+
 DBF_TYPES = {
     "C": sa.String,
     "D": sa.Date,
@@ -396,6 +572,25 @@ class FercDbfReader:
         return dfs
 
 
+_worker_dbf_reader: AbstractFercDbfReader | None = None
+"""The DBF reader of a :meth:`FercDbfExtractor.iter_table_dfs` worker process."""
+
+
+def _init_dbf_worker(extractor_class: type["FercDbfExtractor"], cache_path: Path):
+    """Sets up the DBF reader used by the tasks run in this worker process."""
+    global _worker_dbf_reader
+    _worker_dbf_reader = extractor_class.get_dbf_reader(
+        Datastore(local_cache_path=cache_path)
+    )
+
+
+def _load_table_partition(
+    table_name: str, partition: dict[str, Any]
+) -> list[PartitionedDataFrame]:
+    """Decodes one table from one partition in a worker process."""
+    return _worker_dbf_reader.load_table_dfs(table_name, [partition])
+
+
 class FercDbfExtractor:
     """Generalized class for loading data from foxpro databases into SQLAlchemy.
 
@@ -426,12 +621,15 @@ class FercDbfExtractor:
 
     DATABASE_NAME = None
     DATASET = None
+    TABLES_AHEAD = 2
+    """Number of tables decoded ahead of the one being written, when using workers."""
 
     def __init__(
         self,
         datastore: Datastore,
         settings: FercToSqliteSettings,
         output_path: Path,
+        workers: int | None = 1,
     ):
         """Constructs new instance of FercDbfExtractor.
 
@@ -439,10 +637,14 @@ class FercDbfExtractor:
             datastore: top-level datastore instance for accessing raw data files.
             settings: generic settings object for this extrctor.
             output_path: directory where the output databases should be stored.
+            workers: number of worker processes decoding the DBF tables of each year.
+                If None, the number of CPUs is used. With a single worker, all tables
+                are decoded in the current process.
         """
         self.settings: GenericDatasetSettings = self.get_settings(settings)
         self.output_path = output_path
         self.datastore = datastore
+        self.workers = workers
         self.dbf_reader = self.get_dbf_reader(datastore)
         self.sqlite_engine = sa.create_engine(self.get_db_path())
         self.sqlite_meta = sa.MetaData()
@@ -456,9 +658,10 @@ class FercDbfExtractor:
             "get_settings() needs to extract dataset specific settings."
         )
 
-    def get_dbf_reader(self, datastore: Datastore) -> AbstractFercDbfReader:
+    @classmethod
+    def get_dbf_reader(cls, datastore: Datastore) -> AbstractFercDbfReader:
         """Returns appropriate instance of AbstractFercDbfReader to access the data."""
-        return FercDbfReader(datastore, dataset=self.DATASET)
+        return FercDbfReader(datastore, dataset=cls.DATASET)
 
     def get_db_path(self) -> str:
         """Returns the connection string for the sqlite database."""
@@ -484,6 +687,7 @@ class FercDbfExtractor:
                 datastore=context.resources.datastore,
                 settings=context.resources.ferc_to_sqlite_settings,
                 output_path=PudlPaths().output_dir,
+                workers=context.resources.runtime_settings.dbf_num_workers,
             )
             dbf_extractor.execute()
 
@@ -563,6 +767,58 @@ class FercDbfExtractor:
             aggregated_df = pd.concat([df.df for df in dfs])
         return aggregated_df
 
+    def iter_table_dfs(
+        self, partitions: list[dict[str, Any]]
+    ) -> Iterator[tuple[str, list[PartitionedDataFrame]]]:
+        """Yields the partitioned data frames of each table, in table order.
+
+        With more than one worker, each (table, partition) pair is decoded in a pool of
+        worker processes, while the tables are yielded here in the same order as they
+        would be decoded serially. Only :attr:`TABLES_AHEAD` tables are decoded ahead of
+        the one being consumed, whatever the number of workers, to bound the memory used
+        by finished but not yet written tables.
+
+        The workers read the archives from the local datastore cache, so without one
+        the tables are decoded in the current process.
+        """
+        tables = self.dbf_reader.get_table_names()
+        cache_path = self.datastore.local_cache_path
+        if self.workers == 1 or cache_path is None:
+            for table in tables:
+                logger.info(f"Pandas: reading {table} into a DataFrame.")
+                yield table, self.dbf_reader.load_table_dfs(table, partitions)
+            return
+
+        # Fetch the archives here, so the workers all find them in the local cache.
+        for partition in partitions:
+            self.dbf_reader.get_archive(**partition)
+        workers = self.workers or os.cpu_count()
+        logger.info(f"Decoding {self.DATASET} tables with {workers} workers.")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_dbf_worker,
+            initargs=(type(self), cache_path),
+        ) as executor:
+            pending = deque()
+
+            def submit(table: str):
+                futures = [
+                    executor.submit(_load_table_partition, table, partition)
+                    for partition in partitions
+                ]
+                pending.append((table, futures))
+
+            remaining = iter(tables)
+            for table in itertools.islice(remaining, self.TABLES_AHEAD):
+                submit(table)
+            while pending:
+                table, futures = pending.popleft()
+                logger.info(f"Pandas: reading {table} into a DataFrame.")
+                dfs = [df for future in futures for df in future.result()]
+                if (next_table := next(remaining, None)) is not None:
+                    submit(next_table)
+                yield table, dfs
+
     def load_table_data(self):
         """Loads all tables from fox pro database and writes them to sqlite."""
         partitions = [
@@ -575,11 +831,8 @@ class FercDbfExtractor:
         logger.info(
             f"Loading {self.DATASET} table data from {len(partitions)} partitions."
         )
-        for table in self.dbf_reader.get_table_names():
-            logger.info(f"Pandas: reading {table} into a DataFrame.")
-            new_df = self.aggregate_table_frames(
-                table, self.dbf_reader.load_table_dfs(table, partitions)
-            )
+        for table, dfs in self.iter_table_dfs(partitions):
+            new_df = self.aggregate_table_frames(table, dfs)
             if new_df is None or len(new_df) <= 0:
                 logger.warning(f"Table {table} contains no data, skipping.")
                 continue
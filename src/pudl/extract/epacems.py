@@ -20,10 +20,17 @@ Hence, we've called it `plant_id_epa` until it gets transformed into `plant_id_e
 during the transform process with help from the crosswalk.
 """
 
+import csv
+import io
+import itertools
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Annotated
+from typing import IO, Annotated
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
 from pydantic import BaseModel, StringConstraints
 
 import pudl.logging_helpers
@@ -135,6 +142,22 @@ API_DTYPE_DICT = {
     "Hg Controls": pd.CategoricalDtype(),
     "Program Code": pd.CategoricalDtype(),
 }
+"""Dict: The pandas dtypes of the EPA CEMS columns read from the CSV files."""
+
+CSV_BLOCK_SIZE = 2**26
+"""Number of bytes of CSV parsed into each batch of streamed EPA CEMS records."""
+
+
+def _arrow_csv_type(col: str, dtype) -> pa.DataType:
+    """The Arrow type to parse a CEMS CSV column as, to get the given pandas dtype."""
+    if col == "Date":
+        # Dates are validated while parsing, then kept as ISO strings.
+        return pa.date32()
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pa.dictionary(pa.int32(), pa.string())
+    if isinstance(dtype, pd.StringDtype):
+        return pa.string()
+    return pa.from_numpy_dtype(dtype.numpy_dtype)
 
 
 class EpaCemsPartition(BaseModel):
@@ -174,48 +197,84 @@ class EpaCemsDatastore:
 
     def get_data_frame(self, partition: EpaCemsPartition) -> pd.DataFrame:
         """Constructs dataframe from a zipfile for a given (year_quarter) partition."""
-        with (
-            self.datastore.get_zipfile_resource(
-                "epacems", **partition.get_filters()
-            ) as zf,
-            zf.open(str(partition.get_quarterly_file()), "r") as csv_file,
-        ):
-            df = self._csv_to_dataframe(
-                csv_file,
-                ignore_cols=API_IGNORE_COLS,
-                rename_dict=API_RENAME_DICT,
-                dtype_dict=API_DTYPE_DICT,
-            )
-        return df
-
-    def _csv_to_dataframe(
+        df = pd.concat(self.iter_data_frames(partition), ignore_index=True)
+        # Categories differ between batches, which makes them object columns.
+        dtypes = {
+            API_RENAME_DICT[col]: dtype
+            for col, dtype in API_DTYPE_DICT.items()
+            if API_RENAME_DICT[col] in df.columns
+        }
+        return df.astype(dtypes)
+
+    def iter_data_frames(
+        self, partition: EpaCemsPartition, block_size: int = CSV_BLOCK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """Stream the records of a (year_quarter) partition in dataframe batches.
+
+        The quarterly CSV is decompressed and parsed incrementally, so only one batch
+        of records is held in memory at a time, however large the quarter is.
+
+        Args:
+            partition: the quarter to read.
+            block_size: number of bytes of CSV to parse into each batch.
+        """
+        with self.datastore.get_zipfile_resource(
+            "epacems", **partition.get_filters()
+        ) as zf:
+            csv_name = str(partition.get_quarterly_file())
+            with zf.open(csv_name, "r") as csv_file:
+                header = next(csv.reader(io.TextIOWrapper(csv_file, encoding="utf-8")))
+            with zf.open(csv_name, "r") as csv_file:
+                yield from self._csv_to_data_frames(
+                    csv_file,
+                    columns=[col for col in header if col not in API_IGNORE_COLS],
+                    rename_dict=API_RENAME_DICT,
+                    dtype_dict=API_DTYPE_DICT,
+                    block_size=block_size,
+                )
+
+    def _csv_to_data_frames(
         self,
-        csv_path: Path,
-        ignore_cols: dict[str, str],
+        csv_file: IO[bytes],
+        columns: list[str],
         rename_dict: dict[str, str],
         dtype_dict: dict[str, type],
-        chunksize: int = 100_000,
-    ) -> pd.DataFrame:
-        """Convert a CEMS csv file into a :class:`pandas.DataFrame`.
+        block_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Convert a CEMS csv file into a stream of :class:`pandas.DataFrame` batches.
 
         Args:
-            csv_path: Path to CSV file containing data to read.
+            csv_file: CSV file containing data to read.
+            columns: the columns to read from the CSV file.
+            rename_dict: new names of the columns.
+            dtype_dict: pandas dtypes of the columns.
+            block_size: number of bytes of CSV to parse into each batch.
 
-        Returns:
-            A DataFrame containing the filtered and dtyped contents of the CSV file.
+        Yields:
+            DataFrames containing the filtered and dtyped contents of the CSV file.
         """
-        chunk_iter = pd.read_csv(
-            csv_path,
-            index_col=False,
-            usecols=lambda col: col not in ignore_cols,
-            dtype=dtype_dict,
-            chunksize=chunksize,
-            low_memory=True,
-            parse_dates=["Date"],
+        reader = pa_csv.open_csv(
+            csv_file,
+            read_options=pa_csv.ReadOptions(block_size=block_size),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types={
+                    col: _arrow_csv_type(col, dtype)
+                    for col, dtype in dtype_dict.items()
+                    if col in columns
+                },
+                strings_can_be_null=True,
+            ),
         )
-        df = pd.concat(chunk_iter)
-        dtypes = {k: v for k, v in dtype_dict.items() if k in df.columns}
-        return df.astype(dtypes).rename(columns=rename_dict)
+        dtypes = {k: v for k, v in dtype_dict.items() if k in columns}
+        for batch in reader:
+            if "Date" in columns:
+                batch = batch.set_column(
+                    columns.index("Date"),
+                    "Date",
+                    pc.strftime(batch.column("Date"), format="%Y-%m-%d"),
+                )
+            yield batch.to_pandas().astype(dtypes).rename(columns=rename_dict)
 
 
 def extract(year_quarter: str, ds: Datastore) -> pd.DataFrame:
@@ -240,3 +299,32 @@ def extract(year_quarter: str, ds: Datastore) -> pd.DataFrame:
         res = Resource.from_id("core_epacems__hourly_emissions")
         df = res.format_df(pd.DataFrame())
     return df
+
+
+def extract_batches(
+    year_quarter: str, ds: Datastore, block_size: int = CSV_BLOCK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Stream EPA CEMS hourly DataFrames for a quarter in bounded-size batches.
+
+    Args:
+        year_quarter: report year and quarter of the data to extract
+        ds: Initialized datastore
+        block_size: number of bytes of CSV to parse into each batch.
+
+    Yields:
+        Consecutive batches of records from a single quarter of EPA CEMS hourly
+        emissions data. If the quarter is not found, no batches are yielded.
+    """
+    partition = EpaCemsPartition(year_quarter=year_quarter)
+    logger.info(f"Extracting data frames for {year_quarter}")
+    batches = EpaCemsDatastore(ds).iter_data_frames(partition, block_size)
+    try:
+        first_batch = next(batches, None)
+    except KeyError:
+        logger.warning(f"No data found for {year_quarter}.")
+        return
+    if first_batch is None:
+        return
+    # We have to assign the reporting year for partitioning purposes
+    for df in itertools.chain([first_batch], batches):
+        yield df.assign(year=partition.year)
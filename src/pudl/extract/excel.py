@@ -1,18 +1,93 @@
 """Load excel metadata CSV files form a python data package."""
 
+import datetime as dt
 import pathlib
 import re
+from decimal import Decimal
 from io import BytesIO
+from typing import IO, Any
 
 import dbfread
 import pandas as pd
+from pandas.io.parsers import TextParser
 
 import pudl
 from pudl.extract.extractor import GenericExtractor, GenericMetadata, PartitionSelection
+from pudl.workspace.datastore import Datastore
+from pudl.workspace.frame_cache import DataFrameCache
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
 
+def _excel_cell(value: Any) -> Any:
+    """Convert a value decoded from a DBF file into what it would be in a spreadsheet.
+
+    This mirrors how :func:`pandas.read_excel` reports spreadsheet cells: empty cells
+    are empty strings, whole numbers are ints and dates are timestamps.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float | Decimal):
+        value = float(value)
+        return int(value) if value.is_integer() else value
+    if isinstance(value, dt.date):
+        return pd.Timestamp(value)
+    return value
+
+
+def read_dbf_cells(filename: str, dbf_file: IO[bytes]) -> list[list[Any]]:
+    """Read a DBF file into rows of spreadsheet cells, starting with a header row.
+
+    Records are decoded as tuples rather than dicts, and the values are converted
+    one column at a time, only touching the columns whose types need converting.
+
+    Args:
+        filename: name of the DBF file.
+        dbf_file: open file containing the DBF table.
+
+    Returns:
+        The field names followed by the values of each record, as they would appear if
+        the table had been written to a spreadsheet.
+    """
+    dbf = dbfread.DBF(
+        filename,
+        filedata=dbf_file,
+        recfactory=lambda items: tuple(value for _, value in items),
+    )
+    columns = []
+    for column in zip(*dbf, strict=True):
+        if set(map(type, column)) <= {str, int, bool}:
+            columns.append(column)
+        else:
+            columns.append(tuple(map(_excel_cell, column)))
+    rows = [list(row) for row in zip(*columns, strict=True)]
+    # Spreadsheets have no trailing empty rows.
+    while rows and all(cell == "" for cell in rows[-1]):
+        rows.pop()
+    return [list(dbf.field_names), *rows]
+
+
+def parse_cells(
+    cells: list[list[Any]], skiprows: int = 0, skipfooter: int = 0, dtype=None
+) -> pd.DataFrame:
+    """Parse rows of spreadsheet cells into a dataframe like :func:`pd.read_excel`.
+
+    This uses the same parser and options :func:`pandas.read_excel` applies to the
+    cells of a sheet, so column types, missing values and the header, skiprows,
+    skipfooter and dtype arguments are handled identically.
+    """
+    if not cells:
+        return pd.DataFrame()
+    return TextParser(
+        cells,
+        header=0,
+        dtype=dtype,
+        skiprows=skiprows,
+        skipfooter=skipfooter,
+        skip_blank_lines=False,
+    ).read()
+
+
 class ExcelMetadata(GenericMetadata):
     """Load Excel metadata from Python package data.
 
@@ -123,19 +198,33 @@ class ExcelExtractor(GenericExtractor):
 
     5. get_datapackage_resources() if partition is anything other than a year,
     this method should be overwritten in the dataset-specific extractor.
+
+    Parsed pages are stored in a :class:`pudl.workspace.frame_cache.DataFrameCache`
+    alongside the datastore's local file cache, so that later runs and other processes
+    extracting the same pages don't need to parse the spreadsheets again.
     """
 
     METADATA: ExcelMetadata = None
 
-    def __init__(self, ds):
+    def __init__(self, ds, sheet_cache: DataFrameCache | None = None):
         """Create new extractor object and load metadata.
 
         Args:
             ds (datastore.Datastore): An initialized datastore, or subclass
+            sheet_cache: cache of parsed pages. Defaults to a cache in the
+                ``_decoded/excel`` subdirectory of the datastore's local cache, if it
+                has one.
         """
         super().__init__(ds)
         self._metadata = self.METADATA
         self._file_cache = {}
+        if (
+            sheet_cache is None
+            and isinstance(ds, Datastore)
+            and ds.local_cache_path is not None
+        ):
+            sheet_cache = DataFrameCache(ds.local_cache_path / "_decoded" / "excel")
+        self._sheet_cache = sheet_cache
 
     def process_raw(
         self, df: pd.DataFrame, page: str, **partition: PartitionSelection
@@ -210,38 +299,60 @@ class ExcelExtractor(GenericExtractor):
             pd.DataFrame instance with the parsed Excel spreadsheet frame
         """
         xlsx_filename = self.source_filename(page, **partition)
+        resource_partitions = self.zipfile_resource_partitions(page, **partition)
+        read_excel_kwargs = {
+            "sheet_name": self._metadata.get_sheet_name(page, **partition),
+            "skiprows": self._metadata.get_skiprows(page, **partition),
+            "skipfooter": self._metadata.get_skipfooter(page, **partition),
+            "dtype": self.get_dtypes(page, **partition),
+        }
+
+        cache_key = None
+        if self._sheet_cache is not None:
+            res = self.ds.get_unique_resource_key(
+                self._dataset_name, **resource_partitions
+            )
+            cache_key = {
+                "doi": res.doi,
+                "resource": res.name,
+                "filename": xlsx_filename,
+                # Parsing may change between pandas releases.
+                "pandas": pd.__version__,
+                **read_excel_kwargs,
+            }
+            df = self._sheet_cache.get(cache_key)
+            if df is not None:
+                return df
 
         if xlsx_filename not in self._file_cache:
-            excel_file = None
             with self.ds.get_zipfile_resource(
-                self._dataset_name,
-                **self.zipfile_resource_partitions(page, **partition),
+                self._dataset_name, **resource_partitions
             ) as zf:
-                # If loading the excel file from the zip fails then try to open a dbf file.
+                # A few early EIA pages are distributed as DBF rather than Excel files.
                 extension = pathlib.Path(xlsx_filename).suffix.lower()
                 if extension == ".dbf":
-                    with zf.open(xlsx_filename) as dbf_filepath:
-                        df = pd.DataFrame(
-                            iter(dbfread.DBF(xlsx_filename, filedata=dbf_filepath))
-                        )
-                        excel_file = pudl.helpers.convert_df_to_excel_file(
-                            df, index=False
-                        )
+                    with zf.open(xlsx_filename) as dbf_file:
+                        source = read_dbf_cells(xlsx_filename, dbf_file)
                 else:
-                    excel_file = pd.ExcelFile(
+                    source = pd.ExcelFile(
                         BytesIO(zf.read(xlsx_filename)), engine="calamine"
                     )
-            self._file_cache[xlsx_filename] = excel_file
+            self._file_cache[xlsx_filename] = source
         # TODO(rousik): this _file_cache could be replaced with @cache or @memoize annotations
-        excel_file = self._file_cache[xlsx_filename]
-
-        return pd.read_excel(
-            excel_file,
-            sheet_name=self._metadata.get_sheet_name(page, **partition),
-            skiprows=self._metadata.get_skiprows(page, **partition),
-            skipfooter=self._metadata.get_skipfooter(page, **partition),
-            dtype=self.get_dtypes(page, **partition),
-        )
+        source = self._file_cache[xlsx_filename]
+
+        if isinstance(source, pd.ExcelFile):
+            df = pd.read_excel(source, **read_excel_kwargs)
+        else:
+            df = parse_cells(
+                source,
+                skiprows=read_excel_kwargs["skiprows"],
+                skipfooter=read_excel_kwargs["skipfooter"],
+                dtype=read_excel_kwargs["dtype"],
+            )
+        if cache_key is not None:
+            self._sheet_cache.add(cache_key, df)
+        return df
 
     def source_filename(self, page: str, **partition: PartitionSelection) -> str:
         """Produce the xlsx document file name as it will appear in the archive.
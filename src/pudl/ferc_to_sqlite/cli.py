@@ -83,6 +83,17 @@ def ferc_to_sqlite_job_factory(
         "Defaults to using the number of CPUs."
     ),
 )
+@click.option(
+    "--dbf-workers",
+    type=int,
+    default=4,
+    show_default=True,
+    help=(
+        "Number of worker processes to use when decoding DBF tables. If set to 1, "
+        "the tables are decoded in the main process. If set to 0, the number of "
+        "CPUs is used."
+    ),
+)
 @click.option(
     "--dagster-workers",
     type=int,
@@ -138,6 +149,7 @@ def main(
     etl_settings_yml: pathlib.Path,
     batch_size: int,
     workers: int | None,
+    dbf_workers: int,
     dagster_workers: int,
     gcs_cache_path: str,
     logfile: pathlib.Path,
@@ -178,6 +190,7 @@ def main(
                 "config": {
                     "xbrl_num_workers": workers,
                     "xbrl_batch_size": batch_size,
+                    "dbf_num_workers": dbf_workers or None,
                 },
             },
         },
@@ -1,13 +1,18 @@
 """Dagster IO Managers."""
 
+import itertools
+import operator
 import re
+from collections.abc import Callable
 from pathlib import Path
 from sqlite3 import sqlite_version
 from typing import Any
 
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 import sqlalchemy as sa
 from alembic.autogenerate.api import compare_metadata
@@ -27,12 +32,38 @@ from upath import UPath
 import pudl
 from pudl.metadata import PUDL_PACKAGE
 from pudl.metadata.classes import Package, Resource
+from pudl.output.epacems import EpaCemsDataset
 from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
 MINIMUM_SQLITE_VERSION = "3.32.0"
 
+SQLITE_BULK_LOAD_PRAGMAS: dict[str, str] = {
+    "journal_mode": "OFF",
+    "synchronous": "OFF",
+    "foreign_keys": "OFF",
+}
+"""Connection PRAGMAs used while bulk loading a table into SQLite.
+
+Turning off the rollback journal and fsyncs makes the load much faster, at the cost of
+leaving the table (or the whole database, if the process crashes mid-write) in an
+undefined state if the load fails. That's acceptable for the ETL outputs, which are
+rebuilt from scratch when something goes wrong. Foreign key constraints are checked
+after the ETL finishes by :mod:`pudl.etl.check_foreign_keys`.
+"""
+
+SQLITE_BULK_LOAD_BATCH_SIZE: int = 100_000
+"""Number of rows passed to each ``executemany`` call during bulk loads."""
+
+PARQUET_ROW_GROUP_SIZE: int = 250_000
+"""Maximum number of rows in each row group of the parquet files we write.
+
+Tables are written one row group at a time, sorted by their primary key, so this also
+bounds the amount of data that's converted to Arrow at once, and lets readers skip
+row groups using their min/max statistics.
+"""
+
 
 def get_table_name_from_context(context: OutputContext) -> str:
     """Retrieves the table name from the context object."""
@@ -42,6 +73,156 @@ def get_table_name_from_context(context: OutputContext) -> str:
     return context.get_identifier()
 
 
+def _to_sqlite_values(column: pa.Array, sa_type: sa.types.TypeEngine) -> list:
+    """Convert an Arrow array into a list of values the sqlite3 driver can bind.
+
+    Dictionary encoded (categorical) columns are decoded into plain strings, and dates
+    and datetimes are rendered as ISO 8601 strings, matching how the SQLAlchemy column
+    types in :data:`pudl.metadata.constants.FIELD_DTYPES_SQL` store them. Datetimes
+    are stored with whole second resolution.
+
+    Args:
+        column: Arrow array (or chunked array) holding a single column of a batch.
+        sa_type: SQLAlchemy type of the database column the values are written to.
+    """
+    if pa.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+    if pa.types.is_timestamp(column.type):
+        # Arrow renders fractional seconds with %S unless the unit is seconds.
+        column = column.cast(pa.timestamp("s", tz=column.type.tz), safe=False)
+    if pa.types.is_date(column.type) or pa.types.is_timestamp(column.type):
+        date_format = (
+            "%Y-%m-%d" if isinstance(sa_type, sa.Date) else "%Y-%m-%d %H:%M:%S"
+        )
+        column = pc.strftime(column, format=date_format)
+    # Going through numpy is much faster than Array.to_pylist(), but numeric arrays
+    # with nulls would come back as floats with NaN in place of the nulls.
+    if column.null_count and (
+        pa.types.is_integer(column.type)
+        or pa.types.is_floating(column.type)
+        or pa.types.is_boolean(column.type)
+    ):
+        values = column.fill_null(False if pa.types.is_boolean(column.type) else 0)
+        values = values.to_numpy(zero_copy_only=False).astype(object)
+        values[column.is_null().to_numpy(zero_copy_only=False)] = None
+        return values.tolist()
+    return column.to_numpy(zero_copy_only=False).tolist()
+
+
+READ_FILTER_OPERATORS: dict[str, Callable[[sa.Column, Any], sa.ColumnElement]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda col, values: col.in_(values),
+    "not in": lambda col, values: col.not_in(values),
+}
+"""Row filter operators that can be pushed down into IO manager reads.
+
+These are the operators supported by the ``filters`` argument of
+:func:`pyarrow.parquet.read_table`, mapped to equivalent SQLAlchemy expressions.
+"""
+
+
+def get_read_pushdown_from_context(
+    context: InputContext, res: Resource
+) -> tuple[list[str] | None, list[tuple[str, str, Any]] | None]:
+    """Get the column subset and row filters an asset requested for one of its inputs.
+
+    Assets can limit the data that's loaded for an input by adding ``columns`` and/or
+    ``filters`` to its :class:`dagster.AssetIn` metadata:
+
+    .. code-block:: python
+
+        @asset(
+            ins={
+                "gen": AssetIn(
+                    "core_eia860__scd_generators",
+                    metadata={
+                        "columns": ["plant_id_eia", "generator_id", "report_date"],
+                        "filters": [("report_date", ">=", "2020-01-01")],
+                    },
+                )
+            }
+        )
+
+    ``filters`` follows the conjunctive list-of-tuples form accepted by
+    :func:`pyarrow.parquet.read_table`, using the operators in
+    :data:`READ_FILTER_OPERATORS`. Values for date and datetime fields are converted
+    to :class:`datetime.date` and :class:`datetime.datetime` objects, so they can be
+    given as strings.
+
+    Args:
+        context: dagster keyword that provides access to the input metadata.
+        res: the resource being loaded.
+
+    Returns:
+        The requested columns and row filters, each of which is None if it wasn't
+        specified.
+
+    Raises:
+        ValueError: if a column or filter refers to a field that isn't in the resource
+            schema, or a filter is malformed.
+    """
+    metadata = context.metadata or {}
+    columns = metadata.get("columns")
+    filters = metadata.get("filters")
+    field_names = res.get_field_names()
+    if columns is not None:
+        columns = list(columns)
+        if unknown := set(columns).difference(field_names):
+            raise ValueError(
+                f"{res.name}: requested columns {unknown} are not in the table schema."
+            )
+    if filters is not None:
+        normalized_filters = []
+        for col, op, value in filters:
+            if col not in field_names:
+                raise ValueError(
+                    f"{res.name}: filter column {col} is not in the table schema."
+                )
+            if op not in READ_FILTER_OPERATORS:
+                raise ValueError(
+                    f"{res.name}: unsupported filter operator {op}. Expected one of "
+                    f"{list(READ_FILTER_OPERATORS)}."
+                )
+            field_type = res.get_field(col).type
+            if field_type in ("date", "datetime"):
+                to_python = (
+                    (lambda x: pd.Timestamp(x).date())
+                    if field_type == "date"
+                    else (lambda x: pd.Timestamp(x).to_pydatetime())
+                )
+                value = (
+                    [to_python(v) for v in value]
+                    if op in ("in", "not in")
+                    else to_python(value)
+                )
+            normalized_filters.append((col, op, value))
+        filters = normalized_filters
+    return columns, filters
+
+
+def _to_sqlite_arrow_schema(res: Resource) -> pa.Schema:
+    """Construct the Arrow schema used to bulk load a resource into SQLite.
+
+    This is :meth:`pudl.metadata.classes.Resource.to_pyarrow` with integers and
+    floats widened to 64 bits. SQLite stores all integers and reals with 64 bits, so
+    this avoids changing the values written to the database relative to
+    :meth:`pandas.DataFrame.to_sql`.
+    """
+    schema = res.to_pyarrow()
+    for i, field in enumerate(schema):
+        if pa.types.is_integer(field.type):
+            schema = schema.set(i, field.with_type(pa.int64()))
+        elif pa.types.is_floating(field.type):
+            schema = schema.set(i, field.with_type(pa.float64()))
+    return schema
+
+
 class PudlMixedFormatIOManager(IOManager):
     """Format switching IOManager that supports sqlite and parquet.
 
@@ -66,7 +247,15 @@ class PudlMixedFormatIOManager(IOManager):
     read_from_parquet: bool
     """If true, data will be read from parquet files instead of sqlite."""
 
-    def __init__(self, write_to_parquet: bool = False, read_from_parquet: bool = False):
+    bulk_load_sqlite: bool
+    """If true, tables will be written to sqlite using the Arrow bulk loader."""
+
+    def __init__(
+        self,
+        write_to_parquet: bool = False,
+        read_from_parquet: bool = False,
+        bulk_load_sqlite: bool = False,
+    ):
         """Creates new instance of mixed format pudl IO manager.
 
         By default, data is written and read from sqlite, but experimental
@@ -81,6 +270,9 @@ class PudlMixedFormatIOManager(IOManager):
                 read from the sqlite database. Reading from parquet provides
                 performance increases as well as better datatype handling, so
                 this option is encouraged.
+            bulk_load_sqlite: if True, tables are written to sqlite using
+                :meth:`SQLiteIOManager._bulk_load` rather than
+                :meth:`pandas.DataFrame.to_sql`.
         """
         if read_from_parquet and not write_to_parquet:
             raise RuntimeError(
@@ -88,9 +280,11 @@ class PudlMixedFormatIOManager(IOManager):
             )
         self.write_to_parquet = write_to_parquet
         self.read_from_parquet = read_from_parquet
+        self.bulk_load_sqlite = bulk_load_sqlite
         self._sqlite_io_manager = PudlSQLiteIOManager(
             base_dir=PudlPaths().output_dir,
             db_name="pudl",
+            bulk_load=bulk_load_sqlite,
         )
         self._parquet_io_manager = PudlParquetIOManager()
         if self.write_to_parquet or self.read_from_parquet:
@@ -123,6 +317,7 @@ class SQLiteIOManager(IOManager):
         db_name: str,
         md: sa.MetaData | None = None,
         timeout: float = 1_000.0,
+        bulk_load: bool = False,
     ):
         """Init a SQLiteIOmanager.
 
@@ -136,9 +331,12 @@ class SQLiteIOManager(IOManager):
                 an exception, if the database is locked by another connection.
                 If another connection opens a transaction to modify the database,
                 it will be locked until that transaction is committed.
+            bulk_load: If True, write dataframes with :meth:`_bulk_load` instead of
+                :meth:`pandas.DataFrame.to_sql`.
         """
         self.base_dir = Path(base_dir)
         self.db_name = db_name
+        self.bulk_load = bulk_load
 
         bad_sqlite_version = version.parse(sqlite_version) < version.parse(
             MINIMUM_SQLITE_VERSION
@@ -227,6 +425,10 @@ class SQLiteIOManager(IOManager):
                 f"{table_name} dataframe is missing columns: {column_difference}"
             )
 
+        if self.bulk_load:
+            self._bulk_load(sa_table, pa.Table.from_pandas(df, preserve_index=False))
+            return
+
         engine = self.engine
         with engine.begin() as con:
             # Remove old table records before loading to db
@@ -242,6 +444,76 @@ class SQLiteIOManager(IOManager):
                 dtype={c.name: c.type for c in sa_table.columns},
             )
 
+    def _bulk_load(self, sa_table: sa.Table, table: pa.Table):
+        """Replace the contents of a database table with an Arrow table.
+
+        This is a faster alternative to :meth:`pandas.DataFrame.to_sql`, which builds
+        a parameter tuple per row via SQLAlchemy. Instead, the Arrow table is
+        converted to Python values one column at a time, in batches of
+        :data:`SQLITE_BULK_LOAD_BATCH_SIZE` rows, and each batch is inserted with a
+        single prepared ``executemany`` statement.
+
+        For the duration of the load the connection uses
+        :data:`SQLITE_BULK_LOAD_PRAGMAS`, and any explicitly created indexes on the
+        table are dropped and then recreated once all the rows have been inserted.
+        Indexes that SQLite creates implicitly to enforce primary key and uniqueness
+        constraints can't be deferred.
+
+        Args:
+            sa_table: the database table to replace the contents of.
+            table: Arrow table whose column names are a subset of the columns in
+                ``sa_table``.
+        """
+        columns = ", ".join(f'"{name}"' for name in table.column_names)
+        placeholders = ", ".join("?" for _ in table.column_names)
+        insert_stmt = (
+            f'INSERT INTO "{sa_table.name}" ({columns}) VALUES ({placeholders})'  # noqa: S608
+        )
+        sa_types = [
+            sa_table.columns[name].type if name in sa_table.columns else None
+            for name in table.column_names
+        ]
+
+        with self.engine.connect() as con:
+            # PRAGMAs that affect transactions must be set outside of one.
+            original_pragmas = {
+                pragma: con.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+                for pragma in SQLITE_BULK_LOAD_PRAGMAS
+            }
+            for pragma, value in SQLITE_BULK_LOAD_PRAGMAS.items():
+                con.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+            con.commit()
+            try:
+                with con.begin():
+                    indexes = con.exec_driver_sql(
+                        "SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+                        "AND tbl_name = ? AND sql IS NOT NULL",
+                        (sa_table.name,),
+                    ).fetchall()
+                    for index_name, _ in indexes:
+                        con.exec_driver_sql(f'DROP INDEX "{index_name}"')
+                    # Remove old table records before loading to db
+                    con.execute(sa_table.delete())
+                    for batch in table.to_batches(
+                        max_chunksize=SQLITE_BULK_LOAD_BATCH_SIZE
+                    ):
+                        values = [
+                            _to_sqlite_values(column, sa_type)
+                            for column, sa_type in zip(
+                                batch.columns, sa_types, strict=True
+                            )
+                        ]
+                        if batch.num_rows:
+                            con.exec_driver_sql(
+                                insert_stmt, list(zip(*values, strict=True))
+                            )
+                    for _, index_sql in indexes:
+                        con.exec_driver_sql(index_sql)
+            finally:
+                for pragma, value in original_pragmas.items():
+                    con.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+                con.commit()
+
     # TODO (bendnorman): Create a SQLQuery type so it's clearer what this method expects
     def _handle_str_output(self, context: OutputContext, query: str):
         """Execute a sql query on the database.
@@ -322,6 +594,18 @@ class SQLiteIOManager(IOManager):
 class PudlParquetIOManager(IOManager):
     """IOManager that writes pudl tables to pyarrow parquet files."""
 
+    def __init__(self, arrow_dtypes: bool = False):
+        """Initialize PudlParquetIOManager.
+
+        Args:
+            arrow_dtypes: If True, tables are read with :meth:`_read_arrow_backed`,
+                which memory maps the parquet file and returns columns backed by
+                :class:`pandas.ArrowDtype` rather than numpy arrays. This can be
+                overridden for individual inputs with an ``arrow_dtypes`` entry in
+                their :class:`dagster.AssetIn` metadata.
+        """
+        self.arrow_dtypes = arrow_dtypes
+
     def handle_output(self, context: OutputContext, df: Any) -> None:
         """Writes pudl dataframe to parquet file."""
         assert isinstance(df, pd.DataFrame), "Only panda dataframes are supported."
@@ -332,24 +616,131 @@ class PudlParquetIOManager(IOManager):
 
         df = res.enforce_schema(df)
         schema = res.to_pyarrow()
+        pk = res.schema.primary_key
+        # Positional order of the rows sorted by primary key. Taking one row group at
+        # a time in this order avoids making a sorted copy of the whole dataframe.
+        row_order = (
+            df[pk].reset_index(drop=True).sort_values(pk).index.to_numpy()
+            if pk
+            else np.arange(len(df))
+        )
+        # Sorting by a categorical column uses the category order, which isn't
+        # necessarily the order of the values written to parquet.
+        sorting_columns = list(
+            itertools.takewhile(
+                lambda col: not pa.types.is_dictionary(schema.field(col).type), pk
+            )
+        )
         with pq.ParquetWriter(
             where=parquet_path,
             schema=schema,
             compression="snappy",
             version="2.6",
-        ) as writer:
-            writer.write_table(
-                pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            use_dictionary=True,
+            write_statistics=True,
+            write_page_index=True,
+            sorting_columns=pq.SortingColumn.from_ordering(
+                schema, [(col, "ascending") for col in sorting_columns]
             )
+            if sorting_columns
+            else None,
+        ) as writer:
+            for start in range(0, len(df), PARQUET_ROW_GROUP_SIZE):
+                writer.write_table(
+                    pa.Table.from_pandas(
+                        df.iloc[row_order[start : start + PARQUET_ROW_GROUP_SIZE]],
+                        schema=schema,
+                        preserve_index=False,
+                    ),
+                    row_group_size=PARQUET_ROW_GROUP_SIZE,
+                )
 
     def load_input(self, context: InputContext) -> pd.DataFrame:
-        """Loads pudl table from parquet file."""
+        """Loads pudl table from parquet file.
+
+        Column subsets and row filters requested in the input metadata (see
+        :func:`get_read_pushdown_from_context`) are passed on to
+        :func:`pyarrow.parquet.read_table`.
+        """
         table_name = get_table_name_from_context(context)
         parquet_path = PudlPaths().parquet_path(table_name)
         res = Resource.from_id(table_name)
-        df = pq.read_table(source=parquet_path, schema=res.to_pyarrow()).to_pandas()
+        schema = res.to_pyarrow()
+        columns, filters = get_read_pushdown_from_context(context, res)
+        if columns is not None:
+            res = res.select_fields(columns)
+            # Read the columns in schema order, as enforce_schema() would return them
+            columns = res.get_field_names()
+
+        metadata = context.metadata or {}
+        if metadata.get("arrow_dtypes", self.arrow_dtypes):
+            df = self._read_arrow_backed(parquet_path, res, columns, filters)
+            if df is not None:
+                return df
+
+        df = pq.read_table(
+            source=parquet_path,
+            schema=schema,
+            columns=columns,
+            filters=filters,
+        ).to_pandas()
         return res.enforce_schema(df)
 
+    @staticmethod
+    def _read_arrow_backed(
+        parquet_path: Path,
+        res: Resource,
+        columns: list[str] | None,
+        filters: list[tuple[str, str, Any]] | None,
+    ) -> pd.DataFrame | None:
+        """Read a parquet file into pyarrow backed columns without extra copies.
+
+        The file is memory mapped, and the Arrow table is converted to pandas with
+        ``self_destruct=True`` and ``split_blocks=True`` so that Arrow buffers are
+        released as soon as each column has been converted. Columns are returned as
+        :class:`pandas.ArrowDtype` columns, except for dictionary encoded (categorical)
+        columns, which are returned as :class:`pandas.CategoricalDtype`.
+
+        Schema enforcement is skipped, since the only files this is applied to are
+        ones whose embedded Arrow schema already matches :meth:`Resource.to_pyarrow`,
+        which is only true of files written by :meth:`handle_output` after
+        :meth:`Resource.enforce_schema` was applied.
+
+        Args:
+            parquet_path: path to the parquet file to read.
+            res: resource describing the columns to be read.
+            columns: columns to read, or None to read all of them.
+            filters: row filters to apply while reading, or None.
+
+        Returns:
+            The table, or None if the schema of the file doesn't match the resource,
+            in which case it needs to be read with schema enforcement instead.
+        """
+        expected_schema = res.to_pyarrow()
+        file_schema = pq.read_schema(parquet_path, memory_map=True)
+        if columns is not None and set(columns).issubset(file_schema.names):
+            file_schema = pa.schema([file_schema.field(name) for name in columns])
+        if not file_schema.equals(expected_schema, check_metadata=False):
+            logger.info(
+                f"{res.name}: parquet schema doesn't match the resource schema. "
+                "Reading with schema enforcement."
+            )
+            return None
+
+        table = pq.read_table(
+            source=parquet_path,
+            columns=columns,
+            filters=filters,
+            memory_map=True,
+        )
+        return table.to_pandas(
+            types_mapper=lambda t: (
+                None if pa.types.is_dictionary(t) else pd.ArrowDtype(t)
+            ),
+            self_destruct=True,
+            split_blocks=True,
+        )
+
 
 class PudlSQLiteIOManager(SQLiteIOManager):
     """IO Manager that writes and retrieves dataframes from a SQLite database.
@@ -364,6 +755,7 @@ class PudlSQLiteIOManager(SQLiteIOManager):
         db_name: str,
         package: Package | None = None,
         timeout: float = 1_000.0,
+        bulk_load: bool = False,
     ):
         """Initialize PudlSQLiteIOManager.
 
@@ -390,6 +782,8 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 exception, if the database is locked by another connection.  If another
                 connection opens a transaction to modify the database, it will be locked
                 until that transaction is committed.
+            bulk_load: If True, write dataframes with :meth:`_bulk_load` instead of
+                :meth:`pandas.DataFrame.to_sql`.
         """
         if package is None:
             package = PUDL_PACKAGE
@@ -401,7 +795,7 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 f"{sqlite_path} not initialized! Run `alembic upgrade head`."
             )
 
-        super().__init__(base_dir, db_name, md, timeout)
+        super().__init__(base_dir, db_name, md, timeout, bulk_load)
 
         existing_schema_context = MigrationContext.configure(self.engine.connect())
         metadata_diff = compare_metadata(existing_schema_context, self.md)
@@ -452,6 +846,15 @@ class PudlSQLiteIOManager(SQLiteIOManager):
         res = self.package.get_resource(table_name)
 
         df = res.enforce_schema(df)
+        if self.bulk_load:
+            self._bulk_load(
+                sa_table,
+                pa.Table.from_pandas(
+                    df, schema=_to_sqlite_arrow_schema(res), preserve_index=False
+                ),
+            )
+            return
+
         with self.engine.begin() as con:
             # Remove old table records before loading to db
             con.execute(sa_table.delete())
@@ -468,6 +871,10 @@ class PudlSQLiteIOManager(SQLiteIOManager):
     def load_input(self, context: InputContext) -> pd.DataFrame:
         """Load a dataframe from a sqlite database.
 
+        Column subsets and row filters requested in the input metadata (see
+        :func:`get_read_pushdown_from_context`) are applied in the ``SELECT``
+        statement, so only the requested data is read from the database.
+
         Args:
             context: dagster keyword that provides access output information like asset
                 name.
@@ -486,23 +893,33 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 "it's a work in progress or is distributed in Apache Parquet format."
             ) from err
 
+        columns, filters = get_read_pushdown_from_context(context, res)
+        if columns is not None:
+            res = res.select_fields(columns)
+
         with self.engine.begin() as con:
             try:
-                df = pd.concat(
-                    [
-                        res.enforce_schema(chunk_df)
-                        for chunk_df in pd.read_sql_table(
-                            table_name, con, chunksize=100_000
-                        )
-                    ]
-                )
+                if columns is None and filters is None:
+                    chunks = pd.read_sql_table(table_name, con, chunksize=100_000)
+                else:
+                    sa_table = self._get_sqlalchemy_table(table_name)
+                    stmt = sa.select(
+                        *[sa_table.c[name] for name in res.get_field_names()]
+                    ).where(
+                        *[
+                            READ_FILTER_OPERATORS[op](sa_table.c[col], value)
+                            for col, op, value in filters or []
+                        ]
+                    )
+                    chunks = pd.read_sql(stmt, con, chunksize=100_000)
+                df = pd.concat([res.enforce_schema(chunk_df) for chunk_df in chunks])
             except ValueError as err:
                 raise ValueError(
                     f"{table_name} not found. Either the table was dropped "
                     "or it doesn't exist in the pudl.metadata.resources."
                     "Add the table to the metadata and recreate the database."
                 ) from err
-            if df.empty:
+            if df.empty and filters is None:
                 raise AssertionError(
                     f"The {table_name} table is empty. Materialize the {table_name} "
                     "asset so it is available in the database."
@@ -525,6 +942,13 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 SQLite database.""",
             default_value=True,
         ),
+        "bulk_load_sqlite": Field(
+            bool,
+            description="""If True, tables will be written to the SQLite
+                database with the Arrow based bulk loader instead of
+                pandas.DataFrame.to_sql.""",
+            default_value=False,
+        ),
     }
 )
 def pudl_mixed_format_io_manager(init_context: InitResourceContext) -> IOManager:
@@ -532,6 +956,7 @@ def pudl_mixed_format_io_manager(init_context: InitResourceContext) -> IOManager
     return PudlMixedFormatIOManager(
         write_to_parquet=init_context.resource_config["write_to_parquet"],
         read_from_parquet=init_context.resource_config["read_from_parquet"],
+        bulk_load_sqlite=init_context.resource_config["bulk_load_sqlite"],
     )
 
 
@@ -803,8 +1228,18 @@ class EpaCemsIOManager(UPathIOManager):
         """Write dataframe to parquet file."""
         raise NotImplementedError("This IO Manager doesn't support writing data.")
 
-    def load_from_path(self, context: InputContext, path: UPath) -> dd.DataFrame:
-        """Load a directory of parquet files to a dask dataframe."""
+    def load_from_path(
+        self, context: InputContext, path: UPath
+    ) -> dd.DataFrame | EpaCemsDataset:
+        """Load a directory of parquet files to a dask dataframe.
+
+        Inputs annotated as :class:`pudl.output.epacems.EpaCemsDataset` get a DuckDB
+        query layer over the same files instead, which doesn't read any data until it
+        is queried.
+        """
+        if context.dagster_type.typing_type is EpaCemsDataset:
+            logger.info(f"Querying parquet file at {path}")
+            return EpaCemsDataset(Path(path))
         logger.info(f"Reading parquet file from {path}")
         return dd.read_parquet(
             path,
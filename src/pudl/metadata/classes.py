@@ -1459,6 +1459,29 @@ class Resource(PudlMeta):
         """Return a list of all the field names in the resource schema."""
         return [field.name for field in self.schema.fields]
 
+    def select_fields(self, names: Iterable[str]) -> "Resource":
+        """Return a copy of the resource whose schema only contains the named fields.
+
+        Fields keep their order in the original schema. The primary key is kept only
+        if all of its fields are selected, and foreign keys are dropped. This allows
+        :meth:`enforce_schema` to be applied to a subset of a table's columns.
+
+        Raises:
+            KeyError: if any of the names is not a field in the resource schema.
+        """
+        names = set(names)
+        for name in names:
+            self.get_field(name)
+        pk = self.schema.primary_key
+        schema = self.schema.model_copy(
+            update={
+                "fields": [f for f in self.schema.fields if f.name in names],
+                "primary_key": pk if set(pk).issubset(names) else [],
+                "foreign_keys": [],
+            }
+        )
+        return self.model_copy(update={"schema": schema})
+
     def to_sql(
         self,
         metadata: sa.MetaData = None,
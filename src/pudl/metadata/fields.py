@@ -2984,6 +2984,11 @@ FIELD_METADATA: dict[str, dict[str, Any]] = {
         "type": "datetime",
         "description": "Date and time measurement began (UTC).",
     },
+    "operating_hour_count": {
+        "type": "integer",
+        "description": "Number of hours in the period during which a unit operated for at least part of the hour.",
+        "unit": "hr",
+    },
     "operating_switch": {
         "type": "string",
         "description": "Indicates whether the fuel switching generator can switch when operating",
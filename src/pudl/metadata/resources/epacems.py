@@ -35,6 +35,192 @@ RESOURCE_METADATA: dict[str, dict[str, Any]] = {
         "etl_group": "epacems",
         "create_database_schema": False,
     },
+    "out_epacems__daily_emissions_by_plant": {
+        "description": (
+            "Hourly EPA CEMS emissions and operational data summed by plant and day. "
+            "Periods are in the local standard time of the plant, which CEMS reports in. "
+            "Emissions and heat input are null when none of the hourly records of the "
+            "period reported them."
+        ),
+        "schema": {
+            "fields": [
+                "plant_id_eia",
+                "report_date",
+                "operating_time_hours",
+                "operating_hour_count",
+                "gross_generation_mwh",
+                "heat_content_mmbtu",
+                "steam_load_1000_lbs",
+                "so2_mass_lbs",
+                "nox_mass_lbs",
+                "co2_mass_tons",
+            ],
+            "primary_key": ["plant_id_eia", "report_date"],
+        },
+        "sources": ["eia860", "epacems"],
+        "field_namespace": "epacems",
+        "etl_group": "epacems",
+        "create_database_schema": False,
+    },
+    "out_epacems__monthly_emissions_by_plant": {
+        "description": (
+            "Hourly EPA CEMS emissions and operational data summed by plant and month. "
+            "Periods are in the local standard time of the plant, which CEMS reports in. "
+            "Emissions and heat input are null when none of the hourly records of the "
+            "period reported them."
+        ),
+        "schema": {
+            "fields": [
+                "plant_id_eia",
+                "report_date",
+                "operating_time_hours",
+                "operating_hour_count",
+                "gross_generation_mwh",
+                "heat_content_mmbtu",
+                "steam_load_1000_lbs",
+                "so2_mass_lbs",
+                "nox_mass_lbs",
+                "co2_mass_tons",
+            ],
+            "primary_key": ["plant_id_eia", "report_date"],
+        },
+        "sources": ["eia860", "epacems"],
+        "field_namespace": "epacems",
+        "etl_group": "epacems",
+        "create_database_schema": False,
+    },
+    "out_epacems__yearly_emissions_by_plant": {
+        "description": (
+            "Hourly EPA CEMS emissions and operational data summed by plant and year. "
+            "Periods are in the local standard time of the plant, which CEMS reports in. "
+            "Emissions and heat input are null when none of the hourly records of the "
+            "period reported them."
+        ),
+        "schema": {
+            "fields": [
+                "plant_id_eia",
+                "report_date",
+                "operating_time_hours",
+                "operating_hour_count",
+                "gross_generation_mwh",
+                "heat_content_mmbtu",
+                "steam_load_1000_lbs",
+                "so2_mass_lbs",
+                "nox_mass_lbs",
+                "co2_mass_tons",
+            ],
+            "primary_key": ["plant_id_eia", "report_date"],
+        },
+        "sources": ["eia860", "epacems"],
+        "field_namespace": "epacems",
+        "etl_group": "epacems",
+        "create_database_schema": False,
+    },
+    "out_epacems__daily_emissions_by_unit": {
+        "description": (
+            "Hourly EPA CEMS emissions and operational data summed by emissions unit and "
+            "day. "
+            "Periods are in the local standard time of the plant, which CEMS reports in. "
+            "Emissions and heat input are null when none of the hourly records of the "
+            "period reported them."
+        ),
+        "schema": {
+            "fields": [
+                "plant_id_eia",
+                "plant_id_epa",
+                "emissions_unit_id_epa",
+                "report_date",
+                "operating_time_hours",
+                "operating_hour_count",
+                "gross_generation_mwh",
+                "heat_content_mmbtu",
+                "steam_load_1000_lbs",
+                "so2_mass_lbs",
+                "nox_mass_lbs",
+                "co2_mass_tons",
+            ],
+            "primary_key": [
+                "plant_id_eia",
+                "plant_id_epa",
+                "emissions_unit_id_epa",
+                "report_date",
+            ],
+        },
+        "sources": ["eia860", "epacems"],
+        "field_namespace": "epacems",
+        "etl_group": "epacems",
+        "create_database_schema": False,
+    },
+    "out_epacems__monthly_emissions_by_unit": {
+        "description": (
+            "Hourly EPA CEMS emissions and operational data summed by emissions unit and "
+            "month. "
+            "Periods are in the local standard time of the plant, which CEMS reports in. "
+            "Emissions and heat input are null when none of the hourly records of the "
+            "period reported them."
+        ),
+        "schema": {
+            "fields": [
+                "plant_id_eia",
+                "plant_id_epa",
+                "emissions_unit_id_epa",
+                "report_date",
+                "operating_time_hours",
+                "operating_hour_count",
+                "gross_generation_mwh",
+                "heat_content_mmbtu",
+                "steam_load_1000_lbs",
+                "so2_mass_lbs",
+                "nox_mass_lbs",
+                "co2_mass_tons",
+            ],
+            "primary_key": [
+                "plant_id_eia",
+                "plant_id_epa",
+                "emissions_unit_id_epa",
+                "report_date",
+            ],
+        },
+        "sources": ["eia860", "epacems"],
+        "field_namespace": "epacems",
+        "etl_group": "epacems",
+        "create_database_schema": False,
+    },
+    "out_epacems__yearly_emissions_by_unit": {
+        "description": (
+            "Hourly EPA CEMS emissions and operational data summed by emissions unit and "
+            "year. "
+            "Periods are in the local standard time of the plant, which CEMS reports in. "
+            "Emissions and heat input are null when none of the hourly records of the "
+            "period reported them."
+        ),
+        "schema": {
+            "fields": [
+                "plant_id_eia",
+                "plant_id_epa",
+                "emissions_unit_id_epa",
+                "report_date",
+                "operating_time_hours",
+                "operating_hour_count",
+                "gross_generation_mwh",
+                "heat_content_mmbtu",
+                "steam_load_1000_lbs",
+                "so2_mass_lbs",
+                "nox_mass_lbs",
+                "co2_mass_tons",
+            ],
+            "primary_key": [
+                "plant_id_eia",
+                "plant_id_epa",
+                "emissions_unit_id_epa",
+                "report_date",
+            ],
+        },
+        "sources": ["eia860", "epacems"],
+        "field_namespace": "epacems",
+        "etl_group": "epacems",
+        "create_database_schema": False,
+    },
 }
 """EPA CEMS resource attributes by PUDL identifier (``resource.name``).
 
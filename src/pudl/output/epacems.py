@@ -1,13 +1,154 @@
 """Routines that provide user-friendly access to the partitioned EPA CEMS dataset."""
 
+import tempfile
 from collections.abc import Iterable, Sequence
 from itertools import product
 from pathlib import Path
 
 import dask.dataframe as dd
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from pudl.workspace.setup import PudlPaths
 
+PLANT_INDEX_FILENAME = "_plant_index.arrow"
+"""Name of the plant index in each ``year=`` directory of the EPA CEMS dataset.
+
+The index isn't a parquet file, so that dataset readers don't mistake it for data.
+"""
+
+PLANT_INDEX_SCHEMA = pa.schema(
+    [
+        ("plant_id_eia", pa.int32()),
+        ("year", pa.int32()),
+        ("state", pa.string()),
+        ("path", pa.string()),
+        ("row_group_start", pa.int32()),
+        ("row_group_stop", pa.int32()),
+    ]
+)
+"""Schema of the plant index of the EPA CEMS dataset.
+
+Each row records the range of row groups holding the records of a plant in the file at
+``path``, relative to the root of the dataset.
+"""
+
+
+def _sql_string(value: str) -> str:
+    """Quote a string as a SQL literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+class EpaCemsDataset:
+    """Out-of-core queries over the EPA CEMS parquet outputs, run by DuckDB.
+
+    Most uses of the hourly CEMS data only need a few columns, or a small summary of
+    them, like the distinct units reporting each year. DuckDB only reads the columns a
+    query uses, skips partitions and row groups excluded by its filters, and spills to
+    disk instead of exceeding its memory limit, so these queries never need the whole
+    dataset in memory the way a Dask graph of pandas partitions can.
+
+    Queries refer to the data as the ``epacems`` view, e.g.:
+
+    .. code-block:: python
+
+        EpaCemsDataset(path).query(
+            "SELECT year, count(*) AS n FROM epacems GROUP BY year ORDER BY year"
+        )
+    """
+
+    def __init__(
+        self, path: Path, memory_limit: str = "4GB", threads: int | None = None
+    ):
+        """Constructs an EpaCemsDataset reading from path.
+
+        Args:
+            path: either the monolithic ``core_epacems__hourly_emissions.parquet`` file,
+                or the root of the hive-partitioned ``epacems`` dataset.
+            memory_limit: how much memory DuckDB may use before it spills to disk.
+            threads: number of threads DuckDB may use. Defaults to all the CPUs.
+        """
+        self.path = Path(path)
+        self.memory_limit = memory_limit
+        self.threads = threads
+
+    def query(self, sql: str) -> pd.DataFrame:
+        """Run a SQL query against the ``epacems`` view of the dataset."""
+        config = {"memory_limit": self.memory_limit}
+        if self.threads is not None:
+            config["threads"] = self.threads
+        with (
+            tempfile.TemporaryDirectory() as spill_dir,
+            duckdb.connect(config=config | {"temp_directory": spill_dir}) as con,
+        ):
+            if self.path.is_dir():
+                pattern = _sql_string((self.path / "**" / "*.parquet").as_posix())
+                source = (
+                    f"read_parquet({pattern}, hive_partitioning = true, "
+                    "hive_types = {'year': INTEGER, 'state': VARCHAR})"
+                )
+            else:
+                source = f"read_parquet({_sql_string(self.path.as_posix())})"
+            con.execute(f"CREATE VIEW epacems AS SELECT * FROM {source}")  # noqa: S608
+            return con.sql(sql).fetch_arrow_table().to_pandas()
+
+    @staticmethod
+    def _where(years: Iterable[int] | None, states: Iterable[str] | None) -> str:
+        conditions = []
+        if years is not None:
+            conditions.append(
+                f"year IN ({', '.join(str(int(year)) for year in years) or 'NULL'})"
+            )
+        if states is not None:
+            quoted = [_sql_string(state.upper()) for state in states]
+            conditions.append(f"state IN ({', '.join(quoted) or 'NULL'})")
+        return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    def distinct(
+        self,
+        columns: Sequence[str],
+        years: Iterable[int] | None = None,
+        states: Iterable[str] | None = None,
+    ) -> pd.DataFrame:
+        """Return the distinct combinations of values of some columns, sorted by them.
+
+        Args:
+            columns: names of the columns.
+            years: only include these years. By default it includes all years.
+            states: only include these states. By default it includes all states.
+        """
+        cols = ", ".join(f'"{col}"' for col in columns)
+        return self.query(
+            f"SELECT DISTINCT {cols} FROM epacems {self._where(years, states)} "  # noqa: S608
+            f"ORDER BY {cols}"
+        )
+
+    def aggregate(
+        self,
+        by: Sequence[str],
+        aggregates: dict[str, str],
+        years: Iterable[int] | None = None,
+        states: Iterable[str] | None = None,
+    ) -> pd.DataFrame:
+        """Return aggregates of the records grouped by some columns, sorted by them.
+
+        Args:
+            by: names of the columns to group the records by.
+            aggregates: SQL aggregate expressions, like ``"sum(co2_mass_tons)"``, keyed
+                by the names of the columns to return them in.
+            years: only include these years. By default it includes all years.
+            states: only include these states. By default it includes all states.
+        """
+        cols = ", ".join(f'"{col}"' for col in by)
+        exprs = ", ".join(f'{expr} AS "{name}"' for name, expr in aggregates.items())
+        return self.query(
+            f"SELECT {cols}, {exprs} FROM epacems {self._where(years, states)} "  # noqa: S608
+            f"GROUP BY {cols} ORDER BY {cols}"
+        )
+
 
 def year_state_filter(
     years: Iterable[int] = None, states: Iterable[str] = None
@@ -107,11 +248,132 @@ def get_plant_years(plant_ids, pudl_out):
     )
 
 
+def read_plant_index(
+    epacems_path: Path,
+    years: Iterable[int] | None = None,
+    states: Iterable[str] | None = None,
+) -> pd.DataFrame | None:
+    """Read the plant index of a hive-partitioned EPA CEMS dataset.
+
+    Args:
+        epacems_path: root directory of the dataset.
+        years: only read the index of these years. By default it reads all years.
+        states: only keep the entries of these states. By default it keeps all states.
+
+    Returns:
+        The entries of the plant index, following :data:`PLANT_INDEX_SCHEMA`, or None
+        if the dataset has no plant index, e.g. because it's a single parquet file.
+    """
+    if years is None:
+        index_paths = sorted(Path(epacems_path).glob(f"year=*/{PLANT_INDEX_FILENAME}"))
+    else:
+        index_paths = [
+            Path(epacems_path) / f"year={year}" / PLANT_INDEX_FILENAME for year in years
+        ]
+        index_paths = [path for path in index_paths if path.exists()]
+    if not index_paths:
+        return None
+    tables = []
+    for path in index_paths:
+        with pa.memory_map(str(path)) as source:
+            tables.append(pa.ipc.open_file(source).read_all())
+    plant_index = pa.concat_tables(tables).to_pandas()
+    if states is not None:
+        plant_index = plant_index[
+            plant_index.state.isin([state.upper() for state in states])
+        ]
+    return plant_index.reset_index(drop=True)
+
+
+def _read_plant_row_groups(
+    part: tuple[str, int, str, list[int]],
+    plant_ids: list[int],
+    columns: list[str] | None,
+    partition_dtypes: dict[str, pd.CategoricalDtype],
+) -> pd.DataFrame:
+    """Read the records of some plants from row groups of one year-state file.
+
+    The year and state partition columns aren't stored in the files, so they are added
+    as categoricals, like :func:`dask.dataframe.read_parquet` does for hive partitions.
+    """
+    path, year, state, row_groups = part
+    parquet_file = pq.ParquetFile(path)
+    if row_groups:
+        table = parquet_file.read_row_groups(row_groups)
+    else:
+        table = parquet_file.schema_arrow.empty_table()
+    table = table.filter(
+        pc.is_in(table["plant_id_eia"], value_set=pa.array(plant_ids, pa.int32()))
+    )
+    df = table.to_pandas(
+        types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get
+    ).assign(
+        year=pd.Categorical([year] * table.num_rows, dtype=partition_dtypes["year"]),
+        state=pd.Categorical([state] * table.num_rows, dtype=partition_dtypes["state"]),
+    )
+    return df if columns is None else df[columns]
+
+
+def _epacems_plants(
+    plant_index: pd.DataFrame,
+    plant_ids: Sequence[int],
+    columns: list[str] | None,
+    epacems_path: Path,
+) -> dd.DataFrame:
+    """Read the records of some plants using the plant index of the dataset."""
+    partition_dtypes = {
+        "year": pd.CategoricalDtype(
+            pd.Index(sorted(plant_index.year.unique()), dtype="int32")
+        ),
+        "state": pd.CategoricalDtype(sorted(plant_index.state.unique())),
+    }
+    matches = plant_index[plant_index.plant_id_eia.isin(plant_ids)]
+    parts = [
+        (
+            str(Path(epacems_path) / path),
+            year,
+            state,
+            sorted(
+                {
+                    row_group
+                    for start, stop in zip(
+                        entries.row_group_start, entries.row_group_stop, strict=True
+                    )
+                    for row_group in range(start, stop)
+                }
+            ),
+        )
+        for (path, year, state), entries in matches.groupby(
+            ["path", "year", "state"], sort=True
+        )
+    ]
+    # Built from an empty read, so that the metadata matches every partition.
+    first_path = Path(epacems_path) / plant_index.path.iloc[0]
+    meta = _read_plant_row_groups(
+        (str(first_path), plant_index.year.iloc[0], plant_index.state.iloc[0], []),
+        plant_ids=[],
+        columns=columns,
+        partition_dtypes=partition_dtypes,
+    )
+    if not parts:
+        return dd.from_pandas(meta, npartitions=1)
+    return dd.from_map(
+        _read_plant_row_groups,
+        parts,
+        plant_ids=plant_ids,
+        columns=columns,
+        partition_dtypes=partition_dtypes,
+        meta=meta,
+        enforce_metadata=False,
+    )
+
+
 def epacems(
     states: Sequence[str] | None = None,
     years: Sequence[int] | None = None,
     columns: Sequence[str] | None = None,
     epacems_path: Path | None = None,
+    plant_ids: Sequence[int] | None = None,
 ) -> dd.DataFrame:
     """Load EPA CEMS data from PUDL with optional subsetting.
 
@@ -121,10 +383,13 @@ def epacems(
         columns: subset by column. Defaults to None (which gets all columns).
         epacems_path: path to parquet dir. By default it automatically loads the path
             from :mod:`pudl.workspace`
+        plant_ids: subset by EIA plant ID. Defaults to None (which gets all plants).
+            In a hive-partitioned dataset with a plant index, only the row groups
+            holding the requested plants are read.
 
     Returns:
-        The requested epacems data. If requested states or years are not available, no
-        error will be raised.
+        The requested epacems data. If requested states, years or plants are not
+        available, no error will be raised.
     """
     # columns=None is handled by dd.read_parquet; gives all columns
     if columns is not None:
@@ -134,15 +399,25 @@ def epacems(
     if epacems_path is None:
         epacems_path = PudlPaths().output_dir / "epacems"
 
+    filters = year_state_filter(
+        states=states,
+        years=years,
+    )
+    if plant_ids is not None:
+        plant_ids = [int(plant_id) for plant_id in plant_ids]
+        plant_index = read_plant_index(epacems_path, years=years, states=states)
+        if plant_index is not None and not plant_index.empty:
+            return _epacems_plants(plant_index, plant_ids, columns, epacems_path)
+        # Without an index, rely on the row group statistics instead.
+        plant_filter = ("plant_id_eia", "in", plant_ids)
+        filters = [[*conj, plant_filter] for conj in filters or [[]]]
+
     epacems = dd.read_parquet(
         epacems_path,
         columns=columns,
         engine="pyarrow",
         index=False,
         split_row_groups=True,
-        filters=year_state_filter(
-            states=states,
-            years=years,
-        ),
+        filters=filters,
     )
     return epacems
@@ -0,0 +1,340 @@
+"""Copy row groups between Parquet files without decoding and re-encoding them.
+
+PyArrow can only write row groups from decoded Arrow data, so rebuilding a large file
+in which most row groups haven't changed means decoding and compressing all of them
+again. The functions here copy the encoded bytes of existing row groups into a new
+file instead, and rewrite the file footer so that the copied column chunk offsets
+point at their new locations.
+
+The Parquet footer is a Thrift struct in the compact protocol. It's decoded into a
+generic tree of ``(field_id, type, value)`` tuples, so that only the handful of offset
+fields we need to change have to be understood here and everything else round trips
+untouched. See https://github.com/apache/parquet-format for the format description.
+"""
+
+import struct
+from pathlib import Path
+from typing import Any
+
+import pyarrow.parquet as pq
+
+MAGIC = b"PAR1"
+COPY_CHUNK_SIZE = 2**24
+
+# Thrift compact protocol type ids.
+_BOOL_TRUE, _BOOL_FALSE, _BYTE, _I16, _I32, _I64, _DOUBLE, _BINARY = range(1, 9)
+_LIST, _SET, _MAP, _STRUCT, _UUID = range(9, 14)
+
+# Field ids of the parquet.thrift structs we need to modify.
+_FILE_METADATA_NUM_ROWS = 3
+_FILE_METADATA_ROW_GROUPS = 4
+_ROW_GROUP_COLUMNS = 1
+_ROW_GROUP_NUM_ROWS = 3
+_ROW_GROUP_FILE_OFFSET = 5
+_ROW_GROUP_ORDINAL = 7
+_COLUMN_CHUNK_FILE_PATH = 1
+_COLUMN_CHUNK_FILE_OFFSET = 2
+_COLUMN_CHUNK_META_DATA = 3
+_COLUMN_CHUNK_PAGE_INDEX_FIELDS = (4, 5, 6, 7)
+_COLUMN_META_DATA_TOTAL_COMPRESSED_SIZE = 7
+_COLUMN_META_DATA_DATA_PAGE_OFFSET = 9
+_COLUMN_META_DATA_INDEX_PAGE_OFFSET = 10
+_COLUMN_META_DATA_DICTIONARY_PAGE_OFFSET = 11
+_COLUMN_META_DATA_BLOOM_FILTER_FIELDS = (14, 15)
+
+
+class UnsupportedParquetLayoutError(ValueError):
+    """Raised when a file's row groups can't be copied as contiguous byte ranges."""
+
+
+class _CompactReader:
+    """Decodes Thrift compact protocol structs into (field_id, type, value) lists."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def _byte(self) -> int:
+        self.pos += 1
+        return self.data[self.pos - 1]
+
+    def _varint(self) -> int:
+        result = shift = 0
+        while True:
+            byte = self._byte()
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def _zigzag(self) -> int:
+        n = self._varint()
+        return (n >> 1) ^ -(n & 1)
+
+    def _value(self, ttype: int) -> Any:
+        if ttype in (_BOOL_TRUE, _BOOL_FALSE):
+            # Booleans inside collections take a byte of their own.
+            return self._byte() == _BOOL_TRUE
+        if ttype == _BYTE:
+            return self._byte()
+        if ttype in (_I16, _I32, _I64):
+            return self._zigzag()
+        if ttype == _DOUBLE:
+            self.pos += 8
+            return struct.unpack("<d", self.data[self.pos - 8 : self.pos])[0]
+        if ttype == _BINARY:
+            size = self._varint()
+            self.pos += size
+            return self.data[self.pos - size : self.pos]
+        if ttype == _UUID:
+            self.pos += 16
+            return self.data[self.pos - 16 : self.pos]
+        if ttype in (_LIST, _SET):
+            header = self._byte()
+            size = header >> 4 if header >> 4 != 15 else self._varint()
+            elem_type = header & 0x0F
+            return elem_type, [self._value(elem_type) for _ in range(size)]
+        if ttype == _MAP:
+            size = self._varint()
+            types = self._byte() if size else 0
+            key_type, value_type = types >> 4, types & 0x0F
+            return (
+                key_type,
+                value_type,
+                [(self._value(key_type), self._value(value_type)) for _ in range(size)],
+            )
+        if ttype == _STRUCT:
+            return self.read_struct()
+        raise ValueError(f"Unknown Thrift compact type {ttype}.")
+
+    def read_struct(self) -> list[tuple[int, int, Any]]:
+        """Decode the struct starting at the current position."""
+        fields = []
+        field_id = 0
+        while (header := self._byte()) != 0:
+            delta, ttype = header >> 4, header & 0x0F
+            field_id = field_id + delta if delta else self._zigzag()
+            if ttype in (_BOOL_TRUE, _BOOL_FALSE):
+                value = ttype == _BOOL_TRUE
+            else:
+                value = self._value(ttype)
+            fields.append((field_id, ttype, value))
+        return fields
+
+
+def _encode_varint(n: int) -> bytes:
+    out = bytearray()
+    while True:
+        if n < 0x80:
+            out.append(n)
+            return bytes(out)
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+
+
+def _encode_zigzag(n: int) -> bytes:
+    return _encode_varint((n << 1) ^ (n >> 63))
+
+
+def _encode_value(ttype: int, value: Any) -> bytes:
+    if ttype in (_BOOL_TRUE, _BOOL_FALSE):
+        return bytes([_BOOL_TRUE if value else _BOOL_FALSE])
+    if ttype == _BYTE:
+        return bytes([value])
+    if ttype in (_I16, _I32, _I64):
+        return _encode_zigzag(value)
+    if ttype == _DOUBLE:
+        return struct.pack("<d", value)
+    if ttype == _BINARY:
+        return _encode_varint(len(value)) + value
+    if ttype == _UUID:
+        return value
+    if ttype in (_LIST, _SET, _MAP):
+        return _encode_collection(ttype, value)
+    if ttype == _STRUCT:
+        return _encode_struct(value)
+    raise ValueError(f"Unknown Thrift compact type {ttype}.")
+
+
+def _encode_collection(ttype: int, value: Any) -> bytes:
+    if ttype == _MAP:
+        key_type, value_type, items = value
+        if not items:
+            return b"\x00"
+        return (
+            _encode_varint(len(items))
+            + bytes([key_type << 4 | value_type])
+            + b"".join(
+                _encode_value(key_type, k) + _encode_value(value_type, v)
+                for k, v in items
+            )
+        )
+    elem_type, items = value
+    if len(items) < 15:
+        header = bytes([len(items) << 4 | elem_type])
+    else:
+        header = bytes([0xF0 | elem_type]) + _encode_varint(len(items))
+    return header + b"".join(_encode_value(elem_type, item) for item in items)
+
+
+def _encode_struct(fields: list[tuple[int, int, Any]]) -> bytes:
+    out = bytearray()
+    last_id = 0
+    for field_id, ttype, value in fields:
+        if ttype in (_BOOL_TRUE, _BOOL_FALSE):
+            ttype = _BOOL_TRUE if value else _BOOL_FALSE
+        delta = field_id - last_id
+        if 0 < delta <= 15:
+            out.append(delta << 4 | ttype)
+        else:
+            out.append(ttype)
+            out += _encode_zigzag(field_id)
+        if ttype not in (_BOOL_TRUE, _BOOL_FALSE):
+            out += _encode_value(ttype, value)
+        last_id = field_id
+    out.append(0)
+    return bytes(out)
+
+
+def _get(fields: list[tuple[int, int, Any]], field_id: int, default: Any = None):
+    for fid, _, value in fields:
+        if fid == field_id:
+            return value
+    return default
+
+
+def _set(fields: list[tuple[int, int, Any]], field_id: int, ttype: int, value: Any):
+    """Set a field's value, keeping the fields sorted by id."""
+    for i, (fid, _, _) in enumerate(fields):
+        if fid == field_id:
+            fields[i] = (field_id, ttype, value)
+            return
+    fields.append((field_id, ttype, value))
+    fields.sort(key=lambda field: field[0])
+
+
+def _read_footer(path: Path) -> list[tuple[int, int, Any]]:
+    """Decode the FileMetaData struct of a Parquet file."""
+    with Path(path).open("rb") as f:
+        f.seek(-8, 2)
+        footer_len, magic = struct.unpack("<I4s", f.read(8))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an unencrypted Parquet file.")
+        f.seek(-8 - footer_len, 2)
+        return _CompactReader(f.read(footer_len)).read_struct()
+
+
+def _row_group_byte_range(row_group: list[tuple[int, int, Any]]) -> tuple[int, int]:
+    """Return the [start, end) byte range holding all column chunks of a row group."""
+    start, end = None, None
+    for column in _get(row_group, _ROW_GROUP_COLUMNS)[1]:
+        meta = _get(column, _COLUMN_CHUNK_META_DATA)
+        if (
+            _get(column, _COLUMN_CHUNK_FILE_PATH) is not None
+            or meta is None
+            or any(_get(column, f) is not None for f in _COLUMN_CHUNK_PAGE_INDEX_FIELDS)
+            or any(
+                _get(meta, f) is not None for f in _COLUMN_META_DATA_BLOOM_FILTER_FIELDS
+            )
+        ):
+            raise UnsupportedParquetLayoutError(
+                "Only row groups without external column chunks, page indexes or bloom "
+                "filters can be copied."
+            )
+        offsets = [
+            offset
+            for offset in (
+                _get(meta, _COLUMN_META_DATA_DICTIONARY_PAGE_OFFSET),
+                _get(meta, _COLUMN_META_DATA_INDEX_PAGE_OFFSET),
+                _get(meta, _COLUMN_META_DATA_DATA_PAGE_OFFSET),
+            )
+            if offset is not None and offset > 0
+        ]
+        col_start = min(offsets)
+        col_end = col_start + _get(meta, _COLUMN_META_DATA_TOTAL_COMPRESSED_SIZE)
+        start = col_start if start is None else min(start, col_start)
+        end = col_end if end is None else max(end, col_end)
+    return start, end
+
+
+def _shift_row_group(row_group: list[tuple[int, int, Any]], shift: int, ordinal: int):
+    """Move all the offsets of a row group by shift bytes and renumber it."""
+    columns = _get(row_group, _ROW_GROUP_COLUMNS)[1]
+    for column in columns:
+        offset = _get(column, _COLUMN_CHUNK_FILE_OFFSET)
+        if offset:
+            _set(column, _COLUMN_CHUNK_FILE_OFFSET, _I64, offset + shift)
+        meta = _get(column, _COLUMN_CHUNK_META_DATA)
+        for field_id in (
+            _COLUMN_META_DATA_DATA_PAGE_OFFSET,
+            _COLUMN_META_DATA_INDEX_PAGE_OFFSET,
+            _COLUMN_META_DATA_DICTIONARY_PAGE_OFFSET,
+        ):
+            offset = _get(meta, field_id)
+            if offset is not None and offset > 0:
+                _set(meta, field_id, _I64, offset + shift)
+    offset = _get(row_group, _ROW_GROUP_FILE_OFFSET)
+    if offset is not None:
+        _set(row_group, _ROW_GROUP_FILE_OFFSET, _I64, offset + shift)
+    if _get(row_group, _ROW_GROUP_ORDINAL) is not None:
+        _set(row_group, _ROW_GROUP_ORDINAL, _I16, ordinal)
+
+
+def _copy_bytes(src, dst, start: int, end: int) -> None:
+    src.seek(start)
+    remaining = end - start
+    while remaining:
+        chunk = src.read(min(remaining, COPY_CHUNK_SIZE))
+        if not chunk:
+            raise ValueError("Unexpected end of Parquet file.")
+        dst.write(chunk)
+        remaining -= len(chunk)
+
+
+def splice_row_groups(sources: list[tuple[Path, list[int]]], where: Path) -> None:
+    """Write a Parquet file made of row groups copied verbatim from other files.
+
+    The encoded column chunks are copied byte for byte, so the result reads exactly
+    like a file written with the same row groups by the writer of the source files.
+    All the sources must have the same Arrow schema. The schema, key-value metadata
+    and writer details of the new file are taken from the first source.
+
+    Args:
+        sources: paths of the source files, each with the indices of the row groups to
+            copy from it, in the order they should appear in the new file.
+        where: path of the new file. It must not be one of the sources.
+
+    Raises:
+        UnsupportedParquetLayoutError: if any of the row groups to copy has external
+            column chunks, page indexes or bloom filters, which would need more than
+            a contiguous range of bytes to be copied.
+        ValueError: if there are no sources, or they don't all have the same schema.
+    """
+    if not sources:
+        raise ValueError("At least one source file is needed to splice row groups.")
+    schema = pq.read_schema(sources[0][0])
+    for path, _ in sources[1:]:
+        if not pq.read_schema(path).equals(schema, check_metadata=True):
+            raise ValueError(f"The schema of {path} differs from {sources[0][0]}.")
+
+    metadata = _read_footer(sources[0][0])
+    row_groups = []
+    num_rows = 0
+    with Path(where).open("wb") as out:
+        out.write(MAGIC)
+        for path, indices in sources:
+            source_row_groups = _get(_read_footer(path), _FILE_METADATA_ROW_GROUPS)[1]
+            with Path(path).open("rb") as src:
+                for i in indices:
+                    row_group = source_row_groups[i]
+                    start, end = _row_group_byte_range(row_group)
+                    _shift_row_group(row_group, out.tell() - start, len(row_groups))
+                    _copy_bytes(src, out, start, end)
+                    row_groups.append(row_group)
+                    num_rows += _get(row_group, _ROW_GROUP_NUM_ROWS)
+        _set(metadata, _FILE_METADATA_NUM_ROWS, _I64, num_rows)
+        _set(metadata, _FILE_METADATA_ROW_GROUPS, _LIST, (_STRUCT, row_groups))
+        footer = _encode_struct(metadata)
+        out.write(footer)
+        out.write(struct.pack("<I", len(footer)))
+        out.write(MAGIC)
@@ -12,6 +12,7 @@ class RuntimeSettings(ConfigurableResource):
 
     xbrl_num_workers: None | int = None
     xbrl_batch_size: int = 50
+    dbf_num_workers: None | int = 1
 
 
 @resource(config_schema=create_dagster_config(DatasetsSettings()))
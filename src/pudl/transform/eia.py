@@ -16,8 +16,11 @@ provided by the EIA 860, and expands on it using several methods which can be
 found in :func:`pudl.transform.eia._boiler_generator_assn`.
 """
 
+import importlib.metadata
 import importlib.resources
+import os
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from enum import StrEnum, auto
 
 import networkx as nx
@@ -41,6 +44,8 @@ from pudl.metadata.enums import APPROXIMATE_TIMEZONES
 from pudl.metadata.fields import apply_pudl_dtypes, get_pudl_dtypes
 from pudl.metadata.resources import ENTITIES
 from pudl.settings import EiaSettings
+from pudl.workspace.frame_cache import DataFrameCache
+from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
@@ -48,6 +53,9 @@ logger = pudl.logging_helpers.get_logger(__name__)
 TZ_FINDER = timezonefinder.TimezoneFinder()
 """A global TimezoneFinder to cache geographies in memory for faster access."""
 
+TIMEZONE_PARALLEL_MIN_POINTS = 20_000
+"""Number of new coordinates from which :func:`find_timezones` uses its workers."""
+
 
 class EiaEntity(StrEnum):
     """Enum for the different types of EIA entities."""
@@ -100,6 +108,108 @@ def find_timezone(*, lng=None, lat=None, state=None, strict=True):
     return tz
 
 
+def _timezones_at(coords: np.ndarray) -> list[str | None]:
+    """Look up the timezones of valid (longitude, latitude) pairs."""
+    return [TZ_FINDER.timezone_at(lng=lng, lat=lat) for lng, lat in coords]
+
+
+def find_timezones(
+    lng: np.ndarray,
+    lat: np.ndarray,
+    state: np.ndarray | None = None,
+    *,
+    strict: bool = True,
+    decimals: int = 5,
+    workers: int | None = 1,
+    cache: DataFrameCache | None = None,
+) -> np.ndarray:
+    """Find the timezones associated with many locations at once.
+
+    Vectorized version of :func:`find_timezone`. Coordinates are rounded and
+    deduplicated, so each distinct location is only looked up once. Many new locations
+    are looked up in a pool of worker processes. With a cache, the timezones of the
+    locations looked up before are read back from the cache rather than looked up
+    again, and those of the new locations are added to it.
+
+    Args:
+        lng: Longitudes, in decimal degrees in [-180, 180]. May be null.
+        lat: Latitudes, in decimal degrees in [-90, 90]. May be null.
+        state: Abbreviations for US states or Canadian provinces, used if a location is
+            null or invalid and `strict` is False.
+        strict: Raise an error if any location is null or invalid?
+        decimals: Number of decimal places to round the coordinates to. 5 decimal
+            places are about a meter apart.
+        workers: Number of worker processes to look up new locations in, if there are
+            more than :data:`TIMEZONE_PARALLEL_MIN_POINTS` of them. If None, one per
+            CPU is used.
+        cache: Cache of previously looked up locations, shared across runs.
+
+    Returns:
+        The timezones (as IANA strings) for each location, with None where none was
+        found.
+    """
+    coords = np.round(
+        np.column_stack([np.asarray(lng, dtype=float), np.asarray(lat, dtype=float)]),
+        decimals,
+    )
+    # Null coordinates are never within bounds
+    valid = (np.abs(coords[:, 0]) <= 180) & (np.abs(coords[:, 1]) <= 90)
+    if strict and not valid.all():
+        raise ValueError(
+            f"Can't find timezone for: {coords[~valid][:5].tolist()} "
+            f"({(~valid).sum()} invalid locations)"
+        )
+    unique, inverse = np.unique(coords[valid], axis=0, return_inverse=True)
+    found = pd.DataFrame(unique, columns=["longitude", "latitude"])
+    key = {
+        "timezones": "coordinates",
+        "timezonefinder": importlib.metadata.version("timezonefinder"),
+        "decimals": decimals,
+    }
+    known = None if cache is None else cache.get(key)
+    if known is not None:
+        found = found.merge(known, on=["longitude", "latitude"], how="left")
+    else:
+        found["timezone"] = pd.Series(None, index=found.index, dtype=object)
+    new = found["timezone"].isnull().to_numpy()
+    if new.any():
+        new_coords = unique[new]
+        workers = workers or os.cpu_count()
+        if workers > 1 and len(new_coords) >= TIMEZONE_PARALLEL_MIN_POINTS:
+            logger.info(
+                f"Finding timezones of {len(new_coords)} locations "
+                f"with {workers} workers."
+            )
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                timezones = [
+                    tz
+                    for chunk in executor.map(
+                        _timezones_at, np.array_split(new_coords, workers)
+                    )
+                    for tz in chunk
+                ]
+        else:
+            timezones = _timezones_at(new_coords)
+        found.loc[new, "timezone"] = pd.Series(timezones, dtype=object).to_numpy()
+        if cache is not None:
+            cache.add(
+                key,
+                pd.concat([known, found[new]], ignore_index=True).dropna(
+                    subset="timezone"
+                ),
+            )
+    timezones = np.full(len(coords), None, dtype=object)
+    timezones[valid] = found["timezone"].to_numpy(dtype=object)[inverse.ravel()]
+    if not strict and state is not None:
+        missing = pd.isna(timezones)
+        timezones[missing] = (
+            pd.Series(np.asarray(state, dtype=object)[missing])
+            .map(APPROXIMATE_TIMEZONES)
+            .to_numpy(dtype=object)
+        )
+    return np.where(pd.isna(timezones), None, timezones)
+
+
 def occurrence_consistency(
     entity_idx: list[str],
     compiled_df: pd.DataFrame,
@@ -179,6 +289,131 @@ def occurrence_consistency(
     return col_df
 
 
+def _harvest_consistent_values(
+    compiled_df: pd.DataFrame,
+    keys: list[str],
+    cols: list[str],
+    strictness: dict[str, float],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Find the consistently reported values of many columns in a single pass.
+
+    Equivalent to running :func:`occurrence_consistency` on each column and keeping the
+    first consistent record for each group of ``keys``, without slicing, counting and
+    merging ``compiled_df`` again for every column. The groups are factorized once, and
+    the values of each column are factorized and stacked into a single array of
+    (column, group, value) codes, whose occurrences are all counted at once.
+
+    Where more than one value of a group is consistent, which can only happen with a
+    strictness below 0.5, the one with the lowest consistency rate is kept. Equally
+    consistent values are tied, and :func:`occurrence_consistency` breaks ties with the
+    unstable sort of all the records of a column, in the order they have once merged
+    with their counts. For columns with any ties, the records are put in that same order
+    and sorted in the same way, so that the same values are kept.
+
+    Args:
+        compiled_df: every record of the entity, as compiled by
+            :func:`_compile_all_entity_records`.
+        keys: columns identifying the groups whose values should be consistent: the id
+            columns of the entity, and ``report_date`` for annual columns.
+        cols: the columns to harvest.
+        strictness: the consistency rate above which a value is consistent, by column.
+
+    Returns:
+        The consistent value of each column for each group of ``keys``, null where no
+        value is consistent, and the number of groups with any value (``total``) and
+        with a consistent value (``consistent``) for each column.
+    """
+    complete = (
+        compiled_df[keys + ["report_date"]].notna().all(axis="columns").to_numpy()
+    )
+    # groups are numbered in sorted order, like the keys of a merge
+    groups = compiled_df.groupby(keys, dropna=False).ngroup().to_numpy()
+    _, first = np.unique(groups, return_index=True)
+    n_groups = len(first)
+    # and harvested in order of first appearance
+    appearance = np.argsort(first)
+    harvested = compiled_df[keys].iloc[first[appearance]].reset_index(drop=True)
+    harvested_position = np.empty(n_groups, dtype=np.int64)
+    harvested_position[appearance] = np.arange(n_groups)
+    dtypes = get_pudl_dtypes(group="eia")
+
+    stacked = [np.empty(0, dtype=np.int64)]
+    rows = [np.empty(0, dtype=np.int64)]
+    offsets = np.zeros(len(cols) + 1, dtype=np.int64)
+    n_values = np.ones(len(cols), dtype=np.int64)
+    for i, col in enumerate(cols):
+        values = compiled_df[col]
+        present = complete & values.notna().to_numpy()
+        if dtypes[col] == "string":
+            present &= ~(values == "nan").fillna(False).to_numpy(dtype=bool)
+        col_rows = np.flatnonzero(present)
+        codes, uniques = pd.factorize(values.iloc[col_rows], sort=True)
+        n_values[i] = max(len(uniques), 1)
+        stacked.append(offsets[i] + groups[col_rows] * n_values[i] + codes)
+        rows.append(col_rows)
+        offsets[i + 1] = offsets[i] + n_groups * n_values[i]
+
+    # sort the records by column, group and value, keeping the order of the records of
+    # each value, like the records merged with their counts by occurrence_consistency
+    stacked = np.concatenate(stacked)
+    merge_order = np.argsort(stacked, kind="stable")
+    stacked = stacked[merge_order]
+    rows = np.concatenate(rows)[merge_order]
+    bounds = np.searchsorted(stacked, offsets)
+
+    # count the records of each (column, group, value) at once
+    value_start = np.flatnonzero(np.diff(stacked, prepend=-1))
+    record_occurences = np.diff(np.append(value_start, len(stacked)))
+    record_values = np.repeat(np.arange(len(value_start)), record_occurences)
+    stacked = stacked[value_start]
+    column = np.repeat(np.arange(len(cols)), np.diff(np.searchsorted(stacked, offsets)))
+    group = (stacked - offsets[column]) // n_values[column]
+    # the values of each (column, group) are contiguous
+    column_group = column * n_groups + group
+    new_group = np.diff(column_group, prepend=-1) != 0
+    group_start = np.flatnonzero(new_group)
+    entity_occurences = np.add.reduceat(record_occurences, group_start)
+    consistent_rate = record_occurences / entity_occurences[np.cumsum(new_group) - 1]
+    thresholds = np.array([strictness[col] for col in cols], dtype=float)
+    is_consistent = consistent_rate > thresholds[column]
+
+    # keep the least consistent of the consistent values of each group
+    candidates = np.flatnonzero(is_consistent)
+    candidates = candidates[
+        np.lexsort((consistent_rate[candidates], column_group[candidates]))
+    ]
+    first_candidate = np.diff(column_group[candidates], prepend=-1) != 0
+    chosen = candidates[first_candidate]
+    least_rate = consistent_rate[chosen][np.cumsum(first_candidate) - 1]
+    tied = ~first_candidate & (consistent_rate[candidates] == least_rate)
+    # where it's tied, keep the first record in the order sorted by the unstable sort of
+    # occurrence_consistency, which depends on the order of all the column's records
+    for i in np.unique(column[candidates[tied]]):
+        col_values = record_values[bounds[i] : bounds[i + 1]]
+        order = consistent_rate[col_values].argsort(kind="quicksort")
+        order = order[is_consistent[col_values[order]]]
+        _, first = np.unique(group[col_values[order]], return_index=True)
+        chosen[column[chosen] == i] = col_values[order[first]]
+
+    for i, col in enumerate(cols):
+        chosen_col = chosen[column[chosen] == i]
+        if len(chosen_col) == 0:
+            # like merging an empty dataframe of consistent records
+            harvested[col] = pd.Series(np.nan, index=harvested.index, dtype=object)
+            continue
+        positions = np.full(n_groups, -1)
+        positions[harvested_position[group[chosen_col]]] = rows[value_start[chosen_col]]
+        harvested[col] = compiled_df[col].array.take(positions, allow_fill=True)
+    counts = pd.DataFrame(
+        {
+            "total": np.bincount(column[group_start], minlength=len(cols)),
+            "consistent": np.bincount(column[chosen], minlength=len(cols)),
+        },
+        index=pd.Index(cols, dtype=object),
+    )
+    return harvested, counts
+
+
 def _lat_long(
     dirty_df: pd.DataFrame,
     clean_df: pd.DataFrame,
@@ -301,22 +536,26 @@ def _last_operating_date(
     return op_clean_df
 
 
-def _add_timezone(plants_entity: pd.DataFrame) -> pd.DataFrame:
+def _add_timezone(
+    plants_entity: pd.DataFrame, cache: DataFrameCache | None = None
+) -> pd.DataFrame:
     """Add plant IANA timezone based on lat/lon or state if lat/lon is unavailable.
 
     Args:
         plants_entity: Plant entity table, including columns named "latitude",
             "longitude", and optionally "state"
+        cache: Cache of previously looked up locations. See :func:`find_timezones`.
 
     Returns:
         A DataFrame containing the same table, with a "timezone" column added.
         Timezone may be missing if lat / lon is missing or invalid.
     """
-    plants_entity["timezone"] = plants_entity.apply(
-        lambda row: find_timezone(
-            lng=row["longitude"], lat=row["latitude"], state=row["state"], strict=False
-        ),
-        axis=1,
+    plants_entity["timezone"] = find_timezones(
+        lng=plants_entity["longitude"].to_numpy(dtype=float, na_value=np.nan),
+        lat=plants_entity["latitude"].to_numpy(dtype=float, na_value=np.nan),
+        state=plants_entity.get("state"),
+        strict=False,
+        cache=cache,
     )
     return plants_entity
 
@@ -457,6 +696,7 @@ def harvest_entity_tables(  # noqa: C901
     clean_dfs: dict[str, pd.DataFrame],
     eia_settings: EiaSettings,
     debug: bool = False,
+    timezone_cache: DataFrameCache | None = None,
 ) -> tuple:
     """Compile consistent records for various entities.
 
@@ -475,7 +715,8 @@ def harvest_entity_tables(  # noqa: C901
     entity haven't been reported 70% consistently, then it will show up as a
     null value. We built in the ability to add special cases for columns where
     we want to apply a different method to, but the only ones we added was for
-    latitude and longitude because they are by far the dirtiest.
+    latitude and longitude because they are by far the dirtiest. All of the other
+    columns are harvested at once by :func:`_harvest_consistent_values`.
 
     We have determined which columns should be considered "static" or "annual".
     These can be found in constants in the `entities` dictionary. Static means
@@ -490,6 +731,8 @@ def harvest_entity_tables(  # noqa: C901
         eia860m: if True, the etl run is attempting to include year-to-date updated from
             EIA 860M.
         debug: if True, log when columns are inconsistent, but don't raise an error.
+        timezone_cache: Cache of previously looked up plant locations. See
+            :func:`find_timezones`.
 
     Returns:
         entity_df (the harvested entity table), annual_df (the annual entity table),
@@ -542,56 +785,74 @@ def harvest_entity_tables(  # noqa: C901
         subset=id_cols
     )
 
-    entity_df = entity_id_df.copy()
-    annual_df = annual_id_df.copy()
     special_case_cols = {
         "latitude": {"method": _lat_long, "round_to": 1},
         "longitude": {"method": _lat_long, "round_to": 1},
         "generator_operating_date": {"method": _last_operating_date},
     }
-    consistency = pd.DataFrame(
-        columns=["column", "consistent_ratio", "wrongos", "total"]
+    strictness = {
+        col: _manage_strictness(col, eia_settings.eia860.eia860m)
+        for col in static_cols + annual_cols
+    }
+    # harvest all of the columns without special cases in one pass
+    harvested_static, static_counts = _harvest_consistent_values(
+        compiled_df,
+        id_cols,
+        [col for col in static_cols if col not in special_case_cols],
+        strictness,
+    )
+    harvested_annual, annual_counts = _harvest_consistent_values(
+        compiled_df,
+        id_cols + ["report_date"],
+        [
+            col
+            for col in annual_cols
+            if col not in special_case_cols and col not in static_cols
+        ],
+        strictness,
+    )
+    entity_df = entity_id_df.merge(harvested_static, on=id_cols, how="left")
+    annual_df = annual_id_df.merge(
+        harvested_annual, on=(id_cols + ["report_date"]), how="left"
     )
+    counts = pd.concat([static_counts, annual_counts])
+
+    consistency = []
     col_dfs = {}
-    # determine how many times each of the columns occur
     for col in static_cols + annual_cols:
         if col in annual_cols:
             cols_to_consit = id_cols + ["report_date"]
         if col in static_cols:
             cols_to_consit = id_cols
 
-        strictness = _manage_strictness(col, eia_settings.eia860.eia860m)
-        col_df = occurrence_consistency(
-            id_cols, compiled_df, col, cols_to_consit, strictness=strictness
-        )
-
-        # pull the correct values out of the df and merge w/ the plant ids
-        col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
-            subset=(cols_to_consit + [f"{col}_is_consistent"])
-        )
+        if col in special_case_cols or debug:
+            col_df = occurrence_consistency(
+                id_cols, compiled_df, col, cols_to_consit, strictness=strictness[col]
+            )
 
-        # we need this to be an empty df w/ columns bc we are going to use it
-        if col_correct_df.empty:
-            col_correct_df = pd.DataFrame(columns=col_df.columns)
+        if col in special_case_cols:
+            # pull the correct values out of the df and merge w/ the plant ids
+            col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
+                subset=(cols_to_consit + [f"{col}_is_consistent"])
+            )
 
-        if col in static_cols:
-            clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
-            clean_df = clean_df[id_cols + [col]]
-            entity_df = entity_df.merge(clean_df, on=id_cols)
+            # we need this to be an empty df w/ columns bc we are going to use it
+            if col_correct_df.empty:
+                col_correct_df = pd.DataFrame(columns=col_df.columns)
 
-        if col in annual_cols:
-            clean_df = annual_id_df.merge(
-                col_correct_df, on=(id_cols + ["report_date"]), how="left"
-            )
-            clean_df = clean_df[id_cols + ["report_date", col]]
-            annual_df = annual_df.merge(clean_df, on=(id_cols + ["report_date"]))
+            if col in static_cols:
+                clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
+                clean_df = clean_df[id_cols + [col]]
+            else:
+                raise AssertionError(
+                    "Method currenty not configured to work with annual values."
+                )
 
-        # get the still dirty records by using the cleaned ids w/null values
-        # we need the plants that have no 'correct' value so
-        # we can't just use the col_df records when the consistency is not True
-        dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
+            # get the still dirty records by using the cleaned ids w/null values
+            # we need the plants that have no 'correct' value so
+            # we can't just use the col_df records when the consistency is not True
+            dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
 
-        if col in special_case_cols:
             clean_df = special_case_cols[col]["method"](
                 dirty_df,
                 clean_df,
@@ -601,33 +862,33 @@ def harvest_entity_tables(  # noqa: C901
                 cols_to_consit,
                 **special_case_cols[col],
             )
-            if col in static_cols:
-                clean_df = clean_df[id_cols + [col]]
-                entity_df = entity_df.drop(columns=[col]).merge(clean_df, on=id_cols)
-            elif col in annual_cols:
-                raise AssertionError(
-                    "Method currenty not configured to work with annual values."
+            clean_df = clean_df[id_cols + [col]]
+            entity_df = entity_df.merge(clean_df, on=id_cols)
+
+            total = len(col_df.drop_duplicates(subset=cols_to_consit))
+            consistent = (
+                len(
+                    col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
+                        subset=cols_to_consit
+                    )
                 )
+                if total > 0
+                else 0
+            )
+        else:
+            total, consistent = counts.loc[col, ["total", "consistent"]]
 
         if debug:
             col_dfs[col] = col_df
         # this next section is used to print and test whether the harvested
         # records are consistent enough
-        total = len(col_df.drop_duplicates(subset=cols_to_consit))
         # if the total is 0, the ratio will error, so assign null values.
         if total == 0:
             ratio = np.nan
             wrongos = np.nan
             logger.debug(f"       Zero records found for {col}")
         if total > 0:
-            ratio = (
-                len(
-                    col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
-                        subset=cols_to_consit
-                    )
-                )
-                / total
-            )
+            ratio = consistent / total
             wrongos = (1 - ratio) * total
             logger.debug(
                 f"       Ratio: {ratio:.3}  "
@@ -643,26 +904,27 @@ def harvest_entity_tables(  # noqa: C901
                     )
         # add to a small df to be used in order to print out the ratio of
         # consistent records
-        consistency = pd.concat(
-            [
-                consistency,
-                pd.DataFrame(
-                    {
-                        "column": [col],
-                        "consistent_ratio": [ratio],
-                        "wrongos": [wrongos],
-                        "total": [total],
-                    }
-                ),
-            ],
-            ignore_index=True,
+        consistency.append(
+            {
+                "column": col,
+                "consistent_ratio": ratio,
+                "wrongos": wrongos,
+                "total": total,
+            }
         )
+    consistency = pd.DataFrame(
+        consistency, columns=["column", "consistent_ratio", "wrongos", "total"]
+    )
+    # put the special cases back in their place among the static columns
+    entity_df = entity_df[id_cols + static_cols]
     mcs = consistency["consistent_ratio"].mean()
     logger.info(f"Average consistency of static {entity.value} values is {mcs:.2%}")
 
     if entity == EiaEntity.PLANTS:
         # Post-processing specific to the plants entity tables
-        entity_df = _add_additional_epacems_plants(entity_df).pipe(_add_timezone)
+        entity_df = _add_additional_epacems_plants(entity_df).pipe(
+            _add_timezone, cache=timezone_cache
+        )
         annual_df = fillna_balancing_authority_codes_via_names(annual_df).pipe(
             fix_balancing_authority_codes_with_state, plants_entity=entity_df
         )
@@ -1264,6 +1526,14 @@ def harvested_entity_asset_factory(
                     "produce additional debugging output."
                 ),
             ),
+            "use_cache": Field(
+                bool,
+                default_value=True,
+                description=(
+                    "If True, look up plant timezones in a cache of previously "
+                    "looked up locations, kept in the PUDL output directory."
+                ),
+            ),
         },
         required_resource_keys={"dataset_settings"},
         name=f"harvested_{entity.value}_eia",
@@ -1277,8 +1547,18 @@ def harvested_entity_asset_factory(
             df_name: PUDL_PACKAGE.encode(clean_dfs[df_name]) for df_name in clean_dfs
         }
 
+        timezone_cache = (
+            DataFrameCache(PudlPaths().output_dir / "_cache" / "timezones")
+            if context.op_config["use_cache"]
+            else None
+        )
+
         entity_df, annual_df, _col_dfs = harvest_entity_tables(
-            entity, clean_dfs, debug=debug, eia_settings=eia_settings
+            entity,
+            clean_dfs,
+            debug=debug,
+            eia_settings=eia_settings,
+            timezone_cache=timezone_cache,
         )
 
         return (
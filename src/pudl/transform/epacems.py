@@ -1,8 +1,14 @@
 """Module to perform data cleaning functions on EPA CEMS data tables."""
 
 import datetime
+import hashlib
+import os
+from pathlib import Path
+from typing import Self
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytz
 
 import pudl.logging_helpers
@@ -12,6 +18,169 @@ from pudl.metadata.fields import apply_pudl_dtypes
 logger = pudl.logging_helpers.get_logger(__name__)
 
 
+class EpaCemsLookups:
+    """Lookups from EPA CEMS records to EIA plant IDs and UTC offsets.
+
+    The lookups are derived from the EPA CAMD to EIA crosswalk and the EIA plant
+    entities, which are the same for every year and quarter of CEMS data. They are
+    built once per run and written to Arrow IPC files, which each worker memory-maps
+    instead of loading and validating the input tables itself. Records are looked up
+    with binary searches over the sorted keys rather than merges.
+    """
+
+    CROSSWALK_FILENAME = "crosswalk.arrow"
+    UTC_OFFSETS_FILENAME = "utc_offsets.arrow"
+
+    def __init__(self, crosswalk: pa.Table, utc_offsets: pa.Table):
+        """Constructs lookups from their sorted tables.
+
+        Args:
+            crosswalk: ``plant_id_epa``, dictionary encoded ``emissions_unit_id_epa``
+                and ``plant_id_eia`` columns, unique and sorted by plant and unit code.
+            utc_offsets: ``plant_id_eia`` and ``utc_offset_seconds`` columns, sorted by
+                plant.
+        """
+        self.crosswalk = crosswalk
+        self.utc_offsets = utc_offsets
+        units = crosswalk["emissions_unit_id_epa"].combine_chunks()
+        self._unit_ids = pd.Index(units.dictionary.to_pylist(), dtype=object)
+        self._crosswalk_keys = self._keys(
+            crosswalk["plant_id_epa"].to_numpy(), units.indices.to_numpy()
+        )
+        self._crosswalk_plant_id_eia = crosswalk["plant_id_eia"].to_numpy()
+        self._offset_plant_ids = utc_offsets["plant_id_eia"].to_numpy()
+        self._offset_seconds = utc_offsets["utc_offset_seconds"].to_numpy()
+
+    @staticmethod
+    def _keys(plant_id_epa: np.ndarray, unit_codes: np.ndarray) -> np.ndarray:
+        return (plant_id_epa.astype(np.int64) << 32) | unit_codes.astype(np.int64)
+
+    @classmethod
+    def from_frames(
+        cls,
+        core_epa__assn_eia_epacamd: pd.DataFrame,
+        core_eia__entity_plants: pd.DataFrame,
+    ) -> Self:
+        """Build the lookups from the crosswalk and the EIA plant entities.
+
+        Raises:
+            AssertionError: if the crosswalk has more than one ``plant_id_eia`` value
+                for a ``plant_id_epa`` and ``emissions_unit_id_epa``.
+        """
+        crosswalk = (
+            core_epa__assn_eia_epacamd[
+                ["plant_id_epa", "emissions_unit_id_epa", "plant_id_eia"]
+            ]
+            .dropna()
+            .drop_duplicates()
+        )
+        # Make sure the crosswalk does not have multiple plant_id_eia values for each
+        # plant_id_epa and emissions_unit_id_epa value before reassigning IDs.
+        if crosswalk.duplicated(["plant_id_epa", "emissions_unit_id_epa"]).any():
+            raise AssertionError(
+                "The core_epa__assn_eia_epacamd crosswalk has more than one "
+                "plant_id_eia value per plant_id_epa and emissions_unit_id_epa group"
+            )
+        unit_codes, unit_ids = pd.factorize(
+            crosswalk["emissions_unit_id_epa"].astype(str), sort=True
+        )
+        plant_id_epa = crosswalk["plant_id_epa"].to_numpy(dtype=np.int32)
+        order = np.argsort(cls._keys(plant_id_epa, unit_codes), kind="stable")
+        crosswalk_table = pa.table(
+            {
+                "plant_id_epa": pa.array(plant_id_epa[order]),
+                "emissions_unit_id_epa": pa.DictionaryArray.from_arrays(
+                    pa.array(unit_codes[order], type=pa.int32()),
+                    pa.array(unit_ids, type=pa.string()),
+                ),
+                "plant_id_eia": pa.array(
+                    crosswalk["plant_id_eia"].to_numpy(dtype=np.int32)[order]
+                ),
+            }
+        )
+
+        utc_offsets = _load_plant_utc_offset(core_eia__entity_plants).sort_values(
+            "plant_id_eia"
+        )
+        utc_offsets_table = pa.table(
+            {
+                "plant_id_eia": pa.array(
+                    utc_offsets["plant_id_eia"].to_numpy(dtype=np.int32)
+                ),
+                "utc_offset_seconds": pa.array(
+                    utc_offsets["utc_offset"].dt.total_seconds().to_numpy(np.int32)
+                ),
+            }
+        )
+        return cls(crosswalk_table, utc_offsets_table)
+
+    @property
+    def digest(self) -> str:
+        """A hash of the lookups, which changes whenever the transform would."""
+        digest = hashlib.sha256()
+        for table in [self.crosswalk, self.utc_offsets]:
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table.combine_chunks())
+            digest.update(sink.getvalue())
+        return digest.hexdigest()
+
+    def write(self, path: Path) -> None:
+        """Atomically write the lookups to Arrow IPC files in the directory path."""
+        path.mkdir(parents=True, exist_ok=True)
+        for filename, table in [
+            (self.CROSSWALK_FILENAME, self.crosswalk),
+            (self.UTC_OFFSETS_FILENAME, self.utc_offsets),
+        ]:
+            tmp_path = path / f"{filename}.{os.getpid()}.tmp"
+            with pa.ipc.new_file(tmp_path, table.schema) as writer:
+                writer.write_table(table)
+            tmp_path.replace(path / filename)
+
+    @classmethod
+    def read(cls, path: Path) -> Self:
+        """Memory-map lookups written to the directory path."""
+        tables = []
+        for filename in [cls.CROSSWALK_FILENAME, cls.UTC_OFFSETS_FILENAME]:
+            with pa.memory_map(str(path / filename)) as source:
+                tables.append(pa.ipc.open_file(source).read_all())
+        return cls(*tables)
+
+    def plant_id_eia(
+        self, plant_id_epa: pd.Series, emissions_unit_id_epa: pd.Series
+    ) -> np.ndarray:
+        """Look up the EIA plant IDs of EPA plant units.
+
+        Units that aren't in the crosswalk keep their EPA plant ID.
+        """
+        codes, uniques = pd.factorize(emissions_unit_id_epa)
+        unit_codes = np.where(
+            codes >= 0, self._unit_ids.get_indexer(uniques)[codes], -1
+        )
+        plant_id_epa = plant_id_epa.to_numpy(dtype=np.int64)
+        keys = self._keys(plant_id_epa, unit_codes)
+        if not len(self._crosswalk_keys):
+            return plant_id_epa
+        positions = np.minimum(
+            np.searchsorted(self._crosswalk_keys, keys), len(self._crosswalk_keys) - 1
+        )
+        found = (unit_codes >= 0) & (self._crosswalk_keys[positions] == keys)
+        return np.where(found, self._crosswalk_plant_id_eia[positions], plant_id_epa)
+
+    def utc_offset(self, plant_id_eia: np.ndarray) -> np.ndarray:
+        """Look up the UTC offsets of EIA plants, which are NaT if unknown."""
+        plant_id_eia = np.asarray(plant_id_eia, dtype=np.int64)
+        offsets = np.full(len(plant_id_eia), np.timedelta64("NaT"), dtype="m8[s]")
+        if len(self._offset_plant_ids):
+            positions = np.minimum(
+                np.searchsorted(self._offset_plant_ids, plant_id_eia),
+                len(self._offset_plant_ids) - 1,
+            )
+            found = self._offset_plant_ids[positions] == plant_id_eia
+            offsets[found] = self._offset_seconds[positions[found]]
+        return offsets
+
+
 ###############################################################################
 ###############################################################################
 # DATATABLE TRANSFORM FUNCTIONS
@@ -19,7 +188,7 @@ logger = pudl.logging_helpers.get_logger(__name__)
 ###############################################################################
 def harmonize_eia_epa_orispl(
     df: pd.DataFrame,
-    crosswalk_df: pd.DataFrame,
+    lookups: EpaCemsLookups,
 ) -> pd.DataFrame:
     """Harmonize the ORISPL code to match the EIA data.
 
@@ -27,11 +196,11 @@ def harmonize_eia_epa_orispl(
     compiled a crosswalk that maps one set of IDs to the other. The crosswalk is
     integrated into the PUDL db.
 
-    This function merges the crosswalk with the cems data thus adding the official
+    This function looks up each record in the crosswalk thus adding the official
     plant_id_eia column to CEMS. In cases where there is no plant_id_eia value for a
-    given plant_id_epa (i.e., this plant isn't in the crosswalk yet), we use
-    fillna() to add the plant_id_epa value to the plant_id_eia column. Because the
-    plant_id_epa is almost always correct this is reasonable.
+    given plant_id_epa (i.e., this plant isn't in the crosswalk yet), we use the
+    plant_id_epa value for the plant_id_eia column. Because the plant_id_epa is almost
+    always correct this is reasonable.
 
     EIA IDs are more correct so use the crosswalk to fix any erronious EPA IDs and get
     rid of that column to avoid confusion.
@@ -43,40 +212,19 @@ def harmonize_eia_epa_orispl(
 
     Args:
         df: A CEMS hourly dataframe for one year-month-state.
-        crosswalk_df: The core_epa__assn_eia_epacamd dataframe from the database.
+        lookups: Lookups built from the core_epa__assn_eia_epacamd crosswalk.
 
     Returns:
         The same data, with the ORISPL plant codes corrected to match the EIA plant IDs.
     """
-    # Make sure the crosswalk does not have multiple plant_id_eia values for each
-    # plant_id_epa and emissions_unit_id_epa value before reassigning IDs.
-    one_to_many = crosswalk_df.groupby(
-        ["plant_id_epa", "emissions_unit_id_epa"]
-    ).filter(
-        lambda x: x.plant_id_eia.nunique() > 1  # noqa: PD101
-    )
-    if not one_to_many.empty:
-        raise AssertionError(
-            "The core_epa__assn_eia_epacamd crosswalk has more than one plant_id_eia value per "
-            "plant_id_epa and emissions_unit_id_epa group"
+    return df.assign(
+        plant_id_eia=lookups.plant_id_eia(
+            df["plant_id_epa"], df["emissions_unit_id_epa"]
         )
-    crosswalk_df = crosswalk_df[
-        ["plant_id_eia", "plant_id_epa", "emissions_unit_id_epa"]
-    ].drop_duplicates()
-
-    # Merge CEMS with Crosswalk to get correct EIA ORISPL code and fill in all unmapped
-    # values with old plant_id_epa value.
-    df_merged = pd.merge(
-        df,
-        crosswalk_df,
-        on=["plant_id_epa", "emissions_unit_id_epa"],
-        how="left",
-    ).assign(plant_id_eia=lambda x: x.plant_id_eia.fillna(x.plant_id_epa))
-
-    return df_merged
+    )
 
 
-def convert_to_utc(df: pd.DataFrame, plant_utc_offset: pd.DataFrame) -> pd.DataFrame:
+def convert_to_utc(df: pd.DataFrame, lookups: EpaCemsLookups) -> pd.DataFrame:
     """Convert CEMS datetime data to UTC timezones.
 
     Transformations include:
@@ -85,7 +233,7 @@ def convert_to_utc(df: pd.DataFrame, plant_utc_offset: pd.DataFrame) -> pd.DataF
 
     Args:
         df: A CEMS hourly dataframe for one year-state.
-        plant_utc_offset: A dataframe association with timezones.
+        lookups: Lookups with the UTC offsets of the EIA plants.
 
     Returns:
         The same data, with an op_datetime_utc column added and the op_date and op_hour
@@ -96,14 +244,11 @@ def convert_to_utc(df: pd.DataFrame, plant_utc_offset: pd.DataFrame) -> pd.DataF
         # Note that doing this conversion, rather than reading the CSV with
         # `parse_dates=True`, is >10x faster.
         # Read the date as a datetime, so all the dates are midnight
-        op_datetime_naive=lambda x: pd.to_datetime(
-            x.op_date, format=r"%Y-%m-%d", exact=True, cache=True
-        )
-        + pd.to_timedelta(x.op_hour, unit="h")  # Add the hour
-    ).merge(
-        plant_utc_offset,
-        how="left",
-        on="plant_id_eia",
+        op_datetime_naive=lambda x: (
+            pd.to_datetime(x.op_date, format=r"%Y-%m-%d", exact=True, cache=True)
+            + pd.to_timedelta(x.op_hour, unit="h")
+        ),  # Add the hour
+        utc_offset=lambda x: lookups.utc_offset(x.plant_id_eia),
     )
 
     # Some of the timezones in the core_eia__entity_plants table may be missing,
@@ -144,9 +289,12 @@ def _load_plant_utc_offset(core_eia__entity_plants: pd.DataFrame) -> pd.DataFram
     """
     timezones = core_eia__entity_plants[["plant_id_eia", "timezone"]].copy().dropna()
     jan1 = datetime.datetime(2011, 1, 1)  # year doesn't matter
-    timezones["utc_offset"] = timezones["timezone"].apply(
-        lambda tz: pytz.timezone(tz).localize(jan1).utcoffset()
-    )
+    # Few distinct timezones are shared by all the plants.
+    utc_offsets = {
+        tz: pytz.timezone(tz).localize(jan1).utcoffset()
+        for tz in timezones["timezone"].unique()
+    }
+    timezones["utc_offset"] = pd.to_timedelta(timezones["timezone"].map(utc_offsets))
     del timezones["timezone"]
     return timezones
 
@@ -172,16 +320,99 @@ def correct_gross_load_mw(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def transform(
-    raw_df: pd.DataFrame,
-    core_epa__assn_eia_epacamd: pd.DataFrame,
-    core_eia__entity_plants: pd.DataFrame,
-) -> pd.DataFrame:
+ROLLUP_UNIT_KEYS = ["plant_id_eia", "plant_id_epa", "emissions_unit_id_epa"]
+"""Columns identifying an emissions unit in the EPA CEMS rollups."""
+
+ROLLUP_PLANT_KEYS = ["plant_id_eia"]
+"""Columns identifying a plant in the EPA CEMS rollups."""
+
+ROLLUP_FREQUENCIES = {"daily": "D", "monthly": "M", "yearly": "Y"}
+"""Numpy datetime units of the periods of the EPA CEMS rollups, by table name prefix."""
+
+
+def sum_emissions(df: pd.DataFrame, by: list[str]) -> pd.DataFrame:
+    """Sum EPA CEMS emissions and operating time over groups of records.
+
+    Sums are null for groups in which every value is null. Because they are sums, rollups
+    of partial rollups are the same as rollups of the hourly records they summarize, so
+    this is used both to aggregate hourly records and to combine or coarsen rollups.
+
+    Args:
+        df: hourly records or rollups, with the ``by`` columns and the summed columns
+            of the rollup tables.
+        by: columns to group the records by.
+
+    Returns:
+        One record per group, sorted by the ``by`` columns.
+    """
+    return (
+        df.groupby(by, observed=True, dropna=False, sort=True)
+        .sum(min_count=1)
+        .reset_index()
+    )
+
+
+def rollup_unit_days(df: pd.DataFrame, lookups: EpaCemsLookups) -> pd.DataFrame:
+    """Sum transformed hourly EPA CEMS records by emissions unit and day.
+
+    Days are in the local standard time of each plant, which is how CEMS records are
+    reported, so every day falls entirely within a single year_quarter of data.
+
+    Args:
+        df: transformed hourly EPA CEMS records, see :func:`transform`.
+        lookups: Lookups with the UTC offsets of the EIA plants.
+
+    Returns:
+        Daily emissions by unit, with the columns of the
+        ``out_epacems__daily_emissions_by_unit`` table.
+    """
+    operating_time = df["operating_time_hours"]
+    local_time = df["operating_datetime_utc"].to_numpy() + lookups.utc_offset(
+        df["plant_id_eia"]
+    )
+    hourly = df[ROLLUP_UNIT_KEYS].assign(
+        report_date=local_time.astype("M8[D]"),
+        operating_time_hours=operating_time,
+        operating_hour_count=(operating_time > 0).astype("int64"),
+        gross_generation_mwh=df["gross_load_mw"] * operating_time,
+        heat_content_mmbtu=df["heat_content_mmbtu"],
+        steam_load_1000_lbs=df["steam_load_1000_lbs"],
+        so2_mass_lbs=df["so2_mass_lbs"],
+        nox_mass_lbs=df["nox_mass_lbs"],
+        co2_mass_tons=df["co2_mass_tons"],
+    )
+    return sum_emissions(hourly, [*ROLLUP_UNIT_KEYS, "report_date"])
+
+
+def rollup_emissions(unit_days: pd.DataFrame, freq: str, by: list[str]) -> pd.DataFrame:
+    """Coarsen daily emissions by unit into longer periods or larger groups.
+
+    Args:
+        unit_days: daily emissions by unit, see :func:`rollup_unit_days`.
+        freq: one of the values of :data:`ROLLUP_FREQUENCIES`.
+        by: the columns identifying the units or plants to sum over, without
+            ``report_date``.
+
+    Returns:
+        Emissions summed by the ``by`` columns and the start date of each period.
+    """
+    report_date = unit_days["report_date"].to_numpy().astype(f"M8[{freq}]")
+    return sum_emissions(
+        unit_days[by].assign(
+            report_date=report_date.astype("M8[ns]"),
+            **unit_days.drop(columns=[*ROLLUP_UNIT_KEYS, "report_date"]),
+        ),
+        [*by, "report_date"],
+    )
+
+
+def transform(raw_df: pd.DataFrame, lookups: EpaCemsLookups) -> pd.DataFrame:
     """Transform EPA CEMS hourly data and ready it for export to Parquet.
 
     Args:
         raw_df: An extracted by not yet transformed year_quarter of EPA CEMS data.
-        pudl_engine: SQLAlchemy connection engine for connecting to an existing PUDL DB.
+        lookups: The crosswalk and UTC offset lookups, see
+            :meth:`EpaCemsLookups.from_frames`.
 
     Returns:
         A single year_quarter of EPA CEMS data
@@ -191,11 +422,8 @@ def transform(
     return (
         raw_df.pipe(apply_pudl_dtypes, group="epacems")
         .pipe(remove_leading_zeros_from_numeric_strings, "emissions_unit_id_epa")
-        .pipe(harmonize_eia_epa_orispl, core_epa__assn_eia_epacamd)
-        .pipe(
-            convert_to_utc,
-            plant_utc_offset=_load_plant_utc_offset(core_eia__entity_plants),
-        )
+        .pipe(harmonize_eia_epa_orispl, lookups)
+        .pipe(convert_to_utc, lookups)
         .pipe(correct_gross_load_mw)
         .pipe(apply_pudl_dtypes, group="epacems")
     )
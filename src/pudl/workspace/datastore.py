@@ -3,14 +3,16 @@
 import hashlib
 import io
 import json
+import mmap
 import pathlib
 import re
 import sys
 import zipfile
 from collections import defaultdict
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Annotated, Any, Self
+from typing import Annotated, Any, BinaryIO, Self
 from urllib.parse import ParseResult, urlparse
 
 import click
@@ -37,6 +39,9 @@ ZenodoDoi = Annotated[
     ),
 ]
 
+DOWNLOAD_CHUNK_SIZE = 2**20
+"""Number of bytes read from the network at a time when streaming resources to disk."""
+
 
 class ChecksumMismatchError(ValueError):
     """Resource checksum (md5) does not match."""
@@ -92,13 +97,21 @@ class DatapackageDescriptor:
 
     def validate_checksum(self, name: str, content: str) -> bool:
         """Returns True if content matches checksum for given named resource."""
-        expected_checksum = self._get_resource_metadata(name)["hash"]
         m = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
         m.update(content)
-        if m.hexdigest() != expected_checksum:
+        self.validate_digest(name, m.hexdigest())
+
+    def get_checksum(self, name: str) -> str:
+        """Returns the expected md5 checksum of the given named resource."""
+        return self._get_resource_metadata(name)["hash"]
+
+    def validate_digest(self, name: str, digest: str) -> None:
+        """Raise ChecksumMismatchError if md5 digest doesn't match given resource."""
+        expected_checksum = self.get_checksum(name)
+        if digest != expected_checksum:
             raise ChecksumMismatchError(
                 f"Checksum for resource {name} does not match."
-                f"Expected {expected_checksum}, got {m.hexdigest()}"
+                f"Expected {expected_checksum}, got {digest}"
             )
 
     def _matches(self, res: dict, **filters: Any):
@@ -223,9 +236,19 @@ class ZenodoFetcher:
     timeout: float
 
     def __init__(
-        self: Self, zenodo_dois: ZenodoDoiSettings | None = None, timeout: float = 15.0
+        self: Self,
+        zenodo_dois: ZenodoDoiSettings | None = None,
+        timeout: float = 15.0,
+        max_connections: int = 10,
     ):
-        """Constructs ZenodoFetcher instance."""
+        """Constructs ZenodoFetcher instance.
+
+        Args:
+            zenodo_dois: DOIs of the archived datasets. Defaults to the production DOIs.
+            timeout: connection timeout (in seconds) for requests to Zenodo.
+            max_connections: number of connections to keep open per host. This should
+                be at least the number of threads downloading resources concurrently.
+        """
         if not zenodo_dois:
             self.zenodo_dois = ZenodoDoiSettings()
 
@@ -234,7 +257,7 @@ class ZenodoFetcher:
         retries = Retry(
             backoff_factor=2, total=3, status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retries)
+        adapter = HTTPAdapter(max_retries=retries, pool_maxsize=max_connections)
         self.http = requests.Session()
         self.http.mount("http://", adapter)
         self.http.mount("https://", adapter)
@@ -303,6 +326,84 @@ class ZenodoFetcher:
         desc.validate_checksum(res.name, content)
         return content
 
+    def download_resource(
+        self: Self, res: PudlResourceKey, path: Path, max_attempts: int = 3
+    ) -> Path:
+        """Stream the contents of a resource from zenodo into a file.
+
+        The content is written in chunks to a ``.part`` file next to ``path`` while
+        its md5 checksum is computed incrementally, and only moved into place once the
+        checksum has been verified. If the download is interrupted, the partial file is
+        kept and the transfer is resumed with an HTTP range request, both on the next
+        attempt and on subsequent calls.
+
+        Args:
+            res: the resource to download.
+            path: where to store the verified contents of the resource.
+            max_attempts: how many times to resume an interrupted download before
+                giving up.
+
+        Returns:
+            The path the resource was written to.
+        """
+        desc = self.get_descriptor(res.dataset)
+        url = desc.get_resource_path(res.name)
+        part_path = path.with_name(f"{path.name}.part")
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        for attempt in range(1, max_attempts + 1):
+            try:
+                digest = self._stream_to_file(url, part_path)
+                break
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.Timeout,
+            ) as err:
+                if attempt == max_attempts:
+                    raise
+                logger.warning(f"Download of {res} was interrupted ({err}). Resuming.")
+        try:
+            desc.validate_digest(res.name, digest)
+        except ChecksumMismatchError:
+            part_path.unlink()
+            raise
+        part_path.replace(path)
+        return path
+
+    def _stream_to_file(self: Self, url: HttpUrl, part_path: Path) -> str:
+        """Append the remainder of url to part_path and return md5 of the whole file."""
+        md5 = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
+        offset = 0
+        if part_path.exists():
+            with part_path.open("rb") as f:
+                md5 = hashlib.file_digest(f, "md5")
+                offset = f.tell()
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        logger.info(f"Streaming {url} from zenodo (starting at byte {offset})")
+        with self.http.get(
+            url, headers=headers, stream=True, timeout=self.timeout
+        ) as response:
+            if response.status_code == requests.codes.partial_content:
+                mode = "ab"
+            elif response.status_code == requests.codes.ok:
+                # The server ignored the range request and is sending everything.
+                md5 = hashlib.md5()  # noqa: S324
+                mode = "wb"
+            elif (
+                response.status_code == requests.codes.requested_range_not_satisfiable
+                and offset
+            ):
+                # The partial file already holds the complete resource.
+                return md5.hexdigest()
+            else:
+                raise ValueError(f"Could not download {url}: {response.text}")
+            with part_path.open(mode) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    md5.update(chunk)
+        logger.debug(f"Successfully downloaded {url}")
+        return md5.hexdigest()
+
 
 class Datastore:
     """Handle connections and downloading of Zenodo Source archives."""
@@ -312,6 +413,7 @@ class Datastore:
         local_cache_path: Path | None = None,
         gcs_cache_path: str | None = None,
         timeout: float = 15.0,
+        max_concurrency: int = 4,
     ):
         # TODO(rousik): figure out an efficient way to configure datastore caching
         """Datastore manages file retrieval for PUDL datasets.
@@ -324,13 +426,19 @@ class Datastore:
                 format: gs://bucket[/path_prefix]
             timeout: connection timeouts (in seconds) to use when connecting
                 to Zenodo servers.
+            max_concurrency: maximum number of resources to download from Zenodo at
+                the same time. Concurrent downloads are streamed directly into the local
+                cache, so they only happen when local_cache_path is provided.
         """
         self._cache = resource_cache.LayeredCache()
+        self._local_cache: resource_cache.LocalFileCache | None = None
         self._datapackage_descriptors: dict[str, DatapackageDescriptor] = {}
+        self.max_concurrency = max_concurrency
 
         if local_cache_path:
             logger.info(f"Adding local cache layer at {local_cache_path}")
-            self._cache.add_cache_layer(resource_cache.LocalFileCache(local_cache_path))
+            self._local_cache = resource_cache.LocalFileCache(local_cache_path)
+            self._cache.add_cache_layer(self._local_cache)
         if gcs_cache_path:
             try:
                 logger.info(f"Adding GCS cache layer at {gcs_cache_path}")
@@ -343,7 +451,9 @@ class Datastore:
                     f"Falling back to Zenodo if necessary. Error was: {e}"
                 )
 
-        self._zenodo_fetcher = ZenodoFetcher(timeout=timeout)
+        self._zenodo_fetcher = ZenodoFetcher(
+            timeout=timeout, max_connections=max(10, max_concurrency)
+        )
 
     def get_known_datasets(self) -> list[str]:
         """Returns list of supported datasets."""
@@ -387,10 +497,15 @@ class Datastore:
             (PudlResourceKey, io.BytesIO) holding content for each matching resource
         """
         desc = self.get_datapackage_descriptor(dataset)
+        resources = []
         for res in desc.get_resources(**filters):
             if self._cache.is_optimally_cached(res) and skip_optimally_cached:
                 logger.info(f"{res} is already optimally cached.")
                 continue
+            resources.append(res)
+        if not cached_only:
+            self.download_resources(resources)
+        for res in resources:
             if self._cache.contains(res):
                 contents = self._cache.get(res)
                 logger.info(f"Retrieved {res} from cache.")
@@ -404,6 +519,123 @@ class Datastore:
                 self._cache.add(res, contents)
                 yield (res, contents)
 
+    def download_resources(self, resources: list[PudlResourceKey]) -> None:
+        """Concurrently download uncached resources from Zenodo into the local cache.
+
+        Each resource is streamed straight to disk and checksummed as it arrives, with
+        at most ``max_concurrency`` downloads in flight. Resources that are already
+        present in any cache layer are skipped. If the datastore has no writable local
+        cache or only allows one download at a time, this does nothing and the
+        resources are fetched one at a time by :meth:`get_resources` instead.
+        """
+        if not self._has_writable_local_cache() or self.max_concurrency <= 1:
+            return
+        missing = [res for res in resources if not self._cache.contains(res)]
+        if not missing:
+            return
+        logger.info(
+            f"Downloading {len(missing)} resources from zenodo using up to "
+            f"{self.max_concurrency} concurrent connections."
+        )
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = {
+                executor.submit(
+                    self._zenodo_fetcher.download_resource,
+                    res,
+                    self._local_cache.resource_path(res),
+                ): res
+                for res in missing
+            }
+            for future in as_completed(futures):
+                # Surface the first failure. Remaining downloads still finish, and
+                # any partial files left behind will be resumed on the next attempt.
+                future.result()
+                res = futures[future]
+                logger.info(f"Retrieved {res} from zenodo.")
+                # The checksum was verified while downloading, so record it.
+                desc = self.get_datapackage_descriptor(res.dataset)
+                self._local_cache.set_digest(res, desc.get_checksum(res.name))
+
+    @property
+    def local_cache_path(self) -> Path | None:
+        """Root directory of the local file cache, if the datastore has one."""
+        if self._local_cache is None:
+            return None
+        return self._local_cache.cache_root_dir
+
+    def _has_writable_local_cache(self) -> bool:
+        return self._local_cache is not None and not self._local_cache.is_read_only()
+
+    def get_resource_path(self, res: PudlResourceKey) -> Path:
+        """Returns the path to a verified copy of the resource in the local cache.
+
+        Resources that aren't in the local cache yet are copied there from the other
+        cache layers, or streamed from Zenodo. The checksum of each cached file is
+        verified once and recorded next to it, so later calls don't need to read the
+        whole file again. Cached files that fail verification are downloaded again.
+
+        Raises:
+            RuntimeError: if the datastore has no writable local cache.
+        """
+        if not self._has_writable_local_cache():
+            raise RuntimeError(
+                f"Can't get a path to {res} without a writable local cache."
+            )
+        desc = self.get_datapackage_descriptor(res.dataset)
+        checksum = desc.get_checksum(res.name)
+        path = self._local_cache.resource_path(res)
+        if self._local_cache.contains(res):
+            if self._local_cache.get_digest(res) == checksum:
+                return path
+            with path.open("rb") as f:
+                digest = hashlib.file_digest(f, "md5").hexdigest()
+            if digest == checksum:
+                self._local_cache.set_digest(res, digest)
+                return path
+            logger.warning(f"Cached {res} has invalid checksum. Fetching it again.")
+            self._local_cache.delete(res)
+        if self._cache.contains(res):
+            content = self._cache.get(res)
+            desc.validate_checksum(res.name, content)
+            self._local_cache.add(res, content)
+        else:
+            logger.info(f"Retrieving {res} from zenodo.")
+            self._zenodo_fetcher.download_resource(res, path)
+        self._local_cache.set_digest(res, checksum)
+        return path
+
+    def open_resource(
+        self, dataset: str, use_mmap: bool = False, **filters: Any
+    ) -> BinaryIO | mmap.mmap:
+        """Opens the unique resource matching filters for reading.
+
+        If the datastore has a writable local cache, the cached file is opened directly
+        (see :meth:`get_resource_path`) rather than being read into memory, optionally
+        as a read-only memory map. Otherwise the contents are wrapped in a BytesIO.
+
+        Args:
+            dataset: name of the dataset to query.
+            use_mmap: if True, memory map the cached file instead of opening it.
+            filters (key=val): only return resources that match the key-value mapping in
+                their metadata["parts"].
+        """
+        if not self._has_writable_local_cache():
+            return io.BytesIO(self.get_unique_resource(dataset, **filters))
+        path = self.get_resource_path(self.get_unique_resource_key(dataset, **filters))
+        if use_mmap:
+            return _mmap_file(path)
+        return path.open("rb")
+
+    def get_unique_resource_key(self, dataset: str, **filters: Any) -> PudlResourceKey:
+        """Returns key of the resource matching filters, assuming there is only one."""
+        desc = self.get_datapackage_descriptor(dataset)
+        resources = list(desc.get_resources(**filters))
+        if not resources:
+            raise KeyError(f"No resources found for {dataset}: {filters}")
+        if len(resources) > 1:
+            raise KeyError(f"Multiple resources found for {dataset}: {filters}")
+        return resources[0]
+
     def remove_from_cache(self, res: PudlResourceKey) -> None:
         """Remove given resource from the associated cache."""
         self._cache.delete(res)
@@ -421,8 +653,21 @@ class Datastore:
             return content
         raise KeyError(f"Multiple resources found for {dataset}: {filters}")
 
-    def get_zipfile_resource(self, dataset: str, **filters: Any) -> zipfile.ZipFile:
-        """Retrieves unique resource and opens it as a ZipFile."""
+    def get_zipfile_resource(
+        self, dataset: str, use_mmap: bool = False, **filters: Any
+    ) -> zipfile.ZipFile:
+        """Retrieves unique resource and opens it as a ZipFile.
+
+        If the datastore has a writable local cache, the archive is opened directly
+        from disk (or memory mapped if use_mmap is True) instead of being read into
+        memory, and its checksum is only verified the first time it is accessed.
+        """
+        if self._has_writable_local_cache():
+            res = self.get_unique_resource_key(dataset, **filters)
+            path = self.get_resource_path(res)
+            logger.info(f"Opening {res} from {path} as a ZipFile")
+            file = _mmap_file(path) if use_mmap else path
+            return retry(zipfile.ZipFile, retry_on=(zipfile.BadZipFile), file=file)
         resource_bytes = self.get_unique_resource(dataset, **filters)
         resource = io.BytesIO(resource_bytes)
         md5sum = hashlib.file_digest(resource, "md5").hexdigest()
@@ -436,6 +681,20 @@ class Datastore:
         self, dataset: str, **filters: Any
     ) -> Iterator[tuple[PudlResourceKey, zipfile.ZipFile]]:
         """Iterates over resources that match filters and opens each as ZipFile."""
+        if self._has_writable_local_cache():
+            desc = self.get_datapackage_descriptor(dataset)
+            resources = list(desc.get_resources(**filters))
+            self.download_resources(resources)
+            for resource_key in resources:
+                yield (
+                    resource_key,
+                    retry(
+                        zipfile.ZipFile,
+                        retry_on=(zipfile.BadZipFile),
+                        file=self.get_resource_path(resource_key),
+                    ),
+                )
+            return
         for resource_key, content in self.get_resources(dataset, **filters):
             yield (
                 resource_key,
@@ -447,6 +706,24 @@ class Datastore:
         return zipfile.ZipFile.namelist(zip_file)
 
 
+class _ReadOnlyMmap(mmap.mmap):
+    """A memory map that can stand in for a seekable binary file.
+
+    :class:`mmap.mmap` only gained ``seekable()`` in Python 3.13, but
+    :class:`zipfile.ZipFile` requires it when reading members.
+    """
+
+    def seekable(self) -> bool:
+        """Memory maps always support random access."""
+        return True
+
+
+def _mmap_file(path: Path) -> mmap.mmap:
+    """Memory map a file for reading."""
+    with path.open("rb") as f:
+        return _ReadOnlyMmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def print_partitions(dstore: Datastore, datasets: list[str]) -> None:
     """Prints known partition keys and its values for each of the datasets."""
     for single_ds in datasets:
@@ -596,6 +873,16 @@ def _parse_key_values(
         "project to pay data egress costs."
     ),
 )
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help=(
+        "Maximum number of files to download from Zenodo at the same time. "
+        "Interrupted downloads are resumed the next time the command is run."
+    ),
+)
 @click.option(
     "--logfile",
     help="If specified, write logs to this file.",
@@ -619,6 +906,7 @@ def pudl_datastore(
     partition: dict[str, int | str],
     gcs_cache_path: str,
     bypass_local_cache: bool,
+    max_concurrency: int,
     logfile: pathlib.Path,
     loglevel: str,
 ):
@@ -653,6 +941,7 @@ def pudl_datastore(
     dstore = Datastore(
         gcs_cache_path=gcs_cache_path,
         local_cache_path=cache_path,
+        max_concurrency=max_concurrency,
     )
 
     if partition:
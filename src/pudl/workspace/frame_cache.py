@@ -0,0 +1,177 @@
+"""A size-bounded on-disk cache of decoded dataframes shared between processes.
+
+Parsing raw inputs like Excel workbooks is often far slower than reading the same data
+back from a columnar format. :class:`DataFrameCache` stores decoded dataframes as Arrow
+IPC files keyed by a dictionary describing how they were produced, so that later runs,
+and other processes running at the same time, can reuse them.
+
+Entries are written atomically, so concurrent readers and writers never see partially
+written files. Once the cache grows beyond its size limit, the least recently used
+entries are evicted.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import pudl.logging_helpers
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+DEFAULT_MAX_CACHE_BYTES = 4 * 2**30
+"""Default size limit of a :class:`DataFrameCache` (4 GiB)."""
+
+OBJECT_NULLS_METADATA_KEY = b"pudl_object_nulls"
+"""Arrow schema metadata key recording the null values of object columns."""
+
+OBJECT_NULLS = {"NaN": np.nan, "NA": pd.NA}
+"""Null values of object columns restored on read. Arrow reads all of them as None."""
+
+
+def _null_kind(value: Any) -> str:
+    """Name of a null value, like the keys of :data:`OBJECT_NULLS`."""
+    if value is None:
+        return "None"
+    if value is pd.NA:
+        return "NA"
+    if isinstance(value, float):
+        return "NaN"
+    return type(value).__name__
+
+
+def _object_nulls(df: pd.DataFrame) -> dict[str, str] | None:
+    """Null value of each object column whose nulls aren't None.
+
+    Returns:
+        The name of the null value (a key of :data:`OBJECT_NULLS`) of each object
+        column with NaN or NA values. None if a column mixes different null values,
+        or holds nulls that can't be restored, like NaT.
+    """
+    nulls = {}
+    for col in df.select_dtypes(include="object").columns:
+        kinds = {_null_kind(value) for value in df[col][df[col].isna()]}
+        if len(kinds) > 1 or not kinds <= {"None", *OBJECT_NULLS}:
+            return None
+        if kinds and kinds != {"None"}:
+            nulls[col] = kinds.pop()
+    return nulls
+
+
+class DataFrameCache:
+    """Stores dataframes as Arrow IPC files, evicting the least recently used."""
+
+    SUFFIX = ".arrow"
+    FORMAT_VERSION = 2
+    """Version of the entries, so that entries in older formats are never read."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        """Constructs a DataFrameCache that stores its entries in cache_dir.
+
+        Args:
+            cache_dir: directory holding the cache entries. Created if necessary.
+            max_bytes: total size of the entries above which the least recently used
+                ones are deleted.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: dict[str, Any]) -> Path:
+        digest = hashlib.sha256(
+            json.dumps(
+                {"key": key, "format_version": self.FORMAT_VERSION},
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+        return self.cache_dir / f"{digest}{self.SUFFIX}"
+
+    def get(self, key: dict[str, Any]) -> pd.DataFrame | None:
+        """Returns the dataframe stored under key, or None if it isn't cached."""
+        path = self._path(key)
+        try:
+            with pa.memory_map(str(path)) as source:
+                table = pa.ipc.open_file(source).read_all()
+            # Mark the entry as recently used.
+            path.touch()
+        except (FileNotFoundError, pa.ArrowInvalid) as err:
+            if not isinstance(err, FileNotFoundError):
+                logger.warning(f"Ignoring unreadable cache entry {path}: {err}")
+            return None
+        logger.debug(f"Read cached dataframe for {key} from {path}")
+        df = table.to_pandas()
+        metadata = table.schema.metadata or {}
+        for col, null in json.loads(
+            metadata.get(OBJECT_NULLS_METADATA_KEY, b"{}")
+        ).items():
+            values = df[col].to_numpy(dtype=object, copy=True)
+            values[pd.isna(values)] = OBJECT_NULLS[null]
+            df[col] = pd.Series(values, index=df.index, dtype=object)
+        return df
+
+    def add(self, key: dict[str, Any], df: pd.DataFrame) -> bool:
+        """Stores df under key, if it can be represented faithfully in Arrow.
+
+        Dataframes whose column labels aren't unique strings, or with object columns
+        that mix incompatible types, can't round trip through Arrow and are not cached.
+        Arrow stores all of the nulls of object columns alike, so the NaN or NA nulls
+        of each object column are recorded and restored on read, and dataframes with
+        object columns mixing different nulls are not cached either.
+
+        Returns:
+            True if the dataframe was cached.
+        """
+        if not all(isinstance(col, str) for col in df.columns) or (
+            not df.columns.is_unique
+        ):
+            logger.debug(f"Not caching {key}: column labels aren't unique strings.")
+            return False
+        object_nulls = _object_nulls(df)
+        if object_nulls is None:
+            logger.debug(f"Not caching {key}: object columns mix different nulls.")
+            return False
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as err:
+            logger.debug(f"Not caching {key}: {err}")
+            return False
+        table = table.replace_schema_metadata(
+            (table.schema.metadata or {})
+            | {OBJECT_NULLS_METADATA_KEY: json.dumps(object_nulls).encode("utf-8")}
+        )
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as sink, pa.ipc.new_file(sink, table.schema) as w:
+                w.write_table(table)
+            Path(tmp_name).replace(self._path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Another process evicted it first.
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            logger.debug(f"Evicting {path} from the dataframe cache.")
+            path.unlink(missing_ok=True)
+            total_bytes -= size
@@ -1,5 +1,6 @@
 """Implementations of datastore resource caches."""
 
+import json
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, NamedTuple
@@ -82,30 +83,42 @@ class AbstractCache(ABC):
 
 
 class LocalFileCache(AbstractCache):
-    """Simple key-value store mapping PudlResourceKeys to ByteIO contents."""
+    """Simple key-value store mapping PudlResourceKeys to ByteIO contents.
+
+    Alongside each resource, the cache can record the md5 digest of its contents in a
+    small ``.md5`` sidecar file, so that a resource only needs to be checksummed once
+    rather than every time it is accessed. The sidecar also records the size and
+    modification time of the resource, and is ignored if the file has changed since.
+    """
 
     def __init__(self, cache_root_dir: Path, **kwargs: Any):
         """Constructs LocalFileCache that stores resources under cache_root_dir."""
         super().__init__(**kwargs)
         self.cache_root_dir = cache_root_dir
 
-    def _resource_path(self, resource: PudlResourceKey) -> Path:
+    def resource_path(self, resource: PudlResourceKey) -> Path:
+        """Returns the path where the given resource is stored in this cache."""
         return self.cache_root_dir / resource.get_local_path()
 
+    def _digest_path(self, resource: PudlResourceKey) -> Path:
+        path = self.resource_path(resource)
+        return path.with_name(f"{path.name}.md5")
+
     def get(self, resource: PudlResourceKey) -> bytes:
         """Retrieves value associated with a given resource."""
-        with self._resource_path(resource).open("rb") as res:
+        with self.resource_path(resource).open("rb") as res:
             logger.debug(f"Getting {resource} from local file cache.")
             return res.read()
 
     def add(self, resource: PudlResourceKey, content: bytes):
         """Adds (or updates) resource to the cache with given value."""
-        logger.debug(f"Adding {resource} to {self._resource_path}")
+        logger.debug(f"Adding {resource} to {self.resource_path}")
         if self.is_read_only():
             logger.debug(f"Read only cache: ignoring set({resource})")
             return
-        path = self._resource_path(resource)
+        path = self.resource_path(resource)
         path.parent.mkdir(parents=True, exist_ok=True)
+        self._digest_path(resource).unlink(missing_ok=True)
         with path.open("wb") as file:
             file.write(content)
 
@@ -114,11 +127,42 @@ class LocalFileCache(AbstractCache):
         if self.is_read_only():
             logger.debug(f"Read only cache: ignoring delete({resource})")
             return
-        self._resource_path(resource).unlink(missing_ok=True)
+        self._digest_path(resource).unlink(missing_ok=True)
+        self.resource_path(resource).unlink(missing_ok=True)
 
     def contains(self, resource: PudlResourceKey) -> bool:
         """Returns True if resource is present in the cache."""
-        return self._resource_path(resource).exists()
+        return self.resource_path(resource).exists()
+
+    def get_digest(self, resource: PudlResourceKey) -> str | None:
+        """Returns the recorded md5 digest of a resource, if it is still current.
+
+        Returns None if no digest has been recorded, or if the resource has been
+        modified since it was.
+        """
+        try:
+            recorded = json.loads(self._digest_path(resource).read_text())
+            stat = self.resource_path(resource).stat()
+        except (OSError, ValueError):
+            return None
+        if (recorded.get("size"), recorded.get("mtime_ns")) != (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return None
+        return recorded.get("md5")
+
+    def set_digest(self, resource: PudlResourceKey, digest: str) -> None:
+        """Records the md5 digest of a resource that has been verified."""
+        if self.is_read_only():
+            logger.debug(f"Read only cache: ignoring set_digest({resource})")
+            return
+        stat = self.resource_path(resource).stat()
+        self._digest_path(resource).write_text(
+            json.dumps(
+                {"md5": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            )
+        )
 
 
 class GoogleCloudStorageCache(AbstractCache):
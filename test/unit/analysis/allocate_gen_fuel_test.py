@@ -3,6 +3,7 @@
 from io import StringIO
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -411,6 +412,121 @@ def test_allocate_gen_fuel_by_generator_drops_pm_data(extra_pm_in_bf):
     assert ratio_bf != ratio_allocated
 
 
+def test_allocate_gen_fuel_by_plant_shards(extra_pm_in_bf):
+    """Allocating shards of plants in parallel gives the same result."""
+    # A second plant, so that the plants are split across the shards
+    gf, bf, gen, bga, gens = (
+        pd.concat([df, df.assign(plant_id_eia=df.plant_id_eia + 1)], ignore_index=True)
+        for df in allocate_gen_fuel.select_input_data(
+            gf=extra_pm_in_bf.gf_eia923(),
+            bf=extra_pm_in_bf.bf_eia923(),
+            gen=extra_pm_in_bf.gen_eia923(),
+            bga=extra_pm_in_bf.bga_eia860(),
+            gens=extra_pm_in_bf.gens_eia860(),
+        )
+    )
+    gen.loc[gen.plant_id_eia == 8024, "net_generation_mwh"] *= 2
+    allocated = allocate_gen_fuel.allocate_gen_fuel_by_generator_energy_source(
+        gf=gf, bf=bf, gen=gen, bga=bga, gens=gens, freq=extra_pm_in_bf.freq
+    )
+    sharded = allocate_gen_fuel.allocate_gen_fuel_by_generator_energy_source(
+        gf=gf,
+        bf=bf,
+        gen=gen,
+        bga=bga,
+        gens=gens,
+        freq=extra_pm_in_bf.freq,
+        plant_shards=2,
+        workers=2,
+    )
+    assert set(allocated.plant_id_eia) == {8023, 8024}
+    pd.testing.assert_frame_equal(
+        sharded.reset_index(drop=True), allocated.reset_index(drop=True)
+    )
+
+
+def test_allocate_gen_fuel_with_more_shards_than_plants(base_case):
+    """Shards without any plants are skipped."""
+    gf, bf, gen, bga, gens = allocate_gen_fuel.select_input_data(
+        gf=base_case.gf_eia923(),
+        bf=base_case.bf_eia923(),
+        gen=base_case.gen_eia923(),
+        bga=base_case.bga_eia860(),
+        gens=base_case.gens_eia860(),
+    )
+    allocated = allocate_gen_fuel.allocate_gen_fuel_by_generator_energy_source(
+        gf=gf, bf=bf, gen=gen, bga=bga, gens=gens, freq=base_case.freq
+    )
+    sharded = allocate_gen_fuel.allocate_gen_fuel_by_generator_energy_source(
+        gf=gf,
+        bf=bf,
+        gen=gen,
+        bga=bga,
+        gens=gens,
+        freq=base_case.freq,
+        plant_shards=3,
+        workers=2,
+    )
+    pd.testing.assert_frame_equal(
+        sharded.reset_index(drop=True), allocated.reset_index(drop=True)
+    )
+
+
+def test_agg_monthly_allocation_by_year(base_case):
+    """The yearly sums of the monthly allocation reconcile with the yearly allocation."""
+    gf, bf, gen, bga, gens = allocate_gen_fuel.select_input_data(
+        gf=base_case.gf_eia923(),
+        bf=base_case.bf_eia923(),
+        gen=base_case.gen_eia923(),
+        bga=base_case.bga_eia860(),
+        gens=base_case.gens_eia860(),
+    )
+    yearly = allocate_gen_fuel.allocate_gen_fuel_by_generator_energy_source(
+        gf=gf, bf=bf, gen=gen, bga=bga, gens=gens, freq="YS"
+    )
+
+    # Spread the yearly data across the months of the year, or report all of it in
+    # January like annual respondents, and add a month of a year to date.
+    def to_months(df: pd.DataFrame, annual_reporter: bool) -> pd.DataFrame:
+        data_cols = df.columns.intersection(allocate_gen_fuel.DATA_COLUMNS)
+        months = [df.assign(report_date=pd.Timestamp("2020-01-01"))]
+        for month in range(1, 13):
+            if not annual_reporter:
+                values = df[data_cols] / 12
+            elif month == 1:
+                values = df[data_cols]
+            else:
+                values = dict.fromkeys(data_cols, np.nan)
+            months.append(df.assign(report_date=pd.Timestamp(2019, month, 1), **values))
+        return pd.concat(months, ignore_index=True).pipe(apply_pudl_dtypes, group="eia")
+
+    monthly = allocate_gen_fuel.allocate_gen_fuel_by_generator_energy_source(
+        gf=to_months(gf, annual_reporter=False),
+        bf=to_months(bf, annual_reporter=True),
+        gen=to_months(gen, annual_reporter=True),
+        bga=bga,
+        gens=gens,
+        freq="MS",
+    )
+    rollup = allocate_gen_fuel.agg_monthly_allocation_by_year(monthly, gf=gf)
+    assert list(rollup.columns) == list(yearly.columns)
+    assert set(rollup.report_date) == {pd.Timestamp("2019-01-01")}
+    assert rollup.fuel_consumed_mmbtu.sum() == pytest.approx(
+        yearly.fuel_consumed_mmbtu.sum()
+    )
+    gens_test = allocate_gen_fuel.test_yearly_allocation_vs_monthly_allocation(
+        yearly, monthly, gf=gf, acceptance_threshold=0
+    )
+    assert len(gens_test) == 2
+    check = allocate_gen_fuel.make_yearly_allocation_vs_monthly_allocation_check()
+    assert check(yearly, monthly=monthly, gf=gf).passed
+    assert not check(
+        yearly,
+        monthly=monthly.assign(net_generation_mwh=lambda x: x.net_generation_mwh * 2),
+        gf=gf,
+    ).passed
+
+
 def test_identify_retiring_generators():
     """Ensure identify_retiring_generators grabs all months from the year a generator is retiring."""
     # i added a few records from the year before and after the retiring year to make sure those are not included in the output
@@ -2,6 +2,7 @@
 
 from importlib import resources
 
+import numpy as np
 import pandas as pd
 
 import pudl
@@ -490,6 +491,54 @@ def test_label_true_grans():
     pd.testing.assert_frame_equal(expected_out, out)
 
 
+def test_add_record_id():
+    """Record IDs join the IDs of each record, and the status of non-operating ones."""
+    part_df = GENS_MEGA.assign(
+        unit_id_pudl=pd.array([1, 1, None, 2], dtype="Int64"),
+        operational_status_pudl=["operating", "retired", "operating", "proposed"],
+        utility_id_eia=[111.0, 111.0, None, 111.0],
+        plant_part="plant_unit",
+    )
+    out = pudl.analysis.plant_parts_eia.add_record_id(
+        part_df, id_cols=["plant_id_eia", "unit_id_pudl"]
+    )
+    assert out.record_id_eia.tolist() == [
+        "1_1_2020_plant_unit_total_111",
+        "1_1_2020_plant_unit_total_111_retired",
+        "1_<NA>_2020_plant_unit_total_<NA>",
+        "1_2_2020_plant_unit_total_111_proposed",
+    ]
+    assert out.record_id_eia.dtype == "string"
+
+
+def test_add_record_id_missing_object_ids():
+    """Missing values of object ID columns are converted to strings like astype(str)."""
+    part_df = GENS_MEGA.assign(
+        generator_id=["a", None, np.nan, "d"],
+        plant_part="plant_gen",
+    )
+    out = pudl.analysis.plant_parts_eia.add_record_id(
+        part_df, id_cols=["plant_id_eia", "generator_id"]
+    )
+    assert out.record_id_eia.tolist() == [
+        "1_a_2020_plant_gen_total_111",
+        "1_None_2020_plant_gen_total_111",
+        "1_nan_2020_plant_gen_total_111",
+        "1_d_2020_plant_gen_total_111",
+    ]
+
+
+def test_combo_ids():
+    """Groups with the same members, in any order, have the same combination ID."""
+    groups = pd.Series(["a", "b", "a", "c", "b", "d", "d", "e", "e", "e"])
+    members = pd.Series(["1", "2", "2", "1", "1", "1", "1", "1", "2", "2"])
+    combos = pudl.analysis.plant_parts_eia._combo_ids(groups, members)
+    by_group = dict(zip(groups, combos, strict=True))
+    assert by_group["a"] == by_group["b"]
+    # Same members, but with different multiplicities
+    assert len({by_group["a"], by_group["c"], by_group["d"], by_group["e"]}) == 4
+
+
 def test_one_to_many():
     plant_part_list_input = pd.DataFrame(
         {
@@ -0,0 +1,57 @@
+"""Tests for centered rolling statistics kernels."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.analysis.rolling_stats import (
+    rolling_iqr,
+    rolling_median,
+    rolling_quantiles,
+    shifted_median,
+)
+
+
+def simulate_series(n: int, seed: int) -> np.ndarray:
+    """Series with nulls, a long null run, and many ties in the last series."""
+    rng = np.random.default_rng(seed=seed)
+    x = rng.normal(scale=100, size=(n, 3))
+    x[rng.random(x.shape) < 0.2] = np.nan
+    x[10:40, 1] = np.nan
+    x[:, 2] = np.round(x[:, 2] / 50)
+    return x
+
+
+@pytest.mark.parametrize(
+    "n,window",
+    [(0, 5), (1, 3), (5, 48), (7, 7), (50, 1), (50, 2), (500, 48), (500, 49)],
+)
+def test_rolling_stats_match_pandas(n: int, window: int) -> None:
+    """Rolling medians and quantiles are identical to those of pandas."""
+    x = simulate_series(n, seed=n + window)
+    rolling = pd.DataFrame(x).rolling(window, min_periods=1, center=True)
+    np.testing.assert_array_equal(
+        rolling_median(x, window), rolling.median().to_numpy()
+    )
+    np.testing.assert_array_equal(
+        rolling_iqr(x, window),
+        (rolling.quantile(0.75) - rolling.quantile(0.25)).to_numpy(),
+    )
+    q10, q90 = rolling_quantiles(x, window, [0.1, 0.9])
+    np.testing.assert_array_equal(q10, rolling.quantile(0.1).to_numpy())
+    np.testing.assert_array_equal(q90, rolling.quantile(0.9).to_numpy())
+
+
+@pytest.mark.parametrize(
+    "shifts",
+    [range(-240, 241, 24), range(30, -30, -3), [5], [-3, 0, 2, 9], [2, 2, 3]],
+)
+@pytest.mark.parametrize("n", [0, 5, 1000])
+@pytest.mark.filterwarnings("ignore:All-NaN slice encountered:RuntimeWarning")
+def test_shifted_median_matches_nanmedian(shifts, n: int) -> None:
+    """Shifted medians are identical to the median of shifted copies of the series."""
+    x = simulate_series(n, seed=n)
+    shifted = np.stack([pd.DataFrame(x).shift(shift).to_numpy() for shift in shifts])
+    np.testing.assert_array_equal(
+        shifted_median(x, shifts), np.nanmedian(shifted, axis=0)
+    )
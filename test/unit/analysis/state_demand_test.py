@@ -4,7 +4,12 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from pudl.analysis.state_demand import lookup_state
+import pudl.analysis.timeseries_cleaning
+from pudl.analysis.state_demand import (
+    impute_ferc714_hourly_demand_matrix,
+    lookup_state,
+)
+from pudl.workspace.frame_cache import DataFrameCache
 
 AK_FIPS = {"name": "Alaska", "code": "AK", "fips": "02"}
 
@@ -34,3 +39,48 @@ AK_FIPS = {"name": "Alaska", "code": "AK", "fips": "02"}
 def test_lookup_state(state: str | int, expected: dict[str, str | int]) -> None:
     """Check that various kinds of state lookups work."""
     assert lookup_state(state) == expected
+
+
+def test_impute_ferc714_hourly_demand_matrix_in_parallel() -> None:
+    """Imputing years in worker processes gives the same result as serially."""
+    rng = np.random.default_rng(seed=3810427)
+    # Two days of hourly demand in each of 2019 and 2020
+    index = pd.date_range("2019-12-30", "2020-01-03", freq="h", inclusive="left")
+    hours = np.arange(len(index))
+    df = pd.DataFrame(
+        {
+            respondent: 100 + 10 * np.sin(2 * np.pi * (hours + shift) / 24)
+            for respondent, shift in enumerate(rng.integers(0, 24, 3))
+        },
+        index=index,
+    )
+    df = df.mask(rng.random(df.shape) < 0.1)
+    serial = impute_ferc714_hourly_demand_matrix(df, [2019, 2020], workers=1)
+    parallel = impute_ferc714_hourly_demand_matrix(df, [2019, 2020], workers=2)
+    assert not serial.isna().any().any()
+    assert set(serial.index.year) == {2019, 2020}
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_impute_ferc714_hourly_demand_matrix_with_cache(tmp_path, mocker) -> None:
+    """Changed years are warm started and unchanged years are read from the cache."""
+    rng = np.random.default_rng(seed=501736)
+    index = pd.date_range("2019-12-30", "2020-01-03", freq="h", inclusive="left")
+    df = pd.DataFrame(
+        rng.uniform(100, 200, (len(index), 3)), index=index, columns=[1, 2, 3]
+    )
+    df = df.mask(rng.random(df.shape) < 0.1)
+    cache = DataFrameCache(tmp_path)
+    imputer = mocker.spy(pudl.analysis.timeseries_cleaning, "impute_latc_tnn")
+    imputed = impute_ferc714_hourly_demand_matrix(df, [2019, 2020], cache=cache)
+    assert imputer.call_count == 2
+    pd.testing.assert_frame_equal(
+        impute_ferc714_hourly_demand_matrix(df, [2019, 2020], cache=cache), imputed
+    )
+    assert imputer.call_count == 2
+    df.loc["2020-01-02", 1] = np.nan
+    changed = impute_ferc714_hourly_demand_matrix(df, [2019, 2020], cache=cache)
+    assert imputer.call_count == 3
+    assert "init" in imputer.call_args.kwargs
+    assert not changed.isna().any().any()
+    pd.testing.assert_frame_equal(changed.loc["2019"], imputed.loc["2019"])
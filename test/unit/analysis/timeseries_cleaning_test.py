@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 import pudl.analysis.timeseries_cleaning
+from pudl.workspace.frame_cache import DataFrameCache
 
 
 def simulate_series(
@@ -107,3 +108,96 @@ def test_flags_and_imputes_anomalies(series_seed, anomalies_seed) -> None:
         fit = s.summarize_imputed(imputed, mask)
         # Mean MAPE (mean absolute percent error) is converging
         assert fit["mape"].mean() < fit0["mape"].mean()
+
+
+def test_fit_autoregression_matches_series_by_series_fit() -> None:
+    """Batched autoregressive fit matches fitting each series on its own."""
+    rng = np.random.default_rng(seed=4052138119)
+    mat_hat = rng.uniform(1, 2, size=(5, 48))
+    z = rng.uniform(1, 2, size=(5, 48))
+    lags = [1, 2, 24]
+    ind = np.array([np.arange(24 - lag, 48 - lag) for lag in lags])
+    sample = np.sort(rng.permuted(np.tile(np.arange(24), (5, 1)), axis=1)[:, :12])
+    for rows in None, sample:
+        a, mat0 = pudl.analysis.timeseries_cleaning._fit_autoregression(
+            mat_hat, z, ind, sample=rows
+        )
+        for m in range(5):
+            qm = mat_hat[m, ind].T
+            idx = slice(None) if rows is None else rows[m]
+            am = np.linalg.pinv(qm[idx]) @ z[m, 24:][idx]
+            np.testing.assert_allclose(a[m], am)
+            np.testing.assert_allclose(mat0[m], qm @ am)
+
+
+def test_impute_latc_tubal_is_reproducible_with_seed() -> None:
+    """Tubal imputation of long series gives the same result with the same seed."""
+    x = simulate_series(n=3, periods=250, seed=2938471)
+    x[::7, 1] = np.nan
+    tensor = pudl.analysis.timeseries_cleaning.Timeseries(x).fold_tensor()
+    imputed = [
+        pudl.analysis.timeseries_cleaning.impute_latc_tubal(
+            tensor, rho0=1, maxiter=2, seed=8
+        )
+        for _ in range(2)
+    ]
+    np.testing.assert_array_equal(*imputed)
+
+
+def test_impute_reads_cached_imputation(tmp_path, mocker) -> None:
+    """Imputing the same series with the same parameters again reads the cache."""
+    cache = DataFrameCache(tmp_path)
+    x = simulate_series(seed=592760341)
+    x[::5, 0] = np.nan
+    imputer = mocker.spy(pudl.analysis.timeseries_cleaning, "impute_latc_tnn")
+    s = pudl.analysis.timeseries_cleaning.Timeseries(x)
+    imputed = s.impute(method="tnn", rho0=1, maxiter=10, cache=cache)
+    np.testing.assert_array_equal(
+        s.impute(method="tnn", rho0=1, maxiter=10, cache=cache), imputed
+    )
+    assert imputer.call_count == 1
+    # Other parameters or other values are imputed again
+    s.impute(method="tnn", rho0=1, maxiter=5, cache=cache)
+    x[1, 1] = np.nan
+    pudl.analysis.timeseries_cleaning.Timeseries(x).impute(
+        method="tnn", rho0=1, maxiter=10, cache=cache
+    )
+    assert imputer.call_count == 3
+
+
+@pytest.mark.parametrize("method,rho0", [("tnn", 1e-2), ("tubal", 1)])
+def test_impute_warm_start(method, rho0) -> None:
+    """Warm and cold started imputations converge to nearly the same values."""
+    x = simulate_series(seed=3304981)
+    mask = np.zeros(x.shape, dtype=bool)
+    mask[::7, :] = True
+    s = pudl.analysis.timeseries_cleaning.Timeseries(x)
+    previous = s.impute(mask=mask, method=method, rho0=rho0)
+    # Null a few more values
+    mask[:24, 0] = True
+    cold = s.impute(mask=mask, method=method, rho0=rho0)
+    warm = s.impute(mask=mask, method=method, rho0=rho0, init=previous)
+    assert s.summarize_imputed(cold, mask)["mape"].max() < 1e-5
+    np.testing.assert_allclose(warm[mask], cold[mask], rtol=1e-5)
+
+
+def test_impute_reads_cached_imputation_instead_of_warm_start(tmp_path, mocker) -> None:
+    """Series found in the cache aren't warm started, only changed series are."""
+    cache = DataFrameCache(tmp_path)
+    x = simulate_series(seed=3304981)
+    mask = np.zeros(x.shape, dtype=bool)
+    mask[::7, :] = True
+    s = pudl.analysis.timeseries_cleaning.Timeseries(x)
+    previous = s.impute(mask=mask, method="tnn", rho0=1, maxiter=10, cache=cache)
+    imputer = mocker.spy(pudl.analysis.timeseries_cleaning, "impute_latc_tnn")
+    np.testing.assert_array_equal(
+        s.impute(
+            mask=mask, method="tnn", rho0=1, maxiter=10, init=previous, cache=cache
+        ),
+        previous,
+    )
+    assert imputer.call_count == 0
+    mask[:24, 0] = True
+    s.impute(mask=mask, method="tnn", rho0=1, maxiter=10, init=previous, cache=cache)
+    assert imputer.call_count == 1
+    assert "init" in imputer.call_args.kwargs
@@ -0,0 +1,278 @@
+"""Unit tests for the pudl.etl.epacems_assets module."""
+
+import shutil
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from dagster import build_op_context
+
+from pudl.etl import epacems_assets
+from pudl.etl.epacems_assets import YearPartitions, consolidate_partitions
+from pudl.metadata.classes import Resource
+from pudl.metadata.enums import EPACEMS_STATES
+from pudl.output.epacems import epacems, read_plant_index
+from pudl.settings import DatasetsSettings, EpaCemsSettings
+from pudl.transform.epacems import EpaCemsLookups, rollup_unit_days
+
+RESOURCE = Resource.from_id("core_epacems__hourly_emissions")
+SCHEMA = RESOURCE.to_pyarrow()
+
+
+def _write_quarter(year_quarter: str, seed: int) -> None:
+    """Write a processed quarter of synthetic EPA CEMS data, with its manifest."""
+    rng = np.random.default_rng(seed)
+    n_rows = 500
+    year = int(year_quarter[:4])
+    df = RESOURCE.format_df(
+        pd.DataFrame(
+            {
+                "plant_id_eia": rng.integers(1, 100, n_rows),
+                "plant_id_epa": rng.integers(1, 100, n_rows),
+                "emissions_unit_id_epa": rng.choice(["1", "2", "CT1"], n_rows),
+                "operating_datetime_utc": pd.Timestamp(f"{year}-01-01")
+                + pd.to_timedelta(rng.integers(0, 2000, n_rows), unit="h"),
+                "year": year,
+                "state": rng.choice(["CO", "TX", "WY"], n_rows),
+                "gross_load_mw": rng.random(n_rows),
+            }
+        ).reindex(columns=SCHEMA.names)
+    )
+    path = epacems_assets._partitioned_path() / f"epacems-{year_quarter}.parquet"
+    pq.write_table(pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False), path)
+    epacems_assets._write_manifest(path, fingerprint={"seed": seed})
+
+
+def _expected_output(partitions: list[YearPartitions]) -> pa.Table:
+    """Consolidate the partitions by reading every quarter for every state."""
+    partitioned_path = epacems_assets._partitioned_path()
+    return pa.concat_tables(
+        pq.read_table(
+            partitioned_path / f"epacems-{year_quarter}.parquet",
+            filters=[[("state", "=", state.upper())]],
+            schema=SCHEMA,
+        )
+        for partition in partitions
+        for state in EPACEMS_STATES
+        for year_quarter in sorted(partition.year_quarters)
+    )
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PUDL_OUTPUT", str(tmp_path))
+    (tmp_path / "parquet").mkdir()
+    return tmp_path
+
+
+def test_consolidate_partitions_incrementally(output_dir, mocker):
+    """Only years with changed quarters are consolidated again."""
+    partitions = [
+        YearPartitions({"2020q1", "2020q2"}),
+        YearPartitions({"2021q1"}),
+        YearPartitions({"2022q1"}),
+    ]
+    for seed, year_quarter in enumerate(["2020q1", "2020q2", "2021q1", "2022q1"]):
+        _write_quarter(year_quarter, seed)
+    monolithic_path = output_dir / "parquet" / "core_epacems__hourly_emissions.parquet"
+    write_year = mocker.spy(epacems_assets, "_write_year_state_row_groups")
+
+    consolidate_partitions(build_op_context(), partitions)
+    assert write_year.call_count == 3
+    assert pq.read_table(monolithic_path).equals(_expected_output(partitions))
+    assert pq.ParquetFile(monolithic_path).num_row_groups == 3 * len(EPACEMS_STATES)
+
+    # Nothing changed, so nothing is written.
+    mtime = monolithic_path.stat().st_mtime_ns
+    consolidate_partitions(build_op_context(), partitions)
+    assert write_year.call_count == 3
+    assert monolithic_path.stat().st_mtime_ns == mtime
+
+    # Only the year with a reprocessed quarter is consolidated again.
+    _write_quarter("2021q1", seed=100)
+    consolidate_partitions(build_op_context(), partitions)
+    assert write_year.call_count == 4
+    assert write_year.call_args.args[1] == partitions[1]
+    assert pq.read_table(monolithic_path).equals(_expected_output(partitions))
+
+    # Years missing from the hive-partitioned dataset are consolidated again.
+    shutil.rmtree(output_dir / "epacems" / "year=2022")
+    consolidate_partitions(build_op_context(), partitions)
+    assert write_year.call_count == 5
+    assert write_year.call_args.args[1] == partitions[2]
+    assert (output_dir / "epacems" / "year=2022" / "state=WY").is_dir()
+
+    # An output that was modified since it was consolidated is rebuilt entirely.
+    pq.write_table(_expected_output(partitions[:1]), monolithic_path)
+    consolidate_partitions(build_op_context(), partitions)
+    assert write_year.call_count == 8
+    assert pq.read_table(monolithic_path).equals(_expected_output(partitions))
+
+
+@pytest.mark.parametrize("max_buffer_bytes", [2**30, 2**12])
+def test_write_year_state_row_groups(output_dir, max_buffer_bytes):
+    """A single pass over the quarters matches reading each state separately."""
+    partition = YearPartitions({"2020q1", "2020q2", "2020q3"})
+    for seed, year_quarter in enumerate(sorted(partition.year_quarters)):
+        _write_quarter(year_quarter, seed)
+    partitioned_path = epacems_assets._partitioned_path()
+    expected_path = output_dir / "expected.parquet"
+    with pq.ParquetWriter(
+        expected_path, schema=SCHEMA, compression="snappy", version="2.6"
+    ) as writer:
+        for state in EPACEMS_STATES:
+            writer.write_table(
+                pa.concat_tables(
+                    pq.read_table(
+                        partitioned_path / f"epacems-{year_quarter}.parquet",
+                        filters=[[("state", "=", state.upper())]],
+                        schema=SCHEMA,
+                    )
+                    for year_quarter in sorted(partition.year_quarters)
+                )
+            )
+    actual_path = output_dir / "actual.parquet"
+    epacems_assets._write_year_state_row_groups(
+        actual_path, partition, SCHEMA, max_buffer_bytes=max_buffer_bytes
+    )
+    assert actual_path.read_bytes() == expected_path.read_bytes()
+
+
+def test_epacems_dataset_plant_index(output_dir, monkeypatch):
+    """Plants are read from the hive-partitioned dataset through its plant index."""
+    monkeypatch.setattr(epacems_assets, "DATASET_ROW_GROUP_SIZE", 100)
+    partitions = [YearPartitions({"2020q1", "2020q2"}), YearPartitions({"2021q1"})]
+    for seed, year_quarter in enumerate(["2020q1", "2020q2", "2021q1"]):
+        _write_quarter(year_quarter, seed)
+    consolidate_partitions(build_op_context(), partitions)
+    dataset_path = output_dir / "epacems"
+
+    state_file = pq.ParquetFile(
+        dataset_path / "year=2020" / "state=CO" / "epacems.parquet"
+    )
+    assert state_file.num_row_groups > 1
+    state_df = state_file.read().to_pandas()
+    assert "state" not in state_df.columns
+    sort_columns = epacems_assets.DATASET_SORT_COLUMNS
+    pd.testing.assert_frame_equal(
+        state_df, state_df.sort_values(sort_columns, ignore_index=True)
+    )
+
+    plant_index = read_plant_index(dataset_path)
+    assert set(plant_index.year) == {2020, 2021}
+    for entry in plant_index.itertuples():
+        plant_file = pq.ParquetFile(dataset_path / entry.path)
+        inside = plant_file.read_row_groups(
+            range(entry.row_group_start, entry.row_group_stop)
+        )["plant_id_eia"].to_numpy()
+        outside = [
+            row_group
+            for row_group in range(plant_file.num_row_groups)
+            if not entry.row_group_start <= row_group < entry.row_group_stop
+        ]
+        assert entry.plant_id_eia in inside
+        if outside:
+            outside_ids = plant_file.read_row_groups(outside)["plant_id_eia"]
+            assert entry.plant_id_eia not in outside_ids.to_numpy()
+
+    plant_ids = [3, 14, 15, 92]
+    full = epacems(epacems_path=dataset_path)
+    expected = full[full.plant_id_eia.isin(plant_ids)].compute()
+    actual = epacems(epacems_path=dataset_path, plant_ids=plant_ids)
+    assert actual.dtypes.equals(full.dtypes)
+    sort_columns = ["year", "state", *sort_columns]
+    pd.testing.assert_frame_equal(
+        actual.compute().sort_values(sort_columns, ignore_index=True),
+        expected.sort_values(sort_columns, ignore_index=True),
+    )
+    actual = epacems(
+        epacems_path=dataset_path,
+        plant_ids=plant_ids,
+        years=[2021],
+        states=["WY"],
+        columns=["plant_id_eia", "state"],
+    ).compute()
+    assert set(actual.plant_id_eia) <= set(plant_ids)
+    assert list(actual.columns) == ["plant_id_eia", "state"]
+    assert (actual.state == "WY").all()
+    assert len(actual) == ((expected.year == 2021) & (expected.state == "WY")).sum()
+
+    # The monolithic output has no plant index, so its row group statistics are used.
+    monolithic = epacems(
+        epacems_path=output_dir / "parquet" / "core_epacems__hourly_emissions.parquet",
+        plant_ids=plant_ids,
+    ).compute()
+    assert len(monolithic) == len(expected)
+
+
+def test_read_manifest_of_modified_file(output_dir):
+    """Manifests don't describe files that were changed after they were written."""
+    _write_quarter("2020q1", seed=1)
+    path = epacems_assets._partitioned_path() / "epacems-2020q1.parquet"
+    assert epacems_assets._read_manifest(path)["fingerprint"] == {"seed": 1}
+    pq.write_table(pq.read_table(path).slice(0, 10), path)
+    assert epacems_assets._read_manifest(path) is None
+
+
+def test_emissions_rollups(output_dir):
+    """Rollups are built from the daily emissions by unit of each quarter."""
+    year_quarters = ["2020q1", "2020q2", "2021q1"]
+    lookups = EpaCemsLookups.from_frames(
+        pd.DataFrame(columns=["plant_id_epa", "emissions_unit_id_epa", "plant_id_eia"]),
+        pd.DataFrame({"plant_id_eia": range(1, 100), "timezone": "America/Chicago"}),
+    )
+    hourly = []
+    for seed, year_quarter in enumerate(year_quarters):
+        _write_quarter(year_quarter, seed)
+        df = pq.read_table(
+            epacems_assets._partitioned_path() / f"epacems-{year_quarter}.parquet"
+        ).to_pandas()
+        df["operating_time_hours"] = np.random.default_rng(seed).choice(
+            [0.0, 0.5, 1.0], len(df)
+        )
+        # Rolling up each quarter in several batches gives the same daily sums.
+        epacems_assets._write_unit_days(
+            epacems_assets._rollup_path(year_quarter),
+            [rollup_unit_days(batch, lookups) for batch in np.array_split(df, 3)],
+        )
+        hourly.append(df)
+    hourly = pd.concat(hourly, ignore_index=True)
+
+    context = build_op_context(
+        resources={
+            "dataset_settings": DatasetsSettings(
+                epacems=EpaCemsSettings(year_quarters=year_quarters)
+            )
+        }
+    )
+    rollups = {
+        output.output_name: Resource.from_id(output.output_name).enforce_schema(
+            output.value
+        )
+        for output in epacems_assets.out_epacems__emissions_rollups(context)
+    }
+    assert len(rollups) == 6
+
+    local_time = hourly.operating_datetime_utc - pd.Timedelta(hours=6)
+    expected = (
+        hourly.assign(
+            year=local_time.dt.year,
+            operating_hour_count=(hourly.operating_time_hours > 0).astype(int),
+        )
+        .groupby(["plant_id_eia", "year"])[["operating_hour_count"]]
+        .sum()
+        .reset_index()
+    )
+    plant_years = rollups["out_epacems__yearly_emissions_by_plant"]
+    assert (plant_years.report_date.dt.year == expected.year).all()
+    assert (plant_years.plant_id_eia == expected.plant_id_eia).all()
+    assert (plant_years.operating_hour_count == expected.operating_hour_count).all()
+    for name, rollup in rollups.items():
+        assert (
+            rollup.operating_hour_count.sum() == expected.operating_hour_count.sum()
+        ), name
+        assert rollup.gross_generation_mwh.sum() == pytest.approx(
+            (hourly.gross_load_mw * hourly.operating_time_hours).sum()
+        ), name
@@ -0,0 +1,233 @@
+"""Unit tests for the pudl.extract.dbf module."""
+
+import io
+import os
+import random
+import struct
+
+import dbfread
+import pandas as pd
+import pytest
+
+from pudl.extract.dbf import (
+    FercDbfExtractor,
+    FercFieldParser,
+    PartitionedDataFrame,
+    decode_dbf,
+)
+from pudl.workspace.datastore import Datastore
+
+
+def make_dbf(
+    fields: list[tuple[str, str, int, int]],
+    records: list[list[str | bytes]],
+    deleted: set[int] = frozenset(),
+) -> bytes:
+    """Returns the bytes of a dBase III table with the given fields and records.
+
+    Args:
+        fields: (name, type, length, decimal count) of each field.
+        records: the value of each field in each record. Strings are padded to the
+            field length, on the left for numeric fields. Bytes are used verbatim.
+        deleted: indices of records that should be marked as deleted.
+    """
+    header_length = 32 + 32 * len(fields) + 1
+    record_length = 1 + sum(length for _, _, length, _ in fields)
+    dbf = bytearray(
+        struct.pack(
+            "<BBBBIHH20x", 3, 101, 1, 1, len(records), header_length, record_length
+        )
+    )
+    for name, field_type, length, decimals in fields:
+        dbf += struct.pack(
+            "<11sc4xBB14x", name.encode(), field_type.encode(), length, decimals
+        )
+    dbf += b"\r"
+    for i, record in enumerate(records):
+        dbf += b"*" if i in deleted else b" "
+        for (_, field_type, length, _), value in zip(fields, record, strict=True):
+            if isinstance(value, str):
+                value = value.encode("latin1")
+                value = (
+                    value.rjust(length) if field_type in "NF" else value.ljust(length)
+                )
+            assert len(value) == length
+            dbf += value
+    return bytes(dbf + b"\x1a")
+
+
+def _random_records(
+    n: int, seed: int = 0, messy: bool = True
+) -> list[list[str | bytes]]:
+    """Random records for FIELDS, optionally with the messy numbers seen in FERC data.
+
+    Only :class:`FercFieldParser` can read the messy values.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    numeric = ["", "0", "-5", "+7", "0.00", "12.50", "-0.5", "1e3", "9" * 19]
+    if messy:
+        numeric += ["00012", ".", "1,5", "*", "**12", "12345678901234567"]
+    dates = ["", "00000000", "20010102", "19991231", "20000229", "18000101"]
+    return [
+        [
+            rng.choice(["", "Plant A", " lead", "trail  ", "Société", "0123"]),
+            rng.choice(numeric),
+            rng.choice(["", "3.25", "-0", "7"] + (["**1.5"] if messy else [])),
+            rng.choice(dates),
+            rng.choice("TtYyFfNn? "),
+            struct.pack("<i", rng.randint(-(2**31), 2**31 - 1)),
+            rng.choice([b"\x00", b"\x03"]),
+        ]
+        for _ in range(n)
+    ]
+
+
+FIELDS = [
+    ("NAME", "C", 12, 0),
+    ("AMOUNT", "N", 20, 2),
+    ("RATE", "F", 8, 2),
+    ("REPORTED", "D", 8, 0),
+    ("FLAG", "L", 1, 0),
+    ("COUNT", "I", 4, 0),
+    ("_NullFlags", "0", 1, 0),
+]
+
+
+def _open_dbf(dbf: bytes, parserclass=FercFieldParser) -> dbfread.DBF:
+    return dbfread.DBF(
+        "table.dbf",
+        encoding="latin1",
+        parserclass=parserclass,
+        ignore_missing_memofile=True,
+        filedata=io.BytesIO(dbf),
+    )
+
+
+@pytest.mark.parametrize("parserclass", [FercFieldParser, dbfread.FieldParser])
+@pytest.mark.parametrize("seed", range(5))
+def test_decode_dbf_matches_record_reader(parserclass, seed):
+    """Bulk decoding produces exactly the same dataframe as reading record by record."""
+    records = _random_records(200, seed=seed, messy=parserclass is FercFieldParser)
+    dbf = make_dbf(FIELDS, records, deleted={3, 50})
+    expected = pd.DataFrame(iter(_open_dbf(dbf, parserclass)))
+    pd.testing.assert_frame_equal(decode_dbf(_open_dbf(dbf, parserclass)), expected)
+
+
+@pytest.mark.parametrize(
+    "column,values",
+    [
+        ("AMOUNT", ["1", "2", "3"]),
+        ("AMOUNT", ["", "", ""]),
+        ("AMOUNT", ["1_000", "2", ""]),
+        ("AMOUNT", ["0", "1.5", "."]),
+        ("REPORTED", ["20010102", "", "00000000"]),
+        ("REPORTED", ["20010102", "20010102", "20010102"]),
+        ("REPORTED", ["00010101", "20010102", ""]),
+        ("FLAG", ["T", "F", "Y"]),
+        ("NAME", ["", "", ""]),
+    ],
+)
+def test_decode_dbf_column_types(column, values):
+    """Column types are inferred just like the record by record reader does."""
+    records = _random_records(len(values))
+    index = [name for name, *_ in FIELDS].index(column)
+    for record, value in zip(records, values, strict=True):
+        record[index] = value
+    dbf = make_dbf(FIELDS, records)
+    expected = pd.DataFrame(iter(_open_dbf(dbf)))
+    pd.testing.assert_frame_equal(decode_dbf(_open_dbf(dbf)), expected)
+
+
+def test_decode_dbf_raises_like_record_reader():
+    """Values the field parser can't handle raise the same error."""
+    records = _random_records(3, messy=False)
+    records[1][1] = "."
+    dbf = make_dbf(FIELDS, records)
+    with pytest.raises(ValueError, match="could not convert string to float"):
+        pd.DataFrame(iter(_open_dbf(dbf, dbfread.FieldParser)))
+    with pytest.raises(ValueError, match="could not convert string to float"):
+        decode_dbf(_open_dbf(dbf, dbfread.FieldParser))
+
+
+def test_decode_dbf_without_records():
+    """Tables without any (undeleted) records are empty dataframes."""
+    dbf = make_dbf(FIELDS, _random_records(2), deleted={0, 1})
+    pd.testing.assert_frame_equal(decode_dbf(_open_dbf(dbf)), pd.DataFrame())
+
+
+class _FakeDbfReader:
+    """Reader whose tables hold one row per year, identifying the decoding process."""
+
+    def __init__(self, datastore: Datastore):
+        self.datastore = datastore
+
+    def get_table_names(self) -> list[str]:
+        return [f"table{i}" for i in range(7)]
+
+    def get_archive(self, **filters):
+        return None
+
+    def load_table_dfs(self, table_name, partitions) -> list[PartitionedDataFrame]:
+        return [
+            PartitionedDataFrame(
+                pd.DataFrame(
+                    {"table": [table_name], "year": [p["year"]], "pid": [os.getpid()]}
+                ),
+                p,
+            )
+            for p in partitions
+            # Tables are missing from some partitions.
+            if (int(table_name[-1]) + p["year"]) % 3
+        ]
+
+
+class _FakeDbfExtractor(FercDbfExtractor):
+    DATASET = "ferc1"
+
+    @classmethod
+    def get_dbf_reader(cls, datastore: Datastore) -> _FakeDbfReader:
+        return _FakeDbfReader(datastore)
+
+    def __init__(self, datastore: Datastore, workers: int | None):
+        self.datastore = datastore
+        self.dbf_reader = self.get_dbf_reader(datastore)
+        self.workers = workers
+
+
+@pytest.mark.parametrize("workers", [2, None])
+def test_iter_table_dfs_in_worker_processes(tmp_path, workers):
+    """Tables decoded by worker processes come back in the same order as serially."""
+    partitions = [{"year": year, "data_format": "dbf"} for year in range(2000, 2005)]
+    datastore = Datastore(local_cache_path=tmp_path)
+
+    def collect(workers: int | None) -> list[tuple[str, list[dict], pd.DataFrame]]:
+        return [
+            (
+                table,
+                [df.partition for df in dfs],
+                pd.concat([df.df for df in dfs], ignore_index=True),
+            )
+            for table, dfs in _FakeDbfExtractor(datastore, workers).iter_table_dfs(
+                partitions
+            )
+        ]
+
+    serial = collect(workers=1)
+    parallel = collect(workers=workers)
+    assert [t for t, _, _ in parallel] == [t for t, _, _ in serial]
+    for (_, serial_parts, serial_df), (_, parallel_parts, parallel_df) in zip(
+        serial, parallel, strict=True
+    ):
+        assert parallel_parts == serial_parts
+        pd.testing.assert_frame_equal(
+            parallel_df.drop(columns="pid"), serial_df.drop(columns="pid")
+        )
+        assert (serial_df.pid == os.getpid()).all()
+        assert (parallel_df.pid != os.getpid()).all()
+
+
+def test_iter_table_dfs_without_local_cache():
+    """Without a local cache for the workers to read from, tables are read serially."""
+    extractor = _FakeDbfExtractor(Datastore(), workers=4)
+    for _, dfs in extractor.iter_table_dfs([{"year": 2001}, {"year": 2002}]):
+        assert all((df.df.pid == os.getpid()).all() for df in dfs)
@@ -0,0 +1,116 @@
+"""Unit tests for the pudl.extract.epacems module."""
+
+import io
+import zipfile
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from pudl.extract import epacems
+
+CSV_COLUMNS = [
+    "State",
+    "Facility Name",
+    "Facility ID",
+    "Unit ID",
+    "Associated Stacks",
+    "Date",
+    "Hour",
+    "Operating Time",
+    "Gross Load (MW)",
+    "Steam Load (1000 lb/hr)",
+    "SO2 Mass (lbs)",
+    "SO2 Mass Measure Indicator",
+    "NOx Mass (lbs)",
+    "NOx Mass Measure Indicator",
+    "CO2 Mass (short tons)",
+    "CO2 Mass Measure Indicator",
+    "Heat Input (mmBtu)",
+    "Heat Input Measure Indicator",
+    "Primary Fuel Type",
+]
+
+
+def _csv_row(i: int) -> str:
+    """A synthetic CEMS CSV record, with some values missing."""
+    return ",".join(
+        [
+            ["CO", "TX", "AL"][i % 3],
+            f'"Plant {i % 7}, Inc."',
+            str(1000 + i % 7),
+            f"{i % 4:02d}",
+            "" if i % 5 else "CS001",
+            f"2020-01-{1 + i % 28:02d}",
+            str(i % 24),
+            "1.00" if i % 3 else "",
+            f"{i * 1.5:.1f}",
+            "",
+            "0.25",
+            "Measured" if i % 2 else "Substitute",
+            "",
+            "",
+            f"{i / 8:.3f}",
+            "Calculated",
+            "10.5",
+            "Measured",
+            "Coal",
+        ]
+    )
+
+
+@pytest.fixture
+def cems_datastore() -> MagicMock:
+    """A datastore holding a single quarter of synthetic CEMS data."""
+    csv = "\n".join([",".join(CSV_COLUMNS)] + [_csv_row(i) for i in range(2000)])
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("epacems-2020q1.csv", csv)
+    ds = MagicMock()
+    ds.get_zipfile_resource.side_effect = lambda *args, **kwargs: zipfile.ZipFile(
+        io.BytesIO(archive.getvalue())
+    )
+    return ds
+
+
+def test_iter_data_frames(cems_datastore):
+    """Small CSV blocks are streamed as multiple consistently typed batches."""
+    partition = epacems.EpaCemsPartition(year_quarter="2020q1")
+    batches = list(
+        epacems.EpaCemsDatastore(cems_datastore).iter_data_frames(
+            partition, block_size=2**13
+        )
+    )
+    assert len(batches) > 1
+    df = pd.concat(batches, ignore_index=True)
+    assert len(df) == 2000
+    assert "plant_name" not in df.columns
+    assert "primary_fuel_type" not in df.columns
+    for batch in batches:
+        assert batch.dtypes.to_dict() == batches[0].dtypes.to_dict()
+    assert df.plant_id_epa.dtype == pd.Int32Dtype()
+    assert df.op_hour.dtype == pd.Int16Dtype()
+    assert df.gross_load_mw.dtype == pd.Float32Dtype()
+    assert isinstance(df.state.dtype, pd.CategoricalDtype)
+    assert df.op_date.iloc[:3].tolist() == ["2020-01-01", "2020-01-02", "2020-01-03"]
+    assert df.emissions_unit_id_epa.iloc[:3].tolist() == ["00", "01", "02"]
+    assert df.associated_stacks.isna().sum() == 1600
+    assert df.operating_time_hours.isna().sum() == 667
+    assert df.steam_load_1000_lbs.isna().all()
+
+
+def test_extract_batches_matches_extract(cems_datastore):
+    """Streamed batches hold the same records as the whole extracted quarter."""
+    df = epacems.extract("2020q1", cems_datastore)
+    batches = list(epacems.extract_batches("2020q1", cems_datastore, block_size=2**13))
+    pd.testing.assert_frame_equal(
+        pd.concat(batches, ignore_index=True).astype(df.dtypes.to_dict()), df
+    )
+    assert (df.year == 2020).all()
+
+
+def test_extract_batches_missing_quarter():
+    """No batches are extracted for quarters missing from the archive."""
+    ds = MagicMock()
+    ds.get_zipfile_resource.side_effect = KeyError("No resources found")
+    assert list(epacems.extract_batches("2020q1", ds)) == []
@@ -1,11 +1,19 @@
 """Unit tests for pudl.extract.excel module."""
 
+import io
 import unittest
+import zipfile
 from unittest import mock as mock
 
+import dbfread
 import pandas as pd
+import pytest
 
 from pudl.extract import excel
+from pudl.helpers import convert_df_to_excel_file
+from pudl.workspace.frame_cache import DataFrameCache
+from pudl.workspace.resource_cache import PudlResourceKey
+from test.unit.extract.dbf_test import make_dbf
 
 
 class TestMetadata(unittest.TestCase):
@@ -120,3 +128,82 @@ class TestExtractor(unittest.TestCase):
 
     # TODO(rousik@gmail.com): need to figure out how to test process_$x methods.
     # TODO(rousik@gmail.com): we should test that empty columns are properly added.
+
+
+def test_load_source_uses_sheet_cache(tmp_path):
+    """Parsed pages are cached, so other extractors don't need to read the workbook."""
+    books = pd.DataFrame(
+        {"book_title": ["Tao Te Ching"], "name": ["Laozi"], "pages": [0]}
+    )
+    boxes = pd.DataFrame({"composition": ["cardboard"], "size_inches": [10]})
+    xlsx = io.BytesIO()
+    with pd.ExcelWriter(xlsx) as writer:
+        books.to_excel(writer, sheet_name="books", index=False)
+        boxes.to_excel(writer, sheet_name="boxes", index=False)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("b-file.xlsx", xlsx.getvalue())
+
+    ds = mock.MagicMock()
+    ds.get_unique_resource_key.return_value = PudlResourceKey(
+        "test", "10.5281/zenodo.123456", "test-2010.zip"
+    )
+    ds.get_zipfile_resource.side_effect = lambda *args, **kwargs: zipfile.ZipFile(
+        archive
+    )
+
+    class Extractor(excel.ExcelExtractor):
+        METADATA = excel.ExcelMetadata("test")
+
+    sheet_cache = DataFrameCache(tmp_path)
+    first = Extractor(ds, sheet_cache=sheet_cache)
+    pd.testing.assert_frame_equal(first.load_source("books", year=2010), books)
+    pd.testing.assert_frame_equal(first.load_source("boxes", year=2010), boxes)
+    # Both pages are parsed from the same workbook, which is only opened once.
+    assert ds.get_zipfile_resource.call_count == 1
+
+    second = Extractor(ds, sheet_cache=sheet_cache)
+    pd.testing.assert_frame_equal(second.load_source("books", year=2010), books)
+    pd.testing.assert_frame_equal(second.load_source("boxes", year=2010), boxes)
+    assert ds.get_zipfile_resource.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "skiprows,skipfooter,dtype",
+    [(0, 0, {}), (0, 1, {"PLANT_ID": pd.Int64Dtype()}), (2, 0, {"ZIP": "string"})],
+)
+def test_read_dbf_cells_matches_excel_round_trip(skiprows, skipfooter, dtype):
+    """DBF pages parse exactly as they did when converted to Excel and read back."""
+    dbf = make_dbf(
+        [
+            ("PLANT_ID", "N", 6, 0),
+            ("NAME", "C", 12, 0),
+            ("ZIP", "C", 5, 0),
+            ("CAPACITY", "N", 8, 2),
+            ("OPERATING", "D", 8, 0),
+            ("RETIRED", "L", 1, 0),
+            ("EMPTY", "C", 4, 0),
+        ],
+        [
+            ["1", "Plant A", "01234", "10.50", "20010102", "T", ""],
+            ["", "Plant B ", "NA", "2.00", "", "F", ""],
+            ["3", "", "98765", "", "19991231", "?", ""],
+            ["4", "12", "", "7.25", "20000229", "N", ""],
+        ],
+    )
+    expected = pd.read_excel(
+        convert_df_to_excel_file(
+            pd.DataFrame(iter(dbfread.DBF("t.dbf", filedata=io.BytesIO(dbf)))),
+            index=False,
+        ),
+        skiprows=skiprows,
+        skipfooter=skipfooter,
+        dtype=dtype,
+    )
+    observed = excel.parse_cells(
+        excel.read_dbf_cells("t.dbf", io.BytesIO(dbf)),
+        skiprows=skiprows,
+        skipfooter=skipfooter,
+        dtype=dtype,
+    )
+    pd.testing.assert_frame_equal(observed, expected)
@@ -3,11 +3,20 @@
 from pathlib import Path
 
 import alembic.config
+import dask.dataframe as dd
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 import sqlalchemy as sa
-from dagster import AssetKey, build_input_context, build_output_context
+from dagster import (
+    AssetKey,
+    PythonObjectDagsterType,
+    build_input_context,
+    build_output_context,
+)
 from sqlalchemy.exc import IntegrityError, OperationalError
+from upath import UPath
 
 from pudl.etl.check_foreign_keys import (
     ForeignKeyError,
@@ -15,12 +24,16 @@ from pudl.etl.check_foreign_keys import (
     check_foreign_keys,
 )
 from pudl.io_managers import (
+    EpaCemsIOManager,
     FercXBRLSQLiteIOManager,
+    PudlParquetIOManager,
     PudlSQLiteIOManager,
     SQLiteIOManager,
 )
 from pudl.metadata import PUDL_PACKAGE
 from pudl.metadata.classes import Package, Resource
+from pudl.output.epacems import EpaCemsDataset
+from pudl.workspace.setup import PudlPaths
 
 
 @pytest.fixture
@@ -78,11 +91,13 @@ def test_pkg() -> Package:
     )
 
 
-@pytest.fixture
-def sqlite_io_manager_fixture(tmp_path, test_pkg):
+@pytest.fixture(params=[False, True], ids=["to_sql", "bulk_load"])
+def sqlite_io_manager_fixture(tmp_path, test_pkg, request):
     """Create a SQLiteIOManager fixture with a simple database schema."""
     md = test_pkg.to_sql()
-    return SQLiteIOManager(base_dir=tmp_path, db_name="pudl", md=md)
+    return SQLiteIOManager(
+        base_dir=tmp_path, db_name="pudl", md=md, bulk_load=request.param
+    )
 
 
 def test_sqlite_io_manager_delete_stmt(sqlite_io_manager_fixture):
@@ -224,8 +239,8 @@ def test_missing_schema_error(sqlite_io_manager_fixture):
         manager.handle_output(output_context, venue)
 
 
-@pytest.fixture
-def fake_pudl_sqlite_io_manager_fixture(tmp_path, test_pkg, monkeypatch):
+@pytest.fixture(params=[False, True], ids=["to_sql", "bulk_load"])
+def fake_pudl_sqlite_io_manager_fixture(tmp_path, test_pkg, monkeypatch, request):
     """Create a SQLiteIOManager fixture with a fake database schema."""
     db_path = tmp_path / "fake.sqlite"
 
@@ -233,7 +248,9 @@ def fake_pudl_sqlite_io_manager_fixture(tmp_path, test_pkg, monkeypatch):
     engine = sa.create_engine(f"sqlite:///{db_path}")
     md = test_pkg.to_sql()
     md.create_all(engine)
-    return PudlSQLiteIOManager(base_dir=tmp_path, db_name="fake", package=test_pkg)
+    return PudlSQLiteIOManager(
+        base_dir=tmp_path, db_name="fake", package=test_pkg, bulk_load=request.param
+    )
 
 
 def test_pudl_sqlite_io_manager_delete_stmt(fake_pudl_sqlite_io_manager_fixture):
@@ -322,6 +339,228 @@ def test_replace_on_insert(fake_pudl_sqlite_io_manager_fixture):
     pd.testing.assert_frame_equal(new_artist_df, read_df, check_dtype=False)
 
 
+def test_bulk_load_matches_to_sql(tmp_path):
+    """Bulk loaded tables should be identical to those written with to_sql."""
+    fields = [
+        {"name": "plant_id", "type": "integer", "description": "plant_id"},
+        {"name": "report_date", "type": "date", "description": "report_date"},
+        {"name": "operating_datetime", "type": "datetime", "description": "dt"},
+        {"name": "capacity_mw", "type": "number", "description": "capacity_mw"},
+        {"name": "is_retired", "type": "boolean", "description": "is_retired"},
+        {"name": "plant_name", "type": "string", "description": "plant_name"},
+        {
+            "name": "fuel_type",
+            "type": "string",
+            "constraints": {"enum": ["coal", "gas"]},
+            "description": "fuel_type",
+        },
+    ]
+    schema = {"fields": fields, "primary_key": ["plant_id", "report_date"]}
+    pkg = Package(
+        name="plants",
+        resources=[Resource(name="plants", schema=schema, description="Plants")],
+    )
+    plants = pd.DataFrame(
+        {
+            "plant_id": [1, 1, 2],
+            "report_date": pd.to_datetime(["2020-01-01", "2021-01-01", "2020-01-01"]),
+            "operating_datetime": pd.to_datetime(
+                ["2020-01-01 01:00:00", pd.NaT, "2020-06-30 23:59:59"]
+            ),
+            "capacity_mw": [1.1, None, 123456.789],
+            "is_retired": [True, None, False],
+            "plant_name": ["Co-op Mop", None, "Cxtxlyst"],
+            "fuel_type": ["coal", "gas", None],
+        }
+    )
+    output_context = build_output_context(asset_key=AssetKey("plants"))
+
+    rows = {}
+    for bulk_load in [False, True]:
+        base_dir = tmp_path / str(bulk_load)
+        base_dir.mkdir()
+        pkg.to_sql().create_all(sa.create_engine(f"sqlite:///{base_dir}/pudl.sqlite"))
+        manager = PudlSQLiteIOManager(
+            base_dir=base_dir, db_name="pudl", package=pkg, bulk_load=bulk_load
+        )
+        manager.handle_output(output_context, plants)
+        with manager.engine.connect() as con:
+            rows[bulk_load] = con.exec_driver_sql(
+                "SELECT * FROM plants ORDER BY plant_id, report_date"
+            ).fetchall()
+            # Bulk loading shouldn't leave the connection in a different state
+            assert con.exec_driver_sql("PRAGMA synchronous").scalar() == 2
+    assert rows[True] == rows[False]
+
+
+def test_bulk_load_recreates_indexes(sqlite_io_manager_fixture):
+    """Explicitly created indexes should survive a bulk load."""
+    manager = sqlite_io_manager_fixture
+    with manager.engine.begin() as con:
+        con.exec_driver_sql("CREATE INDEX ix_artistname ON artist (artistname)")
+
+    artist = pd.DataFrame({"artistid": [1, 2], "artistname": ["Co-op Mop", "Cxtx"]})
+    manager.handle_output(build_output_context(asset_key=AssetKey("artist")), artist)
+
+    with manager.engine.connect() as con:
+        indexes = con.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        ).fetchall()
+    assert indexes == [("ix_artistname",)]
+    returned_df = manager.load_input(build_input_context(asset_key=AssetKey("artist")))
+    assert len(returned_df) == 2
+
+
+def test_sqlite_read_pushdown(fake_pudl_sqlite_io_manager_fixture):
+    """Column subsets and row filters in the input metadata are applied on read."""
+    manager = fake_pudl_sqlite_io_manager_fixture
+    track = pd.DataFrame(
+        {
+            "trackid": [1, 2, 3],
+            "trackname": ["FERC Ya!", "Cxtxlyst", "Co-op Mop"],
+            "trackartist": [1, 1, 2],
+        }
+    )
+    manager.handle_output(build_output_context(asset_key=AssetKey("track")), track)
+
+    input_context = build_input_context(
+        asset_key=AssetKey("track"),
+        metadata={
+            "columns": ["trackid", "trackname"],
+            "filters": [("trackartist", "=", 1), ("trackid", "in", [2, 3])],
+        },
+    )
+    returned_df = manager.load_input(input_context)
+    pd.testing.assert_frame_equal(
+        returned_df,
+        pd.DataFrame({"trackid": [2], "trackname": ["Cxtxlyst"]}),
+        check_dtype=False,
+    )
+
+    # Filtering out every row isn't an error
+    input_context = build_input_context(
+        asset_key=AssetKey("track"), metadata={"filters": [("trackid", ">", 3)]}
+    )
+    assert manager.load_input(input_context).empty
+
+
+@pytest.mark.parametrize(
+    "metadata",
+    [
+        {"columns": ["trackid", "tracklength"]},
+        {"filters": [("tracklength", ">", 1)]},
+        {"filters": [("trackid", "like", 1)]},
+    ],
+)
+def test_sqlite_read_pushdown_errors(fake_pudl_sqlite_io_manager_fixture, metadata):
+    input_context = build_input_context(asset_key=AssetKey("track"), metadata=metadata)
+    with pytest.raises(ValueError):
+        fake_pudl_sqlite_io_manager_fixture.load_input(input_context)
+
+
+def test_parquet_read_pushdown(tmp_path, monkeypatch):
+    """Column subsets and row filters in the input metadata are applied on read."""
+    monkeypatch.setenv("PUDL_OUTPUT", str(tmp_path))
+    manager = PudlParquetIOManager()
+    asset_key = AssetKey("core_eia861__assn_utility")
+    utils = pd.DataFrame(
+        {
+            "report_date": pd.to_datetime(["2019-01-01", "2020-01-01", "2021-01-01"]),
+            "utility_id_eia": [1, 2, 3],
+            "state": ["CO", "CA", "CO"],
+        }
+    )
+    manager.handle_output(build_output_context(asset_key=asset_key), utils)
+
+    input_context = build_input_context(
+        asset_key=asset_key,
+        metadata={
+            "columns": ["utility_id_eia", "report_date"],
+            "filters": [("report_date", ">=", "2020-01-01"), ("state", "==", "CO")],
+        },
+    )
+    returned_df = manager.load_input(input_context)
+    pd.testing.assert_frame_equal(
+        returned_df.reset_index(drop=True),
+        pd.DataFrame(
+            {"report_date": pd.to_datetime(["2021-01-01"]), "utility_id_eia": [3]}
+        ),
+        check_dtype=False,
+    )
+
+
+def test_parquet_sorted_row_groups(tmp_path, monkeypatch):
+    """Parquet outputs are written in bounded row groups sorted by primary key."""
+    monkeypatch.setenv("PUDL_OUTPUT", str(tmp_path))
+    monkeypatch.setattr("pudl.io_managers.PARQUET_ROW_GROUP_SIZE", 2)
+    asset_key = AssetKey("core_eia861__assn_utility")
+    utils = pd.DataFrame(
+        {
+            "report_date": pd.to_datetime(
+                ["2021-01-01", "2019-01-01", "2020-01-01", "2019-01-01", "2020-01-01"]
+            ),
+            "utility_id_eia": [1, 2, 3, 1, 1],
+            "state": ["CO", "CA", "CO", "CO", "CO"],
+        }
+    )
+    PudlParquetIOManager().handle_output(
+        build_output_context(asset_key=asset_key), utils
+    )
+
+    parquet_file = pq.ParquetFile(PudlPaths().parquet_path("core_eia861__assn_utility"))
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.metadata.row_group(0).column(0).statistics.has_min_max
+    assert [
+        col.column_index for col in parquet_file.metadata.row_group(0).sorting_columns
+    ] == [0, 1, 2]
+    written = PudlParquetIOManager().load_input(
+        build_input_context(asset_key=asset_key)
+    )
+    pd.testing.assert_frame_equal(
+        written,
+        utils.sort_values(["report_date", "utility_id_eia", "state"]).reset_index(
+            drop=True
+        ),
+        check_dtype=False,
+    )
+
+
+def test_parquet_arrow_dtypes(tmp_path, monkeypatch):
+    """Tables we wrote ourselves are read into pyarrow backed columns as-is."""
+    monkeypatch.setenv("PUDL_OUTPUT", str(tmp_path))
+    asset_key = AssetKey("core_eia861__assn_utility")
+    utils = pd.DataFrame(
+        {
+            "report_date": pd.to_datetime(["2019-01-01", "2020-01-01"]),
+            "utility_id_eia": [1, 2],
+            "state": ["CO", "CA"],
+        }
+    )
+    PudlParquetIOManager().handle_output(
+        build_output_context(asset_key=asset_key), utils
+    )
+
+    manager = PudlParquetIOManager(arrow_dtypes=True)
+    returned_df = manager.load_input(build_input_context(asset_key=asset_key))
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in returned_df.dtypes)
+    assert returned_df.utility_id_eia.tolist() == [1, 2]
+
+    # The input metadata takes precedence over the IO manager default
+    input_context = build_input_context(
+        asset_key=asset_key, metadata={"arrow_dtypes": False}
+    )
+    returned_df = manager.load_input(input_context)
+    assert returned_df.utility_id_eia.dtype == "Int64"
+
+    # Files that don't match the resource schema are read with schema enforcement
+    pq.write_table(
+        pa.Table.from_pandas(utils, preserve_index=False),
+        PudlPaths().parquet_path("core_eia861__assn_utility"),
+    )
+    returned_df = manager.load_input(build_input_context(asset_key=asset_key))
+    assert returned_df.utility_id_eia.dtype == "Int64"
+
+
 @pytest.mark.skip(reason="SQLAlchemy is not finding the view. Debug or remove.")
 def test_handling_view_with_metadata(fake_pudl_sqlite_io_manager_fixture):
     """Make sure an users can create and load views when it has metadata."""
@@ -454,3 +693,30 @@ def test_report_year_fixing_duration():
 def test_report_year_fixing_bad_values(df, match):
     with pytest.raises(ValueError, match=match):
         FercXBRLSQLiteIOManager.refine_report_year(df, xbrl_years=[2021, 2022])
+
+
+def test_epacems_io_manager_query_layer(tmp_path):
+    """Inputs annotated as an EpaCemsDataset get a query layer, others a Dask frame."""
+    pd.DataFrame({"plant_id_eia": [1, 2, 2]}).to_parquet(
+        tmp_path / "core_epacems__hourly_emissions.parquet", index=False
+    )
+    manager = EpaCemsIOManager(
+        base_path=UPath(tmp_path),
+        schema=Resource.from_id("core_epacems__hourly_emissions").to_pyarrow(),
+    )
+    asset_key = AssetKey("core_epacems__hourly_emissions")
+
+    dataset = manager.load_input(
+        build_input_context(
+            asset_key=asset_key, dagster_type=PythonObjectDagsterType(EpaCemsDataset)
+        )
+    )
+    assert isinstance(dataset, EpaCemsDataset)
+    assert dataset.distinct(["plant_id_eia"]).plant_id_eia.tolist() == [1, 2]
+
+    ddf = manager.load_input(
+        build_input_context(
+            asset_key=asset_key, dagster_type=PythonObjectDagsterType(dd.DataFrame)
+        )
+    )
+    assert ddf.compute().plant_id_eia.tolist() == [1, 2, 2]
@@ -1,10 +1,12 @@
 """Test helper functions associated with the EPA CEMS outputs."""
 
 import logging
+from pathlib import Path
 
+import pandas as pd
 import pytest
 
-from pudl.output.epacems import year_state_filter
+from pudl.output.epacems import EpaCemsDataset, year_state_filter
 
 logger = logging.getLogger(__name__)
 
@@ -23,3 +25,65 @@ def test_year_state_filter(years, states, expected_filter):
     assert (  # nosec: B101
         year_state_filter(years=years, states=states) == expected_filter
     )
+
+
+@pytest.fixture
+def epacems_paths(tmp_path) -> list[Path]:
+    """The same synthetic EPA CEMS data as a single file and as a hive dataset."""
+    df = pd.DataFrame(
+        {
+            "plant_id_eia": [1, 1, 1, 2, 2, 3],
+            "emissions_unit_id_epa": ["A", "A", "B", "A", "A", "C"],
+            "gross_load_mw": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "year": pd.array([2020, 2020, 2020, 2020, 2021, 2021], dtype="int32"),
+            "state": ["CO", "CO", "CO", "TX", "TX", "TX"],
+        }
+    )
+    file_path = tmp_path / "epacems.parquet"
+    df.to_parquet(file_path, index=False)
+    dataset_path = tmp_path / "epacems"
+    for (year, state), group in df.groupby(["year", "state"]):
+        partition_path = dataset_path / f"year={year}" / f"state={state}"
+        partition_path.mkdir(parents=True)
+        group.drop(columns=["year", "state"]).to_parquet(
+            partition_path / "epacems.parquet", index=False
+        )
+    return [file_path, dataset_path]
+
+
+def test_epacems_dataset_distinct(epacems_paths):
+    """Distinct keys are the same for a single file and a hive dataset."""
+    for path in epacems_paths:
+        dataset = EpaCemsDataset(path, memory_limit="256MB", threads=1)
+        actual = dataset.distinct(["plant_id_eia", "year", "emissions_unit_id_epa"])
+        expected = pd.DataFrame(
+            {
+                "plant_id_eia": [1, 1, 2, 2, 3],
+                "year": [2020, 2020, 2020, 2021, 2021],
+                "emissions_unit_id_epa": ["A", "B", "A", "A", "C"],
+            }
+        )
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+        assert actual.year.dtype == "int32"
+
+        actual = dataset.distinct(["plant_id_eia"], years=[2021], states=["tx"])
+        assert actual.plant_id_eia.tolist() == [2, 3]
+        assert dataset.distinct(["plant_id_eia"], states=[]).empty
+
+
+def test_epacems_dataset_aggregate(epacems_paths):
+    """Aggregates are computed by group, with filters pushed down."""
+    for path in epacems_paths:
+        actual = EpaCemsDataset(path).aggregate(
+            ["plant_id_eia"],
+            {"gross_load_mw": "sum(gross_load_mw)", "records": "count(*)"},
+            years=[2020],
+        )
+        expected = pd.DataFrame(
+            {
+                "plant_id_eia": [1, 2],
+                "gross_load_mw": [6.0, 4.0],
+                "records": [3, 1],
+            }
+        )
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
@@ -0,0 +1,89 @@
+"""Unit tests for the pudl.parquet_helpers module."""
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from pudl.parquet_helpers import splice_row_groups
+
+
+def _table(n_rows: int, seed: int) -> pa.Table:
+    rng = np.random.default_rng(seed)
+    return pa.table(
+        {
+            "id": rng.integers(0, 100, n_rows),
+            "state": pa.array(
+                rng.choice(["CO", "TX", None], n_rows), pa.string()
+            ).dictionary_encode(),
+            "value": rng.random(n_rows).astype("float32"),
+            "time": pa.array(rng.integers(0, 10**12, n_rows)).cast(pa.timestamp("ms")),
+        }
+    )
+
+
+@pytest.fixture
+def parquet_files(tmp_path):
+    """Two files with several row groups each, including an empty one."""
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"source{i}.parquet"
+        with pq.ParquetWriter(
+            path, _table(0, 0).schema, compression="snappy", version="2.6"
+        ) as writer:
+            for n_rows in [1000, 0, 3000, 20]:
+                writer.write_table(_table(n_rows, seed=10 * i + n_rows))
+        paths.append(path)
+    return paths
+
+
+def test_splice_row_groups(parquet_files, tmp_path):
+    """Spliced files hold the chosen row groups, in order."""
+    first, second = (pq.ParquetFile(path) for path in parquet_files)
+    splice_row_groups(
+        [
+            (parquet_files[0], [0, 2]),
+            (parquet_files[1], [1, 3]),
+            (parquet_files[0], [3]),
+        ],
+        tmp_path / "spliced.parquet",
+    )
+    spliced = pq.ParquetFile(tmp_path / "spliced.parquet")
+    assert spliced.metadata.num_row_groups == 5
+    assert spliced.metadata.num_rows == 1000 + 3000 + 0 + 20 + 20
+    expected = [
+        first.read_row_group(0),
+        first.read_row_group(2),
+        second.read_row_group(1),
+        second.read_row_group(3),
+        first.read_row_group(3),
+    ]
+    for i, table in enumerate(expected):
+        assert spliced.read_row_group(i).equals(table)
+    assert spliced.read().equals(pa.concat_tables(expected))
+    # Statistics are copied along with the row groups, so filters still work.
+    filtered = pq.read_table(tmp_path / "spliced.parquet", filters=[("id", "<", 10)])
+    assert filtered.num_rows == sum((t["id"].to_numpy() < 10).sum() for t in expected)
+
+
+def test_splice_all_row_groups_is_identical(parquet_files, tmp_path):
+    """Copying every row group of a file reproduces it byte for byte."""
+    splice_row_groups([(parquet_files[0], [0, 1, 2, 3])], tmp_path / "copy.parquet")
+    assert (tmp_path / "copy.parquet").read_bytes() == parquet_files[0].read_bytes()
+
+
+def test_splice_row_groups_schema_mismatch(parquet_files, tmp_path):
+    """Row groups can only be combined from files with the same schema."""
+    other = tmp_path / "other.parquet"
+    pq.write_table(_table(10, 0).drop_columns("time"), other)
+    with pytest.raises(ValueError, match="schema"):
+        splice_row_groups(
+            [(parquet_files[0], [0]), (other, [0])], tmp_path / "spliced.parquet"
+        )
+
+
+def test_splice_row_groups_without_sources(tmp_path):
+    """The schema of the new file comes from the sources, so there must be some."""
+    with pytest.raises(ValueError, match="source"):
+        splice_row_groups([], tmp_path / "spliced.parquet")
+    assert not (tmp_path / "spliced.parquet").exists()
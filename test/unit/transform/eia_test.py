@@ -0,0 +1,135 @@
+"""Tests for transformations shared by the EIA forms."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pudl.transform.eia
+from pudl.workspace.frame_cache import DataFrameCache
+
+LOCATIONS = pd.DataFrame(
+    {
+        "longitude": [-122.42, -87.63, np.nan, -122.42, -74.01, 200.0, -104.99],
+        "latitude": [37.77, 41.88, np.nan, 37.77, 40.71, 10.0, 39.74],
+        "state": ["CA", "IL", "NY", "CA", "NY", "HI", pd.NA],
+    }
+)
+
+
+def test_find_timezones_matches_find_timezone():
+    """Batched timezones match looking up each location on its own."""
+    timezones = pudl.transform.eia.find_timezones(
+        LOCATIONS["longitude"], LOCATIONS["latitude"], LOCATIONS["state"], strict=False
+    )
+    expected = [
+        pudl.transform.eia.find_timezone(
+            lng=row.longitude, lat=row.latitude, state=row.state, strict=False
+        )
+        for row in LOCATIONS.itertuples()
+    ]
+    assert timezones.tolist() == expected
+    assert expected[:3] == [
+        "America/Los_Angeles",
+        "America/Chicago",
+        "America/New_York",
+    ]
+
+
+def test_find_timezones_strict():
+    """Strict lookups raise errors for invalid locations."""
+    with pytest.raises(ValueError, match="Can't find timezone"):
+        pudl.transform.eia.find_timezones(LOCATIONS["longitude"], LOCATIONS["latitude"])
+
+
+def test_find_timezones_reads_cached_locations(tmp_path, mocker):
+    """Only locations that aren't in the cache are looked up."""
+    cache = DataFrameCache(tmp_path)
+    lookup = mocker.spy(pudl.transform.eia, "_timezones_at")
+    timezones = pudl.transform.eia.find_timezones(
+        LOCATIONS["longitude"], LOCATIONS["latitude"], strict=False, cache=cache
+    )
+    # Duplicate and invalid locations aren't looked up
+    assert len(lookup.call_args.args[0]) == 4
+    np.testing.assert_array_equal(
+        pudl.transform.eia.find_timezones(
+            LOCATIONS["longitude"], LOCATIONS["latitude"], strict=False, cache=cache
+        ),
+        timezones,
+    )
+    assert lookup.call_count == 1
+    pudl.transform.eia.find_timezones([-122.42, -157.86], [37.77, 21.31], cache=cache)
+    assert lookup.call_args.args[0].tolist() == [[-157.86, 21.31]]
+
+
+def simulate_entity_records(n: int = 2000, seed: int = 0) -> pd.DataFrame:
+    """Records of plants reporting a few inconsistent values across years."""
+    rng = np.random.default_rng(seed)
+    names = np.array(["a", "b", "c", "nan"], dtype=object)
+    records = pd.DataFrame(
+        {
+            "plant_id_eia": rng.integers(0, 100, n),
+            "report_date": pd.to_datetime(
+                {"year": rng.integers(2018, 2022, n), "month": 1, "day": 1}
+            ),
+            "plant_name_eia": names[rng.integers(0, 4, n)],
+            "capacity_mw": rng.integers(0, 3, n).astype(float),
+            "operational_status": np.where(rng.random(n) < 0.9, "existing", "retired"),
+        }
+    ).astype(
+        {
+            "plant_id_eia": "Int64",
+            "plant_name_eia": "string",
+            "operational_status": "string",
+        }
+    )
+    # Null values, including whole columns for some plants
+    records.loc[rng.random(n) < 0.2, "capacity_mw"] = np.nan
+    records.loc[records.plant_id_eia < 5, "plant_name_eia"] = pd.NA
+    records.loc[rng.random(n) < 0.01, "report_date"] = pd.NaT
+    return records
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [["plant_id_eia"], ["plant_id_eia", "report_date"]],
+    ids=["static", "annual"],
+)
+@pytest.mark.parametrize(
+    "strictness",
+    [
+        {"plant_name_eia": 0, "capacity_mw": 0.5, "operational_status": 0.7},
+        {"plant_name_eia": 0, "capacity_mw": 0, "operational_status": 0},
+    ],
+    ids=["mixed", "all_ties"],
+)
+def test_harvest_consistent_values_matches_occurrence_consistency(keys, strictness):
+    """Harvesting all columns at once matches harvesting each column on its own.
+
+    With a strictness of 0 every value is consistent, and many groups have equally
+    consistent values, which must be picked exactly as before.
+    """
+    records = simulate_entity_records()
+    harvested, counts = pudl.transform.eia._harvest_consistent_values(
+        records, keys, list(strictness), strictness
+    )
+    groups = records[keys].drop_duplicates().reset_index(drop=True)
+    pd.testing.assert_frame_equal(harvested[keys], groups)
+    ties = 0
+    for col, col_strictness in strictness.items():
+        col_df = pudl.transform.eia.occurrence_consistency(
+            ["plant_id_eia"], records, col, keys, strictness=col_strictness
+        )
+        consistent = col_df[col_df[f"{col}_is_consistent"]]
+        least = consistent.groupby(keys)[f"{col}_consistent_rate"].transform("min")
+        ties += (
+            consistent[consistent[f"{col}_consistent_rate"] == least][keys + [col]]
+            .drop_duplicates()
+            .duplicated(subset=keys)
+            .sum()
+        )
+        consistent = consistent.drop_duplicates(subset=keys)
+        expected = groups.merge(consistent, on=keys, how="left")[col]
+        pd.testing.assert_series_equal(harvested[col], expected)
+        assert counts.loc[col, "total"] == len(col_df.drop_duplicates(subset=keys))
+        assert counts.loc[col, "consistent"] == len(consistent)
+    assert ties > 0
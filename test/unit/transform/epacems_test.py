@@ -1,9 +1,23 @@
 """Unit tests for the pudl.transform.epacems module."""
 
 import pandas as pd
+import pytest
 
 import pudl.transform.epacems as epacems
 
+PLANTS_TEST_DF = pd.DataFrame(
+    {
+        "plant_id_eia": [3, 10, 58697, 1111, 7],
+        "timezone": [
+            "America/Chicago",
+            "America/New_York",
+            "America/Denver",
+            "America/Phoenix",
+            None,
+        ],
+    }
+)
+
 
 def test_harmonize_eia_epa_orispl():
     """Make sure that incorrect EPA ORISPL codes are fixed."""
@@ -36,5 +50,109 @@ def test_harmonize_eia_epa_orispl():
             "plant_id_eia": [58697, 3, 10, 1111],
         }
     )
-    actual_df = epacems.harmonize_eia_epa_orispl(cems_test_df, crosswalk_test_df)
+    lookups = epacems.EpaCemsLookups.from_frames(crosswalk_test_df, PLANTS_TEST_DF)
+    actual_df = epacems.harmonize_eia_epa_orispl(cems_test_df, lookups)
     pd.testing.assert_frame_equal(expected_df, actual_df, check_dtype=False)
+
+
+def test_lookups_reject_ambiguous_crosswalk():
+    """EPA units mapped to more than one EIA plant can't be harmonized."""
+    crosswalk_test_df = pd.DataFrame(
+        {
+            "plant_id_epa": [3, 3, 10, 10],
+            "plant_id_eia": [3, 4, 10, 10],
+            "emissions_unit_id_epa": ["1", "1", "2", "2"],
+        }
+    )
+    with pytest.raises(AssertionError):
+        epacems.EpaCemsLookups.from_frames(crosswalk_test_df, PLANTS_TEST_DF)
+
+
+def test_convert_to_utc(tmp_path):
+    """UTC offsets are looked up from memory-mapped lookups without DST."""
+    crosswalk_test_df = pd.DataFrame(
+        {"plant_id_epa": [3], "plant_id_eia": [3], "emissions_unit_id_epa": ["1"]}
+    )
+    epacems.EpaCemsLookups.from_frames(crosswalk_test_df, PLANTS_TEST_DF).write(
+        tmp_path
+    )
+    lookups = epacems.EpaCemsLookups.read(tmp_path)
+    cems_test_df = pd.DataFrame(
+        {
+            "plant_id_eia": [3, 10, 1111],
+            "op_date": ["2020-07-01", "2020-07-01", "2020-01-31"],
+            "op_hour": [0, 5, 23],
+        }
+    )
+    actual_df = epacems.convert_to_utc(cems_test_df, lookups)
+    expected = pd.to_datetime(
+        ["2020-07-01 06:00", "2020-07-01 10:00", "2020-02-01 06:00"]
+    )
+    assert list(actual_df.columns) == ["plant_id_eia", "operating_datetime_utc"]
+    assert (actual_df.operating_datetime_utc == expected).all()
+
+    with pytest.raises(ValueError, match="7"):
+        epacems.convert_to_utc(cems_test_df.assign(plant_id_eia=7), lookups)
+
+
+def test_rollups():
+    """Rollups of partial rollups match rollups of the hourly records."""
+    crosswalk_test_df = pd.DataFrame(
+        {"plant_id_epa": [3], "plant_id_eia": [3], "emissions_unit_id_epa": ["1"]}
+    )
+    lookups = epacems.EpaCemsLookups.from_frames(crosswalk_test_df, PLANTS_TEST_DF)
+    hourly = pd.DataFrame(
+        {
+            "plant_id_eia": [3, 3, 3, 3, 10],
+            "plant_id_epa": [3, 3, 3, 3, 10],
+            "emissions_unit_id_epa": ["1", "1", "2", "1", "2"],
+            # Plant 3 is in Chicago, where 05:00 UTC is 23:00 of the previous day.
+            "operating_datetime_utc": pd.to_datetime(
+                [
+                    "2020-01-31 05:00",
+                    "2020-02-01 05:00",
+                    "2020-01-31 06:00",
+                    "2020-01-31 06:00",
+                    "2020-01-31 06:00",
+                ]
+            ),
+            "operating_time_hours": [1.0, 0.5, 0.0, 0.25, 1.0],
+            "gross_load_mw": [100.0, 80.0, 0.0, 40.0, 10.0],
+            "heat_content_mmbtu": [10.0, 8.0, None, 2.0, 1.0],
+            "steam_load_1000_lbs": [None] * 5,
+            "so2_mass_lbs": [1.0, 1.0, None, 1.0, 1.0],
+            "nox_mass_lbs": [1.0, 1.0, None, 1.0, 1.0],
+            "co2_mass_tons": [1.0, 1.0, None, 1.0, 1.0],
+        }
+    )
+    unit_days = epacems.rollup_unit_days(hourly, lookups)
+    assert unit_days.report_date.tolist() == list(
+        pd.to_datetime(["2020-01-30", "2020-01-31", "2020-01-31", "2020-01-31"])
+    )
+    assert unit_days.operating_hour_count.tolist() == [1, 2, 0, 1]
+    assert unit_days.gross_generation_mwh.tolist() == [100.0, 50.0, 0.0, 10.0]
+    assert unit_days.heat_content_mmbtu.isna().tolist() == [False, False, True, False]
+    assert unit_days.steam_load_1000_lbs.isna().all()
+
+    # Combining the rollups of separate batches is the same as rolling up all records.
+    batches = pd.concat(
+        [
+            epacems.rollup_unit_days(hourly.iloc[:2], lookups),
+            epacems.rollup_unit_days(hourly.iloc[2:], lookups),
+        ]
+    )
+    pd.testing.assert_frame_equal(
+        epacems.sum_emissions(
+            batches, [*epacems.ROLLUP_UNIT_KEYS, "report_date"]
+        ).astype(unit_days.dtypes.to_dict()),
+        unit_days,
+    )
+
+    plant_months = epacems.rollup_emissions(unit_days, "M", epacems.ROLLUP_PLANT_KEYS)
+    assert plant_months.plant_id_eia.tolist() == [3, 10]
+    assert plant_months.report_date.tolist() == list(
+        pd.to_datetime(["2020-01-01", "2020-01-01"])
+    )
+    assert plant_months.operating_hour_count.tolist() == [3, 1]
+    assert plant_months.gross_generation_mwh.tolist() == [150.0, 10.0]
+    assert plant_months.heat_content_mmbtu.tolist() == [20.0, 1.0]
@@ -1,10 +1,13 @@
 """Unit tests for Datastore module."""
 
+import hashlib
 import io
 import json
 import re
+import threading
 import unittest
 import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 
 import pytest
@@ -415,4 +418,189 @@ def test_get_zipfile_resources_eventual_success(mocker):
                 assert test_file.read().decode(encoding="utf-8") == file_contents
 
 
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+    """Serves the server's files, honoring byte ranges and simulated interruptions."""
+
+    def do_GET(self):  # noqa: N802
+        content = self.server.files[self.path.lstrip("/")]
+        self.server.requests.append((self.path, self.headers.get("Range")))
+        start = 0
+        if range_header := self.headers.get("Range"):
+            start = int(re.fullmatch(r"bytes=(\d+)-", range_header).group(1))
+            if start >= len(content):
+                self.send_response(416)
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+        else:
+            self.send_response(200)
+        body = content[start:]
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.server.interruptions:
+            # Drop the connection halfway through the response body.
+            self.server.interruptions -= 1
+            body = body[: len(body) // 2]
+            self.close_connection = True
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def http_server():
+    """A local stand-in for zenodo that supports HTTP range requests."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeRequestHandler)
+    server.files = {}
+    server.requests = []
+    server.interruptions = 0
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _serve_resources(
+    server, files: dict[str, bytes]
+) -> datastore.DatapackageDescriptor:
+    """Serve files from the local server and return an epacems descriptor for them."""
+    server.files.update(files)
+    return datastore.DatapackageDescriptor(
+        {
+            "resources": [
+                {
+                    "name": name,
+                    "path": f"{server.url}/{name}",
+                    "hash": hashlib.md5(content).hexdigest(),  # noqa: S324
+                    "parts": {"year": i},
+                }
+                for i, (name, content) in enumerate(files.items())
+            ]
+        },
+        dataset="epacems",
+        doi=datastore.ZenodoDoiSettings().epacems,
+    )
+
+
+def test_download_resource_resumes_partial_file(http_server, tmp_path):
+    """A leftover .part file is completed with a range request."""
+    content = bytes(range(256)) * 1000
+    desc = _serve_resources(http_server, {"first": content})
+    fetcher = MockableZenodoFetcher(descriptors={desc.doi: desc})
+    res = PudlResourceKey("epacems", desc.doi, "first")
+    path = tmp_path / "first"
+    path.with_name("first.part").write_bytes(content[:1000])
+
+    assert fetcher.download_resource(res, path) == path
+    assert path.read_bytes() == content
+    assert not path.with_name("first.part").exists()
+    assert http_server.requests == [("/first", "bytes=1000-")]
+
+
+def test_download_resource_resumes_after_interruption(
+    http_server, tmp_path, monkeypatch
+):
+    """A dropped connection is resumed after the last chunk that was received."""
+    monkeypatch.setattr(datastore, "DOWNLOAD_CHUNK_SIZE", 1000)
+    content = bytes(range(256)) * 1000
+    desc = _serve_resources(http_server, {"first": content})
+    http_server.interruptions = 1
+    fetcher = MockableZenodoFetcher(descriptors={desc.doi: desc})
+    res = PudlResourceKey("epacems", desc.doi, "first")
+    path = tmp_path / "first"
+
+    fetcher.download_resource(res, path)
+    assert path.read_bytes() == content
+    assert http_server.requests == [
+        ("/first", None),
+        ("/first", f"bytes={len(content) // 2 // 1000 * 1000}-"),
+    ]
+
+
+def test_download_resource_with_invalid_checksum(http_server, tmp_path):
+    """Corrupt downloads are discarded rather than added to the cache."""
+    desc = _serve_resources(http_server, {"first": b"blah"})
+    http_server.files["first"] = b"wrongContent"
+    fetcher = MockableZenodoFetcher(descriptors={desc.doi: desc})
+    res = PudlResourceKey("epacems", desc.doi, "first")
+    path = tmp_path / "first"
+
+    with pytest.raises(datastore.ChecksumMismatchError):
+        fetcher.download_resource(res, path)
+    assert not path.exists()
+    assert not path.with_name("first.part").exists()
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_get_resources_downloads_to_local_cache(http_server, tmp_path, max_concurrency):
+    """Resources are downloaded into the local cache, concurrently if allowed."""
+    files = {f"file{i}": f"contents of file {i}".encode() * 1000 for i in range(8)}
+    desc = _serve_resources(http_server, files)
+    ds = datastore.Datastore(local_cache_path=tmp_path, max_concurrency=max_concurrency)
+    ds._zenodo_fetcher = MockableZenodoFetcher(descriptors={desc.doi: desc})
+    ds._datapackage_descriptors[desc.doi] = desc
+
+    assert {res.name: content for res, content in ds.get_resources("epacems")} == files
+    assert len(http_server.requests) == len(files)
+    for name, content in files.items():
+        res = PudlResourceKey("epacems", desc.doi, name)
+        assert (tmp_path / res.get_local_path()).read_bytes() == content
+
+    # Everything is now cached, so nothing else is requested from the server.
+    assert dict(ds.get_resources("epacems", year=3)) == {
+        PudlResourceKey("epacems", desc.doi, "file3"): files["file3"]
+    }
+    assert len(http_server.requests) == len(files)
+
+
+def _make_zipfile_bytes(file_name: str, file_contents: str) -> bytes:
+    """Returns the bytes of a zip archive containing a single file."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as a_zipfile:
+        a_zipfile.writestr(file_name, file_contents)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_get_zipfile_resource_from_local_cache(http_server, tmp_path, mocker, use_mmap):
+    """Cached archives are opened from disk and only checksummed once."""
+    files = {f"file{i}": _make_zipfile_bytes("file_name", f"aaa{i}") for i in range(2)}
+    desc = _serve_resources(http_server, files)
+    ds = datastore.Datastore(local_cache_path=tmp_path)
+    ds._zenodo_fetcher = MockableZenodoFetcher(descriptors={desc.doi: desc})
+    ds._datapackage_descriptors[desc.doi] = desc
+    file_digest = mocker.spy(datastore.hashlib, "file_digest")
+
+    for _ in range(3):
+        zf = ds.get_zipfile_resource("epacems", use_mmap=use_mmap, year=1)
+        assert zf.read("file_name") == b"aaa1"
+    # Downloaded and verified once, then served straight from the cache.
+    assert http_server.requests == [("/file1", None)]
+    assert file_digest.call_count == 0
+
+    # A cached file that was modified gets checksummed again, and is replaced
+    # when it turns out to be corrupt.
+    path = ds._local_cache.resource_path(PudlResourceKey("epacems", desc.doi, "file1"))
+    path.write_bytes(b"garbage")
+    zf = ds.get_zipfile_resource("epacems", use_mmap=use_mmap, year=1)
+    assert zf.read("file_name") == b"aaa1"
+    assert file_digest.call_count == 1
+    assert http_server.requests == [("/file1", None), ("/file1", None)]
+
+    with ds.open_resource("epacems", use_mmap=use_mmap, year=0) as f:
+        assert f.read() == files["file0"]
+    zipfiles = dict(ds.get_zipfile_resources("epacems"))
+    assert {res.name: zf.read("file_name") for res, zf in zipfiles.items()} == {
+        "file0": b"aaa0",
+        "file1": b"aaa1",
+    }
+    assert len(http_server.requests) == 3
+
+
 # TODO(rousik): add unit tests for Datasource class as well
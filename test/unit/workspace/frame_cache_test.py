@@ -0,0 +1,99 @@
+"""Unit tests for the frame_cache module."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.workspace.frame_cache import DataFrameCache
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    """A dataframe with a variety of column types."""
+    return pd.DataFrame(
+        {
+            "plant_id": pd.array([1, None, 3], dtype="Int64"),
+            "name": ["a", None, "c"],
+            "capacity": [1.5, None, 3.0],
+            "report_date": pd.to_datetime(["2020-01-01", None, "2022-01-01"]),
+            "county": pd.array(["x", None, "z"], dtype="string"),
+        }
+    )
+
+
+def test_round_trip(tmp_path, df):
+    """Cached dataframes come back unchanged, and only under the same key."""
+    cache = DataFrameCache(tmp_path)
+    key = {"doi": "10.5281/zenodo.123", "filename": "a.xlsx", "sheet_name": 0}
+    assert cache.get(key) is None
+    assert cache.add(key, df)
+    pd.testing.assert_frame_equal(cache.get(key), df)
+    assert cache.get(key | {"sheet_name": 1}) is None
+    # A different instance pointed at the same directory shares the entries.
+    pd.testing.assert_frame_equal(DataFrameCache(tmp_path).get(key), df)
+
+
+def test_object_column_nulls_round_trip(tmp_path):
+    """NaN and NA in object columns aren't read back as None."""
+    cache = DataFrameCache(tmp_path)
+    df = pd.DataFrame(
+        {
+            "status": ["OP", np.nan, "RE"],
+            "code": ["a", pd.NA, "b"],
+            "name": ["x", None, "z"],
+            "empty": [np.nan] * 3,
+        },
+        dtype=object,
+    )
+    assert cache.add({"key": 1}, df)
+    cached = cache.get({"key": 1})
+    pd.testing.assert_frame_equal(cached, df)
+    assert cached.status[1] is np.nan
+    assert cached.code[1] is pd.NA
+    assert cached.name[1] is None
+    # Strings of the values are the same as those of a freshly parsed page
+    assert cached.status.astype(str).tolist() == ["OP", "nan", "RE"]
+
+
+@pytest.mark.parametrize(
+    "uncacheable",
+    [
+        pd.DataFrame({"a": [1, "x"]}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({"a": [1], 2019: [2]}),
+        pd.DataFrame({"a": ["x", None, np.nan]}, dtype=object),
+    ],
+    ids=[
+        "mixed_object_column",
+        "duplicate_columns",
+        "non_string_columns",
+        "mixed_object_nulls",
+    ],
+)
+def test_uncacheable_dataframes_are_skipped(tmp_path, uncacheable):
+    """Dataframes that can't round trip through Arrow aren't cached."""
+    cache = DataFrameCache(tmp_path)
+    assert not cache.add({"key": 1}, uncacheable)
+    assert cache.get({"key": 1}) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, df):
+    """Once the size limit is exceeded, the least recently used entries are removed."""
+    cache = DataFrameCache(tmp_path)
+    cache.add({"key": 0}, df)
+    entry_size = next(tmp_path.iterdir()).stat().st_size
+    cache.max_bytes = 2 * entry_size
+
+    cache.add({"key": 1}, df)
+    # Make sure the modification times differ, then mark key 0 as recently used.
+    os.utime(cache._path({"key": 1}), ns=(0, 0))
+    assert cache.get({"key": 0}) is not None
+    cache.add({"key": 2}, df)
+
+    assert cache.get({"key": 1}) is None
+    assert cache.get({"key": 0}) is not None
+    assert cache.get({"key": 2}) is not None
+    assert len(list(tmp_path.iterdir())) == 2
@@ -87,6 +87,27 @@ class TestLocalFileCache(unittest.TestCase):
         ro_cache.delete(res)
         self.assertTrue(ro_cache.contains(res))
 
+    def test_digest_is_invalidated_by_changes(self):
+        """Recorded digests are dropped when the resource is replaced or modified."""
+        res = PudlResourceKey("a", "b", "c")
+        self.cache.add(res, b"sample")
+        self.assertIsNone(self.cache.get_digest(res))
+        self.cache.set_digest(res, "abc123")
+        self.assertEqual("abc123", self.cache.get_digest(res))
+
+        self.cache.add(res, b"sampleContents")
+        self.assertIsNone(self.cache.get_digest(res))
+
+        self.cache.set_digest(res, "abc123")
+        with self.cache.resource_path(res).open("ab") as f:
+            f.write(b"more")
+        self.assertIsNone(self.cache.get_digest(res))
+
+        self.cache.set_digest(res, "abc123")
+        self.cache.delete(res)
+        self.assertIsNone(self.cache.get_digest(res))
+        self.assertEqual([], list(self.cache.resource_path(res).parent.iterdir()))
+
 
 class TestLayeredCache(unittest.TestCase):
     """Unit tests for LayeredCache class."""